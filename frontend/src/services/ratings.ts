@@ -20,13 +20,31 @@ export interface RatingStats {
   user_id?: string
   average_rating_as_provider?: number
   rating_count_as_provider?: number
+  rating_histogram_as_provider?: Record<string, number>
+  recent_rating_count_as_provider?: number
   average_rating_as_client?: number
   rating_count_as_client?: number
+  rating_histogram_as_client?: Record<string, number>
+  recent_rating_count_as_client?: number
   total_ratings?: number
   /** Combined average for display (computed from backend fields if needed) */
   average_rating?: number
 }
 
+export interface LeaderboardEntry {
+  rank: number
+  provider_profile_id: string
+  user_id: string
+  full_name: string
+  avatar: string | null
+  location?: string
+  hourly_rate?: string | null
+  availability_status?: string
+  average_rating: string
+  bayesian_rating: string
+  total_jobs_completed: number
+}
+
 export const ratingsService = {
   list(params?: { contract?: string; rater?: string; rating_type?: RatingType }): Promise<AxiosResponse<Rating[]>> {
     return api.get('/ratings/', { params })
@@ -44,6 +62,14 @@ export const ratingsService = {
     const url = userId ? `/ratings/stats/${userId}/` : '/ratings/stats/'
     return api.get(url)
   },
+  /** Stats for up to 100 users in one request (unknown ids are omitted). */
+  getBatchStats(userIds: string[]): Promise<AxiosResponse<{ results: RatingStats[] }>> {
+    return api.get('/ratings/stats/batch/', { params: { user_ids: userIds.join(',') } })
+  },
+  /** Top providers for a skill tag, best reputation first. */
+  getLeaderboard(skill: string, params?: { page?: number; page_size?: number }): Promise<AxiosResponse<{ count: number; next: string | null; previous: string | null; results: LeaderboardEntry[] }>> {
+    return api.get('/ratings/leaderboard/', { params: { skill, ...params } })
+  },
   getProviderRatings(userId: string): Promise<AxiosResponse<{ results?: Rating[] } | Rating[]>> {
     return api.get(`/ratings/providers/${userId}/`)
   },
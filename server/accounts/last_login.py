@@ -0,0 +1,72 @@
+"""
+Buffered User.last_login updates.
+
+Token logins record the login time in a Redis hash (user id -> epoch
+seconds; a later login simply overwrites) instead of saving the user row, so
+the login path does no write and fires no post_save. accounts.tasks
+.flush_last_logins copies the buffer to the database in bulk every minute;
+last_login therefore lags by up to one flush interval.
+Without Redis, or if Redis errors, the user row is updated directly as before.
+"""
+from datetime import datetime, timezone as dt_timezone
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import update_last_login
+from django.utils import timezone
+from redis import RedisError
+from redis.exceptions import ResponseError
+from skillspot.redis_client import get_redis, redis_key
+
+User = get_user_model()
+
+FLUSH_CHUNK_SIZE = 500
+
+
+def _buffer_key():
+    return redis_key('last_login', 'pending')
+
+
+def _flushing_key():
+    return redis_key('last_login', 'flushing')
+
+
+def record_login(user):
+    """Note that user just logged in."""
+    client = get_redis()
+    if client is None:
+        update_last_login(None, user)
+        return
+    now = timezone.now()
+    try:
+        client.hset(_buffer_key(), str(user.pk), now.timestamp())
+    except RedisError:
+        update_last_login(None, user)
+        return
+    user.last_login = now
+
+
+def flush_last_logins(chunk_size=FLUSH_CHUNK_SIZE):
+    """Write buffered login times to User.last_login. Returns the number of users updated."""
+    client = get_redis()
+    if client is None:
+        return 0
+    # Move the buffer aside so logins during the flush go to a fresh hash. A
+    # 'flushing' hash left by a failed run is retried before taking a new one.
+    if not client.exists(_flushing_key()):
+        try:
+            client.rename(_buffer_key(), _flushing_key())
+        except ResponseError:
+            # Nothing buffered yet, or a concurrent flush already took it.
+            return 0
+
+    updated = 0
+    batch = []
+    for user_id, timestamp in client.hscan_iter(_flushing_key(), count=chunk_size):
+        last_login = datetime.fromtimestamp(float(timestamp), tz=dt_timezone.utc)
+        batch.append(User(pk=user_id, last_login=last_login))
+        if len(batch) >= chunk_size:
+            updated += User.objects.bulk_update(batch, ['last_login'])
+            batch = []
+    if batch:
+        updated += User.objects.bulk_update(batch, ['last_login'])
+    client.delete(_flushing_key())
+    return updated
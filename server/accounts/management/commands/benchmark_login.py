@@ -0,0 +1,63 @@
+import statistics
+import time
+import uuid
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIRequestFactory
+from accounts.views import CustomTokenObtainPairView
+
+User = get_user_model()
+
+FAST_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure CustomTokenObtainPairView throughput in-process with a throwaway user '
+        '(created and rolled back). --fast-hasher takes password hashing out of the numbers.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200)
+        parser.add_argument('--fast-hasher', action='store_true')
+
+    def handle(self, *args, **options):
+        if options['fast_hasher']:
+            with override_settings(PASSWORD_HASHERS=FAST_HASHERS):
+                self._run(options['requests'])
+        else:
+            self._run(options['requests'])
+
+    def _run(self, count):
+        view = CustomTokenObtainPairView.as_view()
+        factory = APIRequestFactory()
+        password = uuid.uuid4().hex
+        with transaction.atomic():
+            user = User.objects.create_user(
+                f'benchmark-{uuid.uuid4().hex}@example.com', password, user_type='PROVIDER'
+            )
+            body = {'email': user.email, 'password': password}
+
+            def login():
+                response = view(factory.post('/api/v1/auth/login/', body, format='json'))
+                if response.status_code != 200:
+                    raise RuntimeError(f'Login failed with {response.status_code}: {response.data}')
+
+            with CaptureQueriesContext(connection) as queries:
+                login()
+            timings = []
+            for _ in range(count):
+                start = time.perf_counter()
+                login()
+                timings.append(time.perf_counter() - start)
+            transaction.set_rollback(True)
+
+        timings.sort()
+        self.stdout.write(self.style.SUCCESS(
+            f'{count} logins: {count / sum(timings):.1f} logins/s, '
+            f'mean {statistics.mean(timings) * 1000:.2f} ms, '
+            f'p95 {timings[int(len(timings) * 0.95) - 1] * 1000:.2f} ms, '
+            f'{len(queries.captured_queries)} queries per login'
+        ))
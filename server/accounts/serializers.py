@@ -2,6 +2,7 @@ from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from .last_login import record_login
 
 User = get_user_model()
 
@@ -55,7 +56,10 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         return token
 
     def validate(self, attrs):
+        # SIMPLE_JWT['UPDATE_LAST_LOGIN'] is off: the login time is buffered instead
+        # of saving the user row on every token obtain.
         data = super().validate(attrs)
+        record_login(self.user)
         data['user'] = {
             'id': str(self.user.id),
             'email': self.user.email,
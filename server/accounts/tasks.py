@@ -0,0 +1,8 @@
+from celery import shared_task
+from .last_login import FLUSH_CHUNK_SIZE, flush_last_logins as _flush_last_logins
+
+
+@shared_task(ignore_result=True)
+def flush_last_logins(chunk_size=FLUSH_CHUNK_SIZE):
+    """Persist last_login times buffered by token logins (see accounts.last_login)."""
+    return _flush_last_logins(chunk_size=chunk_size)
@@ -4,6 +4,7 @@ from django.db.models import Sum
 from django.utils import timezone
 from .models import Contract, ContractMilestone, ContractSignature, TimeEntry
 from jobs.models import Job, JobApplication
+from skillspot.fieldsets import SparseFieldsetSerializerMixin
 
 User = get_user_model()
 
@@ -95,7 +96,7 @@ class TimeEntryApproveSerializer(serializers.Serializer):
     status = serializers.ChoiceField(choices=['APPROVED', 'REJECTED'])
 
 
-class ContractSerializer(serializers.ModelSerializer):
+class ContractSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     client_email = serializers.EmailField(source='client.email', read_only=True)
     client_name = serializers.SerializerMethodField()
     provider_email = serializers.EmailField(source='provider.email', read_only=True)
@@ -122,6 +123,22 @@ class ContractSerializer(serializers.ModelSerializer):
             'id', 'client', 'provider', 'signed_at', 'completed_at',
             'created_at', 'updated_at'
         )
+        sparse_select_related = {
+            'job_title': ('job',),
+            'client_email': ('client',),
+            'client_name': ('client__profile',),
+            'provider_email': ('provider',),
+            'provider_name': ('provider__profile',),
+        }
+        sparse_prefetch_related = {
+            'milestones': ('milestones',),
+            'time_entries': ('time_entries',),
+            'signatures': ('signatures__signer__profile',),
+            'is_fully_signed': ('signatures',),
+        }
+        sparse_field_dependencies = {
+            'completion_percentage': ('payment_schedule', 'total_amount', 'hourly_rate'),
+        }
 
     def get_client_name(self, obj):
         if hasattr(obj.client, 'profile') and obj.client.profile:
@@ -134,7 +151,9 @@ class ContractSerializer(serializers.ModelSerializer):
         return obj.provider.email
 
     def get_is_fully_signed(self, obj):
-        return obj.is_fully_signed()
+        # Same check as Contract.is_fully_signed(), over the prefetched signatures.
+        signed = {signature.signer_id for signature in obj.signatures.all() if signature.is_signed}
+        return obj.client_id in signed and obj.provider_id in signed
 
     def get_completion_percentage(self, obj):
         from decimal import Decimal
@@ -1,3 +1,38 @@
-from django.test import TestCase
+from datetime import date
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from accounts.models import User
+from .models import Contract, ContractSignature
 
-# Create your tests here.
+
+class ContractListSparseFieldsetTests(APITestCase):
+    def setUp(self):
+        self.client_user = User.objects.create_user('client@example.com', 'pw-123456', user_type='CLIENT')
+        self.provider = User.objects.create_user('provider@example.com', 'pw-123456', user_type='PROVIDER')
+        self.client.force_authenticate(self.client_user)
+
+    def contract(self, signers=()):
+        contract = Contract.objects.create(
+            client=self.client_user, provider=self.provider, title='Kitchen',
+            description='Fix sink', terms='Net 30', total_amount=100, start_date=date(2026, 1, 1),
+        )
+        for signer in signers:
+            ContractSignature.objects.create(contract=contract, signer=signer, is_signed=True)
+        return contract
+
+    def list_signed_flags(self):
+        response = self.client.get('/api/v1/contracts/', {'fields': 'id,is_fully_signed'})
+        self.assertEqual(response.status_code, 200)
+        return {row['id']: row['is_fully_signed'] for row in response.json()['results']}
+
+    def test_is_fully_signed_uses_a_fixed_number_of_queries(self):
+        both = self.contract(signers=(self.client_user, self.provider))
+        with CaptureQueriesContext(connection) as one_row:
+            self.list_signed_flags()
+
+        one = self.contract(signers=(self.client_user,))
+        none = self.contract()
+        with self.assertNumQueries(len(one_row.captured_queries)):
+            flags = self.list_signed_flags()
+        self.assertEqual(flags, {str(both.pk): True, str(one.pk): False, str(none.pk): False})
@@ -5,7 +5,8 @@ from rest_framework.exceptions import ValidationError
 from django.contrib.auth import get_user_model
 from django.db.models import Q
 from django.utils import timezone
-from notifications.tasks import send_in_app_notification
+from notifications.tasks import send_in_app_notification, send_in_app_notifications
+from skillspot.fieldsets import SparseFieldsetViewMixin
 from .models import Contract, ContractMilestone, ContractSignature, TimeEntry
 from .serializers import (
     ContractSerializer,
@@ -22,7 +23,7 @@ from .serializers import (
 User = get_user_model()
 
 
-class ContractListCreateView(generics.ListCreateAPIView):
+class ContractListCreateView(SparseFieldsetViewMixin, generics.ListCreateAPIView):
     serializer_class = ContractSerializer
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
@@ -94,7 +95,7 @@ class ContractListCreateView(generics.ListCreateAPIView):
         )
 
 
-class ContractDetailView(generics.RetrieveUpdateDestroyAPIView):
+class ContractDetailView(SparseFieldsetViewMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = ContractSerializer
     permission_classes = [permissions.IsAuthenticated]
     lookup_field = 'id'
@@ -185,21 +186,23 @@ class ContractSignView(generics.GenericAPIView):
             signature = serializer.save()
             contract.refresh_from_db()
             other = contract.provider if request.user == contract.client else contract.client
-            send_in_app_notification.delay(
-                str(other.id),
-                'Contract signed',
-                f'{request.user.email} signed the contract "{contract.title}".'
-                + (' Contract is now active.' if contract.is_fully_signed() else ' Sign to activate.'),
-                link=f'/contracts/{contract.id}/',
-                actor_id=str(request.user.id),
-            )
-            if contract.is_fully_signed():
-                send_in_app_notification.delay(
-                    str(request.user.id),
-                    'Contract active',
-                    f'Contract "{contract.title}" is now active.',
-                    link=f'/contracts/{contract.id}/',
-                )
+            fully_signed = contract.is_fully_signed()
+            notifications = [{
+                'recipient_id': str(other.id),
+                'title': 'Contract signed',
+                'message': f'{request.user.email} signed the contract "{contract.title}".'
+                + (' Contract is now active.' if fully_signed else ' Sign to activate.'),
+                'link': f'/contracts/{contract.id}/',
+                'actor_id': str(request.user.id),
+            }]
+            if fully_signed:
+                notifications.append({
+                    'recipient_id': str(request.user.id),
+                    'title': 'Contract active',
+                    'message': f'Contract "{contract.title}" is now active.',
+                    'link': f'/contracts/{contract.id}/',
+                })
+            send_in_app_notifications.delay(notifications)
             return Response(
                 ContractSignatureSerializer(signature).data,
                 status=status.HTTP_200_OK
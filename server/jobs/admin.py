@@ -1,9 +1,10 @@
 from django.contrib import admin
+from skillspot.partial_save import PartialSaveModelAdmin
 from .models import Job, JobApplication, JobInvitation
 
 
 @admin.register(Job)
-class JobAdmin(admin.ModelAdmin):
+class JobAdmin(PartialSaveModelAdmin):
     list_display = [
         'title', 'client', 'status', 'location',
         'budget_min', 'budget_max', 'created_at'
@@ -11,7 +12,7 @@ class JobAdmin(admin.ModelAdmin):
     list_filter = ['status', 'created_at']
     search_fields = ['title', 'description', 'location', 'client__email']
     filter_horizontal = ['required_skills']
-    readonly_fields = ['id', 'created_at', 'updated_at', 'closed_at']
+    readonly_fields = ['id', 'created_at', 'updated_at', 'closed_at', *Job.COUNTER_FIELDS]
 
 
 @admin.register(JobApplication)
@@ -0,0 +1,162 @@
+"""
+Bulk job import from NDJSON or CSV.
+
+Rows are read lazily from the request stream (or an uploaded file) and
+processed in batches of IMPORT_BATCH_SIZE: each batch is validated, its
+skill ids are resolved with a single Tag query, and valid rows are inserted
+with one bulk_create for jobs plus one for the required_skills through table.
+bulk_create skips model signals, so search/recommendation indexing and the
+job list cache bump are done here explicitly.
+
+CSV: one column per JobCreateSerializer field; skill_ids are separated by ';'.
+"""
+import csv
+import json
+from django.db import transaction
+from rest_framework import serializers
+from skillspot.cache_utils import bump_job_list_version
+from profiles.models import Tag
+from .models import Job
+from .recommendations import index_job_skills_bulk
+from .search import index_jobs
+from .serializers import JobCreateSerializer
+
+IMPORT_BATCH_SIZE = 200
+MAX_IMPORT_ROWS = 5000
+CSV_LIST_SEPARATOR = ';'
+NDJSON_CONTENT_TYPES = ('application/x-ndjson', 'application/ndjson', 'application/jsonl', 'application/json-seq')
+CSV_CONTENT_TYPES = ('text/csv', 'application/csv')
+
+
+class JobImportRowSerializer(JobCreateSerializer):
+    """JobCreateSerializer with skill ids validated as plain UUIDs; they are resolved per batch."""
+    required_skills = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
+    skill_ids = serializers.ListField(child=serializers.UUIDField(), required=False)
+
+
+def detect_format(content_type, filename=''):
+    """Return 'ndjson' or 'csv' from a content type or file name, else None."""
+    content_type = (content_type or '').split(';')[0].strip().lower()
+    if content_type in NDJSON_CONTENT_TYPES or filename.endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    if content_type in CSV_CONTENT_TYPES or filename.endswith('.csv'):
+        return 'csv'
+    return None
+
+
+def _decoded_lines(stream):
+    first = True
+    for raw in stream:
+        line = raw.decode('utf-8') if isinstance(raw, bytes) else raw
+        if first:
+            line = line.lstrip('\ufeff')
+            first = False
+        yield line
+
+
+def _ndjson_rows(lines):
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError as exc:
+            yield None, {'non_field_errors': [f'Invalid JSON: {exc.msg}.']}
+            continue
+        if not isinstance(data, dict):
+            yield None, {'non_field_errors': ['Each line must be a JSON object.']}
+            continue
+        yield data, None
+
+
+def _csv_rows(lines):
+    for record in csv.DictReader(lines):
+        data = {key: value for key, value in record.items() if key and value not in (None, '')}
+        if 'skill_ids' in data:
+            data['skill_ids'] = [s.strip() for s in data['skill_ids'].split(CSV_LIST_SEPARATOR) if s.strip()]
+        yield data, None
+
+
+def iter_rows(stream, fmt):
+    """Yield (data, parse_errors) per input row without reading the whole stream."""
+    lines = _decoded_lines(stream)
+    return _ndjson_rows(lines) if fmt == 'ndjson' else _csv_rows(lines)
+
+
+def _import_batch(batch, client):
+    """batch is [(row_number, data, parse_errors)]; returns a result dict per row."""
+    results = {}
+    valid = []
+    for row, data, errors in batch:
+        if errors:
+            results[row] = {'row': row, 'status': 'error', 'errors': errors}
+            continue
+        serializer = JobImportRowSerializer(data=data)
+        if serializer.is_valid():
+            valid.append((row, serializer.validated_data))
+        else:
+            results[row] = {'row': row, 'status': 'error', 'errors': serializer.errors}
+
+    requested = {tag_id for _, attrs in valid for tag_id in attrs.get('skill_ids', [])}
+    known = set(
+        Tag.objects.filter(id__in=requested, category=Tag.TagCategory.SKILL).values_list('id', flat=True)
+    ) if requested else set()
+
+    jobs, tag_ids_by_job = [], {}
+    for row, attrs in valid:
+        tag_ids = list(dict.fromkeys(attrs.pop('skill_ids', [])))
+        missing = [str(t) for t in tag_ids if t not in known]
+        if missing:
+            results[row] = {
+                'row': row,
+                'status': 'error',
+                'errors': {'skill_ids': [f'Invalid pk "{pk}" - object does not exist.' for pk in missing]},
+            }
+            continue
+        job = Job(client=client, **attrs)
+        jobs.append((row, job))
+        tag_ids_by_job[job.pk] = tag_ids
+
+    if jobs:
+        through = Job.required_skills.through
+        with transaction.atomic():
+            Job.objects.bulk_create([job for _, job in jobs])
+            through.objects.bulk_create([
+                through(job_id=job.pk, tag_id=tag_id)
+                for _, job in jobs
+                for tag_id in tag_ids_by_job[job.pk]
+            ])
+            index_jobs([job for _, job in jobs])
+            open_tag_ids = {
+                job.pk: tag_ids_by_job[job.pk] for _, job in jobs if job.status == Job.JobStatus.OPEN
+            }
+            transaction.on_commit(lambda: index_job_skills_bulk(open_tag_ids))
+        for row, job in jobs:
+            results[row] = {'row': row, 'status': 'created', 'id': str(job.pk)}
+    return [results[row] for row, _, _ in batch]
+
+
+def import_jobs(stream, fmt, client, batch_size=IMPORT_BATCH_SIZE, max_rows=MAX_IMPORT_ROWS):
+    """Import jobs for client from stream; returns the per-row report."""
+    report = {'total': 0, 'created': 0, 'failed': 0, 'truncated': False, 'results': []}
+    batch = []
+
+    def flush():
+        for result in _import_batch(batch, client):
+            report['created' if result['status'] == 'created' else 'failed'] += 1
+            report['results'].append(result)
+        batch.clear()
+
+    for row, (data, errors) in enumerate(iter_rows(stream, fmt), start=1):
+        if row > max_rows:
+            report['truncated'] = True
+            break
+        batch.append((row, data, errors))
+        report['total'] += 1
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    if report['created']:
+        transaction.on_commit(bump_job_list_version)
+    return report
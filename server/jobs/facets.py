@@ -0,0 +1,77 @@
+"""
+Facet counts for job browse.
+
+All counts are taken over the ids of the filtered queryset, passed as a
+subquery, so the result costs three queries whatever the filters:
+one conditional aggregate (total, status, remote, budget buckets), one
+GROUP BY over the required_skills through table and one GROUP BY location.
+"""
+from django.db.models import Count, Q
+from django.db.models.functions import Coalesce
+from .models import Job
+
+# (key, lower bound inclusive, upper bound exclusive) on budget_max, else budget_min
+BUDGET_BUCKETS = (
+    ('under_100', None, 100),
+    ('100_500', 100, 500),
+    ('500_1000', 500, 1000),
+    ('1000_5000', 1000, 5000),
+    ('5000_plus', 5000, None),
+)
+TOP_SKILLS = 20
+TOP_LOCATIONS = 10
+
+
+def _bucket_q(low, high):
+    q = Q()
+    if low is not None:
+        q &= Q(facet_budget__gte=low)
+    if high is not None:
+        q &= Q(facet_budget__lt=high)
+    return q
+
+
+def compute_job_facets(queryset):
+    job_ids = queryset.order_by().values('id')
+    jobs = Job.objects.filter(id__in=job_ids)
+
+    aggregates = {
+        'total': Count('id'),
+        'remote': Count('id', filter=Q(is_remote=True)),
+        'on_site': Count('id', filter=Q(is_remote=False)),
+        'budget_none': Count('id', filter=Q(facet_budget__isnull=True)),
+    }
+    for value, _ in Job.JobStatus.choices:
+        aggregates[f'status_{value}'] = Count('id', filter=Q(status=value))
+    for key, low, high in BUDGET_BUCKETS:
+        aggregates[f'budget_{key}'] = Count('id', filter=_bucket_q(low, high))
+    counts = jobs.annotate(facet_budget=Coalesce('budget_max', 'budget_min')).aggregate(**aggregates)
+
+    through = Job.required_skills.through
+    skills = (
+        through.objects.filter(job_id__in=job_ids)
+        .values('tag_id', 'tag__name')
+        .annotate(count=Count('job_id', distinct=True))
+        .order_by('-count', 'tag__name')[:TOP_SKILLS]
+    )
+    locations = (
+        jobs.exclude(location='')
+        .values('location')
+        .annotate(count=Count('id'))
+        .order_by('-count', 'location')[:TOP_LOCATIONS]
+    )
+
+    return {
+        'total': counts['total'],
+        'status': {value: counts[f'status_{value}'] for value, _ in Job.JobStatus.choices},
+        'is_remote': {'true': counts['remote'], 'false': counts['on_site']},
+        'budget': [
+            {'key': key, 'min': low, 'max': high, 'count': counts[f'budget_{key}']}
+            for key, low, high in BUDGET_BUCKETS
+        ] + [{'key': 'none', 'min': None, 'max': None, 'count': counts['budget_none']}],
+        'skills': [
+            {'id': str(row['tag_id']), 'name': row['tag__name'], 'count': row['count']}
+            for row in skills
+        ],
+        'locations': [{'location': row['location'], 'count': row['count']} for row in locations],
+    }
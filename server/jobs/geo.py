@@ -0,0 +1,102 @@
+"""
+"Jobs near me" radius filtering on Job.latitude / Job.longitude.
+
+An indexed bounding box (latitude, longitude) narrows the candidates first;
+the haversine distance is then computed in the database for the survivors only.
+"""
+import math
+from django.db.models import F, FloatField
+from django.db.models.functions import ASin, Cast, Cos, Power, Radians, Sin, Sqrt
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.045
+DEFAULT_RADIUS_KM = 25.0
+MAX_RADIUS_KM = 500.0
+
+
+def parse_near(value):
+    """Parse 'lat,lng' into floats, raising ValidationError on bad input."""
+    try:
+        lat_str, lng_str = value.split(',')
+        lat, lng = float(lat_str), float(lng_str)
+    except (AttributeError, TypeError, ValueError):
+        raise ValidationError({'near': 'Use near=<latitude>,<longitude>.'})
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        raise ValidationError({'near': 'Latitude must be within ±90 and longitude within ±180.'})
+    return lat, lng
+
+
+def parse_radius_km(value):
+    if value in (None, ''):
+        return DEFAULT_RADIUS_KM
+    try:
+        radius = float(value)
+    except (TypeError, ValueError):
+        raise ValidationError({'radius_km': 'radius_km must be a number.'})
+    if radius <= 0:
+        raise ValidationError({'radius_km': 'radius_km must be greater than 0.'})
+    return min(radius, MAX_RADIUS_KM)
+
+
+def bounding_box(lat, lng, radius_km):
+    """
+    Return (min_lat, max_lat, min_lng, max_lng) enclosing the radius.
+    Longitude bounds are None when the box would wrap the antimeridian or a pole.
+    """
+    dlat = radius_km / KM_PER_DEGREE_LAT
+    min_lat, max_lat = max(lat - dlat, -90.0), min(lat + dlat, 90.0)
+    cos_lat = math.cos(math.radians(lat))
+    if cos_lat <= 1e-6 or min_lat <= -90.0 or max_lat >= 90.0:
+        return min_lat, max_lat, None, None
+    dlng = radius_km / (KM_PER_DEGREE_LAT * cos_lat)
+    min_lng, max_lng = lng - dlng, lng + dlng
+    if min_lng < -180.0 or max_lng > 180.0:
+        return min_lat, max_lat, None, None
+    return min_lat, max_lat, min_lng, max_lng
+
+
+def haversine_km(lat, lng):
+    """Database expression for the great-circle distance from (lat, lng) to each row."""
+    row_lat = Radians(Cast(F('latitude'), FloatField()))
+    row_lng = Radians(Cast(F('longitude'), FloatField()))
+    origin_lat = math.radians(lat)
+    origin_lng = math.radians(lng)
+    a = (
+        Power(Sin((row_lat - origin_lat) / 2), 2)
+        + math.cos(origin_lat) * Cos(row_lat) * Power(Sin((row_lng - origin_lng) / 2), 2)
+    )
+    return 2 * EARTH_RADIUS_KM * ASin(Sqrt(a))
+
+
+def filter_near(queryset, lat, lng, radius_km):
+    """Restrict queryset to rows within radius_km of (lat, lng) and annotate `distance_km`."""
+    min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius_km)
+    queryset = queryset.filter(latitude__gte=min_lat, latitude__lte=max_lat)
+    if min_lng is not None:
+        queryset = queryset.filter(longitude__gte=min_lng, longitude__lte=max_lng)
+    else:
+        queryset = queryset.filter(longitude__isnull=False)
+    return queryset.annotate(
+        distance_km=haversine_km(lat, lng)
+    ).filter(distance_km__lte=radius_km)
+
+
+class JobNearFilter(BaseFilterBackend):
+    """
+    `?near=lat,lng&radius_km=` proximity filter. `ordering=distance` (or
+    `-distance`) sorts by the computed distance. Must come after OrderingFilter.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        near = request.query_params.get('near')
+        if not near:
+            return queryset
+        lat, lng = parse_near(near)
+        radius_km = parse_radius_km(request.query_params.get('radius_km'))
+        queryset = filter_near(queryset, lat, lng, radius_km)
+        ordering = request.query_params.get('ordering', '')
+        if ordering in ('distance', '-distance'):
+            queryset = queryset.order_by(f'{ordering}_km', '-created_at')
+        return queryset
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from jobs.recommendations import rebuild_job_skill_index
+from skillspot.redis_client import get_redis
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the Redis skill -> open job index used by /api/v1/jobs/recommended/.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if get_redis() is None:
+            self.stdout.write(self.style.WARNING('REDIS_URL is not a Redis URL; nothing to rebuild.'))
+            return
+        total = rebuild_job_skill_index(chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed {total} skill/job pairs.'))
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Q
+from jobs.models import Job, JobApplication
+from skillspot.cache_utils import bump_job_list_version
+
+
+class Command(BaseCommand):
+    help = 'Recompute Job.applications_count / accepted_applications_count in chunks to repair drift.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        checked = repaired = 0
+        last_pk = None
+        while True:
+            jobs = Job.objects.order_by('pk').only(*(('id',) + Job.COUNTER_FIELDS))
+            if last_pk is not None:
+                jobs = jobs.filter(pk__gt=last_pk)
+            jobs = list(jobs[:chunk_size])
+            if not jobs:
+                break
+            last_pk = jobs[-1].pk
+
+            counts = {
+                row['job_id']: row
+                for row in JobApplication.objects.filter(job__in=jobs)
+                .order_by()
+                .values('job_id')
+                .annotate(
+                    total=Count('id'),
+                    accepted=Count('id', filter=Q(status=JobApplication.ApplicationStatus.ACCEPTED)),
+                )
+            }
+            drifted = []
+            for job in jobs:
+                row = counts.get(job.pk, {'total': 0, 'accepted': 0})
+                if (job.applications_count, job.accepted_applications_count) != (row['total'], row['accepted']):
+                    job.applications_count = row['total']
+                    job.accepted_applications_count = row['accepted']
+                    drifted.append(job)
+            if drifted:
+                Job.objects.bulk_update(drifted, Job.COUNTER_FIELDS)
+            checked += len(jobs)
+            repaired += len(drifted)
+
+        if repaired:
+            # bulk_update sends no signals; cached job lists show the counters.
+            bump_job_list_version()
+        self.stdout.write(self.style.SUCCESS(f'Checked {checked} jobs, repaired {repaired}.'))
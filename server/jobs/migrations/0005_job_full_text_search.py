@@ -0,0 +1,58 @@
+# Generated manually: full-text search index for job browse (?q=).
+# Postgres gets a generated tsvector column + GIN index; SQLite gets an FTS5
+# shadow table kept in sync by jobs.signals. See jobs/search.py.
+
+from django.db import migrations
+
+
+POSTGRES_FORWARD = [
+    """
+    ALTER TABLE jobs_job ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(location, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'C')
+    ) STORED
+    """,
+    'CREATE INDEX jobs_job_search_vector_gin ON jobs_job USING gin (search_vector)',
+]
+POSTGRES_REVERSE = [
+    'DROP INDEX IF EXISTS jobs_job_search_vector_gin',
+    'ALTER TABLE jobs_job DROP COLUMN IF EXISTS search_vector',
+]
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE jobs_job_fts USING fts5(
+        job_id UNINDEXED, title, description, location,
+        tokenize = 'porter unicode61'
+    )
+    """,
+    """
+    INSERT INTO jobs_job_fts (job_id, title, description, location)
+    SELECT id, title, description, location FROM jobs_job
+    """,
+]
+SQLITE_REVERSE = [
+    'DROP TABLE IF EXISTS jobs_job_fts',
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        for sql in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_job_latitude_longitude'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({'postgresql': POSTGRES_FORWARD, 'sqlite': SQLITE_FORWARD}),
+            _run({'postgresql': POSTGRES_REVERSE, 'sqlite': SQLITE_REVERSE}),
+        ),
+    ]
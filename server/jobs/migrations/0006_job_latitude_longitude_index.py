@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_job_full_text_search'),
+        ('profiles', '0002_seed_skill_tags'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['latitude', 'longitude'], name='jobs_job_latitud_d115f8_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:11
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Job = apps.get_model('jobs', 'Job')
+    JobApplication = apps.get_model('jobs', 'JobApplication')
+
+    def count(**filters):
+        return Coalesce(
+            Subquery(
+                JobApplication.objects.filter(job=OuterRef('pk'), **filters)
+                .order_by()
+                .values('job')
+                .annotate(c=Count('id'))
+                .values('c')
+            ),
+            0,
+        )
+
+    Job.objects.update(
+        applications_count=count(),
+        accepted_applications_count=count(status='ACCEPTED'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0006_job_latitude_longitude_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='accepted_applications_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='applications_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:17
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0007_job_application_counters'),
+        ('profiles', '0003_provider_search_document'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['status', 'deadline'], name='jobs_job_status_e65f8d_idx'),
+        ),
+    ]
@@ -82,6 +82,10 @@ class Job(models.Model):
         limit_choices_to={'category': Tag.TagCategory.SKILL}
     )
     deadline = models.DateField(null=True, blank=True)
+    # Denormalized from JobApplication; maintained with F() updates in the
+    # application views, repaired by `manage.py recount_job_applications`.
+    applications_count = models.PositiveIntegerField(default=0)
+    accepted_applications_count = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     closed_at = models.DateTimeField(null=True, blank=True)
@@ -92,6 +96,8 @@ class Job(models.Model):
             models.Index(fields=['status', '-created_at']),
             models.Index(fields=['location']),
             models.Index(fields=['client', '-created_at']),
+            models.Index(fields=['latitude', 'longitude']),
+            models.Index(fields=['status', 'deadline']),
         ]
 
     def __str__(self):
@@ -102,6 +108,23 @@ class Job(models.Model):
         if self.budget_min and self.budget_max and self.budget_min > self.budget_max:
             raise ValidationError('Minimum budget cannot be greater than maximum budget.')
 
+    COUNTER_FIELDS = ('applications_count', 'accepted_applications_count')
+
+    @classmethod
+    def adjust_application_counts(cls, job_id, applications=0, accepted=0):
+        """Atomically add the given deltas to a job's application counters."""
+        from django.db.models import F
+        from django.db.models.functions import Greatest
+        updates = {}
+        if applications:
+            updates['applications_count'] = Greatest(F('applications_count') + applications, 0)
+        if accepted:
+            updates['accepted_applications_count'] = Greatest(
+                F('accepted_applications_count') + accepted, 0
+            )
+        if updates:
+            cls.objects.filter(pk=job_id).update(**updates)
+
 
 class JobApplication(models.Model):
     class ApplicationStatus(models.TextChoices):
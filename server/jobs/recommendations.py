@@ -0,0 +1,214 @@
+"""
+Skill-based job recommendations for providers.
+
+An inverted index (skill tag id -> ids of OPEN jobs requiring it) is kept in
+Redis sets and maintained incrementally by jobs.signals, so candidate lookup
+never scans the jobs table. Candidates are then loaded by primary key and
+scored on skill overlap, budget fit against the provider's hourly_rate and
+distance within their service_radius.
+Without Redis, candidates come from the required_skills through table instead.
+"""
+import uuid
+from collections import Counter
+from decimal import Decimal
+from math import asin, cos, radians, sin, sqrt
+from django.db.models import Count
+from skillspot.redis_client import get_redis, redis_key
+from .geo import EARTH_RADIUS_KM
+from .models import Job
+
+SKILL_WEIGHT = 0.6
+BUDGET_WEIGHT = 0.25
+DISTANCE_WEIGHT = 0.15
+NEUTRAL = 0.5  # sub-score used when there is nothing to compare (no rate, no budget, no location)
+MAX_CANDIDATES = 500
+
+
+def _skill_key(tag_id):
+    return redis_key('job_skill_index', tag_id)
+
+
+def _job_tag_ids(job_id):
+    through = Job.required_skills.through
+    return [str(t) for t in through.objects.filter(job_id=job_id).values_list('tag_id', flat=True)]
+
+
+def index_job_skills(job, tag_ids=None):
+    """Add job to the index for its skills if OPEN, otherwise remove it."""
+    client = get_redis()
+    if client is None:
+        return
+    tag_ids = _job_tag_ids(job.pk) if tag_ids is None else [str(t) for t in tag_ids]
+    if not tag_ids:
+        return
+    pipe = client.pipeline()
+    for tag_id in tag_ids:
+        if job.status == Job.JobStatus.OPEN:
+            pipe.sadd(_skill_key(tag_id), str(job.pk))
+        else:
+            pipe.srem(_skill_key(tag_id), str(job.pk))
+    pipe.execute()
+
+
+def index_job_skills_bulk(tag_ids_by_job):
+    """Add many OPEN jobs to the index in one round trip: {job_id: [tag_id, ...]}."""
+    client = get_redis()
+    if client is None or not tag_ids_by_job:
+        return
+    pipe = client.pipeline()
+    for job_id, tag_ids in tag_ids_by_job.items():
+        for tag_id in tag_ids:
+            pipe.sadd(_skill_key(tag_id), str(job_id))
+    pipe.execute()
+
+
+def unindex_job_skills_bulk(tag_ids_by_job):
+    """Remove many jobs from the index in one round trip: {job_id: [tag_id, ...]}."""
+    client = get_redis()
+    if client is None or not tag_ids_by_job:
+        return
+    pipe = client.pipeline()
+    for job_id, tag_ids in tag_ids_by_job.items():
+        for tag_id in tag_ids:
+            pipe.srem(_skill_key(tag_id), str(job_id))
+    pipe.execute()
+
+
+def unindex_job_skills(job_id, tag_ids):
+    client = get_redis()
+    if client is None or not tag_ids:
+        return
+    pipe = client.pipeline()
+    for tag_id in tag_ids:
+        pipe.srem(_skill_key(tag_id), str(job_id))
+    pipe.execute()
+
+
+def unindex_skill(tag_id):
+    """Drop a skill's whole set, e.g. after tag.jobs.clear()."""
+    client = get_redis()
+    if client is not None:
+        client.delete(_skill_key(tag_id))
+
+
+def rebuild_job_skill_index(chunk_size=1000):
+    """Repopulate the index from the database. Returns the number of (tag, job) pairs indexed."""
+    client = get_redis()
+    if client is None:
+        return 0
+    for key in client.scan_iter(match=_skill_key('*'), count=1000):
+        client.delete(key)
+    through = Job.required_skills.through
+    pairs = (
+        through.objects.filter(job__status=Job.JobStatus.OPEN)
+        .values_list('tag_id', 'job_id')
+        .order_by('pk')
+        .iterator(chunk_size=chunk_size)
+    )
+    total = 0
+    pipe = client.pipeline()
+    for tag_id, job_id in pairs:
+        pipe.sadd(_skill_key(tag_id), str(job_id))
+        total += 1
+        if total % chunk_size == 0:
+            pipe.execute()
+    pipe.execute()
+    return total
+
+
+def _skill_matches(skill_ids):
+    """
+    Counter of job id -> number of the given skills it requires (OPEN jobs only),
+    limited to the MAX_CANDIDATES jobs matching the most skills. The overlap is
+    counted server side (ZUNIONSTORE of the skill sets, or GROUP BY without
+    Redis), so only the top candidates are transferred.
+    """
+    client = get_redis()
+    if client is not None:
+        scratch = redis_key('job_skill_matches', uuid.uuid4().hex)
+        pipe = client.pipeline()
+        pipe.zunionstore(scratch, [_skill_key(tag_id) for tag_id in skill_ids])
+        pipe.zrevrange(scratch, 0, MAX_CANDIDATES - 1, withscores=True)
+        pipe.delete(scratch)
+        _, top, _ = pipe.execute()
+        return Counter({job_id: int(count) for job_id, count in top})
+    through = Job.required_skills.through
+    top = (
+        through.objects.filter(tag_id__in=skill_ids, job__status=Job.JobStatus.OPEN)
+        .values('job_id')
+        .annotate(matched=Count('id'))
+        .order_by('-matched')[:MAX_CANDIDATES]
+    )
+    return Counter({str(row['job_id']): row['matched'] for row in top})
+
+
+def _budget_fit(job, hourly_rate):
+    if hourly_rate is None or job.payment_schedule != Job.PaymentSchedule.HOURLY:
+        return NEUTRAL
+    low, high = job.budget_min, job.budget_max
+    if low is None and high is None:
+        return NEUTRAL
+    if (low is None or hourly_rate >= low) and (high is None or hourly_rate <= high):
+        return 1.0
+    nearest = low if low is not None and hourly_rate < low else high
+    gap = abs(hourly_rate - nearest) / max(hourly_rate, Decimal('1'))
+    return max(0.0, 1.0 - float(gap))
+
+
+def _haversine(lat1, lng1, lat2, lng2):
+    lat1, lng1, lat2, lng2 = map(radians, (lat1, lng1, lat2, lng2))
+    a = sin((lat2 - lat1) / 2) ** 2 + cos(lat1) * cos(lat2) * sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * asin(sqrt(a))
+
+
+def _distance_fit(job, origin, service_radius):
+    """Returns (sub-score, distance_km); sub-score None means out of range."""
+    if job.is_remote:
+        return 1.0, None
+    if origin is None or job.latitude is None or job.longitude is None:
+        return NEUTRAL, None
+    distance = _haversine(origin[0], origin[1], float(job.latitude), float(job.longitude))
+    if not service_radius:
+        return NEUTRAL, distance
+    if distance > service_radius:
+        return None, distance
+    return 1.0 - distance / service_radius, distance
+
+
+def recommend_jobs(user, provider_profile, origin=None, limit=20):
+    """
+    Return [(score, distance_km, job)] best first for a provider.
+    origin is an optional (lat, lng) for distance scoring within service_radius (km).
+    """
+    skill_ids = [str(t) for t in provider_profile.skills.values_list('id', flat=True)]
+    if not skill_ids:
+        return []
+    matches = _skill_matches(skill_ids)
+    candidate_ids = [job_id for job_id, _ in matches.most_common(MAX_CANDIDATES)]
+    if not candidate_ids:
+        return []
+
+    jobs = (
+        Job.objects.filter(id__in=candidate_ids, status=Job.JobStatus.OPEN)
+        .exclude(client=user)
+        .exclude(applications__provider=user)
+        .select_related('client__profile')
+        .prefetch_related('required_skills')
+        .annotate(required_skills_count=Count('required_skills', distinct=True))
+    )
+    hourly_rate = provider_profile.hourly_rate
+    scored = []
+    for job in jobs:
+        required = job.required_skills_count or 1
+        skill_score = min(1.0, matches[str(job.pk)] / required)
+        distance_score, distance = _distance_fit(job, origin, provider_profile.service_radius)
+        if distance_score is None:
+            continue
+        score = (
+            SKILL_WEIGHT * skill_score
+            + BUDGET_WEIGHT * _budget_fit(job, hourly_rate)
+            + DISTANCE_WEIGHT * distance_score
+        )
+        scored.append((round(score, 4), distance, job))
+    scored.sort(key=lambda item: (-item[0], -item[2].created_at.timestamp()))
+    return scored[:limit]
@@ -0,0 +1,118 @@
+"""
+Ranked full-text search over Job title, description and location.
+
+Postgres: jobs_job.search_vector is a generated tsvector column with a GIN index
+(see migration 0005), so it is maintained by the database itself.
+SQLite: jobs_job_fts is an FTS5 shadow table kept in sync by jobs.signals
+(and index_jobs() for bulk writes that bypass signals).
+Other backends fall back to icontains matching with a constant rank.
+"""
+import re
+from django.db import connection
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import BaseFilterBackend
+
+SEARCH_QUERY_PARAM = 'q'
+SEARCH_CONFIG = 'english'
+FTS_TABLE = 'jobs_job_fts'
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def _fts5_match_expression(query):
+    """Turn free user input into a safe FTS5 MATCH string (AND of quoted prefix terms)."""
+    tokens = _TOKEN_RE.findall(query)
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+def search_jobs(queryset, query):
+    """
+    Filter queryset to jobs matching query and annotate `search_rank`
+    (higher is more relevant). Returns the queryset unchanged for blank input.
+    """
+    query = (query or '').strip()
+    if not query:
+        return queryset
+
+    if connection.vendor == 'postgresql':
+        tsquery = f"websearch_to_tsquery('{SEARCH_CONFIG}', %s)"
+        # Filter through an id subquery rather than referencing jobs_job directly:
+        # Django re-aliases the table when this queryset is nested (e.g. facets).
+        return queryset.filter(
+            id__in=RawSQL(f'SELECT id FROM jobs_job WHERE search_vector @@ {tsquery}', (query,))
+        ).annotate(
+            search_rank=RawSQL(
+                f'ts_rank_cd(jobs_job.search_vector, {tsquery})',
+                (query,),
+                output_field=FloatField(),
+            )
+        )
+
+    if connection.vendor == 'sqlite':
+        match = _fts5_match_expression(query)
+        if not match:
+            return queryset.annotate(search_rank=Value(0.0, output_field=FloatField())).none()
+        # bm25() is lower-is-better, so negate it to keep "higher is more relevant".
+        return queryset.filter(
+            id__in=RawSQL(
+                f'SELECT job_id FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s',
+                (match,),
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f'SELECT -bm25({FTS_TABLE}) FROM {FTS_TABLE} '
+                f'WHERE {FTS_TABLE} MATCH %s AND {FTS_TABLE}.job_id = jobs_job.id',
+                (match,),
+                output_field=FloatField(),
+            )
+        )
+
+    return queryset.filter(
+        Q(title__icontains=query) | Q(description__icontains=query) | Q(location__icontains=query)
+    ).annotate(search_rank=Value(1.0, output_field=FloatField()))
+
+
+def index_jobs(jobs):
+    """Upsert jobs into the SQLite FTS5 shadow table. No-op on other backends."""
+    if connection.vendor != 'sqlite':
+        return
+    rows = [
+        (job.pk.hex, job.title or '', job.description or '', job.location or '')
+        for job in jobs
+    ]
+    if not rows:
+        return
+    with connection.cursor() as cursor:
+        cursor.executemany(f'DELETE FROM {FTS_TABLE} WHERE job_id = %s', [(r[0],) for r in rows])
+        cursor.executemany(
+            f'INSERT INTO {FTS_TABLE} (job_id, title, description, location) VALUES (%s, %s, %s, %s)',
+            rows,
+        )
+
+
+def unindex_jobs(job_ids):
+    """Remove jobs from the SQLite FTS5 shadow table. No-op on other backends."""
+    if connection.vendor != 'sqlite' or not job_ids:
+        return
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f'DELETE FROM {FTS_TABLE} WHERE job_id = %s',
+            [(job_id.hex,) for job_id in job_ids],
+        )
+
+
+class JobFullTextSearchFilter(BaseFilterBackend):
+    """
+    `?q=` ranked full-text search. Orders by relevance unless the client passed
+    an explicit `ordering`. Must come after OrderingFilter in filter_backends.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(SEARCH_QUERY_PARAM, '')
+        if not query.strip():
+            return queryset
+        queryset = search_jobs(queryset, query)
+        if not request.query_params.get('ordering'):
+            queryset = queryset.order_by('-search_rank', '-created_at')
+        return queryset
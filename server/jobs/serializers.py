@@ -3,50 +3,59 @@ from django.contrib.auth import get_user_model
 from .models import Job, JobApplication, JobInvitation
 from profiles.models import Tag
 from profiles.serializers import TagSerializer
+from skillspot.fieldsets import SparseFieldsetSerializerMixin
+from skillspot.partial_save import PartialUpdateSerializerMixin
+from skillspot.relations import BatchedPrimaryKeyRelatedField
 
 User = get_user_model()
 
 
-class JobSerializer(serializers.ModelSerializer):
+class JobSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     client_email = serializers.EmailField(source='client.email', read_only=True)
     client_name = serializers.SerializerMethodField()
     required_skills = TagSerializer(many=True, read_only=True)
-    skill_ids = serializers.PrimaryKeyRelatedField(
+    skill_ids = BatchedPrimaryKeyRelatedField(
         many=True,
         queryset=Tag.objects.filter(category=Tag.TagCategory.SKILL),
         write_only=True,
         required=False,
         source='required_skills'
     )
-    applications_count = serializers.SerializerMethodField()
-    accepted_applications_count = serializers.SerializerMethodField()
+    distance_km = serializers.SerializerMethodField()
 
     class Meta:
         model = Job
         fields = (
             'id', 'client', 'client_email', 'client_name', 'title', 'description',
             'budget_min', 'budget_max', 'currency', 'location',
-            'address', 'latitude', 'longitude', 'is_remote', 'status',
+            'address', 'latitude', 'longitude', 'distance_km', 'is_remote', 'status',
             'payment_schedule', 'required_skills', 'skill_ids',
             'deadline', 'applications_count', 'accepted_applications_count',
             'created_at', 'updated_at', 'closed_at'
         )
-        read_only_fields = ('id', 'client', 'created_at', 'updated_at', 'closed_at')
+        read_only_fields = (
+            'id', 'client', 'applications_count', 'accepted_applications_count',
+            'created_at', 'updated_at', 'closed_at'
+        )
+        sparse_select_related = {
+            'client_email': ('client',),
+            'client_name': ('client__profile',),
+        }
+        sparse_prefetch_related = {'required_skills': ('required_skills',)}
 
     def get_client_name(self, obj):
         if hasattr(obj.client, 'profile') and obj.client.profile:
             return obj.client.profile.full_name
         return obj.client.email
 
-    def get_applications_count(self, obj):
-        return obj.applications.count()
-
-    def get_accepted_applications_count(self, obj):
-        return obj.applications.filter(status=JobApplication.ApplicationStatus.ACCEPTED).count()
+    def get_distance_km(self, obj):
+        # Only present when the list was filtered with ?near= (see jobs.geo).
+        distance = getattr(obj, 'distance_km', None)
+        return round(distance, 2) if distance is not None else None
 
 
-class JobCreateSerializer(serializers.ModelSerializer):
-    skill_ids = serializers.PrimaryKeyRelatedField(
+class JobCreateSerializer(PartialUpdateSerializerMixin, serializers.ModelSerializer):
+    skill_ids = BatchedPrimaryKeyRelatedField(
         many=True,
         queryset=Tag.objects.filter(category=Tag.TagCategory.SKILL),
         required=False,
@@ -96,6 +105,27 @@ class JobApplicationSerializer(serializers.ModelSerializer):
         return obj.provider.email
 
 
+class ApplicationInboxJobSerializer(serializers.ModelSerializer):
+    """One inbox group: a job with its applicant counts and first applicants."""
+    job_title = serializers.CharField(source='title', read_only=True)
+    total_count = serializers.IntegerField(read_only=True)
+    pending_count = serializers.IntegerField(read_only=True)
+    accepted_count = serializers.IntegerField(read_only=True)
+    latest_applied_at = serializers.DateTimeField(read_only=True)
+    applicants = JobApplicationSerializer(source='inbox_applicants', many=True, read_only=True)
+    has_more_applicants = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Job
+        fields = (
+            'id', 'job_title', 'status', 'total_count', 'pending_count',
+            'accepted_count', 'latest_applied_at', 'applicants', 'has_more_applicants'
+        )
+
+    def get_has_more_applicants(self, obj):
+        return obj.total_count > len(obj.inbox_applicants)
+
+
 class JobApplicationCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = JobApplication
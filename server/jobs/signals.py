@@ -0,0 +1,74 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_delete, m2m_changed
+from django.dispatch import receiver
+from skillspot.cache_utils import bump_job_list_version
+from .models import Job, JobApplication
+from .recommendations import index_job_skills, unindex_job_skills, unindex_skill
+from .search import index_jobs, unindex_jobs
+
+
+@receiver(post_save, sender=Job)
+def index_job_for_search(sender, instance, **kwargs):
+    index_jobs([instance])
+
+
+@receiver(post_delete, sender=Job)
+def unindex_job_for_search(sender, instance, **kwargs):
+    unindex_jobs([instance.pk])
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+@receiver(post_save, sender=JobApplication)
+@receiver(post_delete, sender=JobApplication)
+def invalidate_job_list_on_change(sender, **kwargs):
+    # After commit, so a concurrent reader cannot re-cache pre-write rows under the new version.
+    transaction.on_commit(bump_job_list_version)
+
+
+@receiver(m2m_changed, sender=Job.required_skills.through)
+def invalidate_job_list_on_skills_change(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        transaction.on_commit(bump_job_list_version)
+
+
+# Redis skill-index writes run after commit, so a rolled-back save or skill
+# change never leaves (or drops) job ids in the index.
+
+@receiver(post_save, sender=Job)
+def update_job_skill_index(sender, instance, **kwargs):
+    transaction.on_commit(lambda: index_job_skills(instance))
+
+
+@receiver(pre_delete, sender=Job)
+def remove_job_from_skill_index(sender, instance, **kwargs):
+    job_id = instance.pk
+    tag_ids = list(instance.required_skills.values_list('id', flat=True))
+    transaction.on_commit(lambda: unindex_job_skills(job_id, tag_ids))
+
+
+@receiver(m2m_changed, sender=Job.required_skills.through)
+def update_job_skill_index_on_skills_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse:
+        # Changed from the Tag side: pk_set holds job ids.
+        if action == 'pre_clear':
+            # tag.jobs.clear(): the tag's whole set goes.
+            tag_id = instance.pk
+            transaction.on_commit(lambda: unindex_skill(tag_id))
+        elif action in ('post_add', 'post_remove'):
+            tag_ids = [instance.pk]
+            for job in Job.objects.filter(pk__in=pk_set):
+                if action == 'post_add':
+                    transaction.on_commit(lambda job=job: index_job_skills(job, tag_ids))
+                else:
+                    transaction.on_commit(lambda job_id=job.pk: unindex_job_skills(job_id, tag_ids))
+        return
+    if action == 'post_add':
+        tag_ids = list(pk_set)
+        transaction.on_commit(lambda: index_job_skills(instance, tag_ids))
+    elif action == 'post_remove':
+        tag_ids = list(pk_set)
+        transaction.on_commit(lambda: unindex_job_skills(instance.pk, tag_ids))
+    elif action == 'pre_clear':
+        tag_ids = list(instance.required_skills.values_list('id', flat=True))
+        transaction.on_commit(lambda: unindex_job_skills(instance.pk, tag_ids))
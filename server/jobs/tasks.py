@@ -0,0 +1,76 @@
+from collections import defaultdict
+from celery import shared_task
+from django.db import transaction
+from django.utils import timezone
+from notifications.tasks import send_in_app_notifications
+from skillspot.cache_utils import bump_job_list_version
+from .models import Job
+from .recommendations import unindex_job_skills_bulk
+
+EXPIRY_CHUNK_SIZE = 500
+
+
+def _expire_chunk(today, now, chunk_size):
+    """Cancel one chunk of OPEN jobs whose deadline has passed. Returns [(id, client_id, title)]."""
+    with transaction.atomic():
+        rows = list(
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(status=Job.JobStatus.OPEN, deadline__lt=today)
+            .order_by('deadline', 'id')
+            .values_list('id', 'client_id', 'title')[:chunk_size]
+        )
+        if rows:
+            Job.objects.filter(id__in=[row[0] for row in rows]).update(
+                status=Job.JobStatus.CANCELLED, closed_at=now, updated_at=now
+            )
+    return rows
+
+
+@shared_task(bind=True, ignore_result=True)
+def close_expired_jobs(self, chunk_size=EXPIRY_CHUNK_SIZE):
+    """
+    Cancel OPEN jobs past their deadline with one UPDATE per chunk.
+    Queryset.update() skips Job signals, so the recommendation index, the job
+    list cache version (once per run) and client notifications are handled here.
+    """
+    today = timezone.localdate()
+    now = timezone.now()
+    expired_by_client = defaultdict(list)
+    total = 0
+    through = Job.required_skills.through
+    while True:
+        rows = _expire_chunk(today, now, chunk_size)
+        if not rows:
+            break
+        total += len(rows)
+        tag_ids_by_job = defaultdict(list)
+        for job_id, tag_id in through.objects.filter(
+            job_id__in=[row[0] for row in rows]
+        ).values_list('job_id', 'tag_id'):
+            tag_ids_by_job[job_id].append(tag_id)
+        unindex_job_skills_bulk(tag_ids_by_job)
+        for job_id, client_id, title in rows:
+            expired_by_client[client_id].append((job_id, title))
+        if len(rows) < chunk_size:
+            break
+
+    if not total:
+        return 0
+    bump_job_list_version()
+    notifications = []
+    for client_id, jobs in expired_by_client.items():
+        if len(jobs) == 1:
+            job_id, title = jobs[0]
+            message = f'Job "{title}" passed its deadline and was closed.'
+            link = f'/jobs/{job_id}/'
+        else:
+            message = f'{len(jobs)} of your jobs passed their deadline and were closed.'
+            link = '/jobs/'
+        notifications.append({
+            'recipient_id': str(client_id),
+            'title': 'Job expired' if len(jobs) == 1 else 'Jobs expired',
+            'message': message,
+            'link': link,
+        })
+    send_in_app_notifications.delay(notifications)
+    return total
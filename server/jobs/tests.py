@@ -0,0 +1,222 @@
+import base64
+import json
+import uuid
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from accounts.models import User
+from profiles.models import Tag
+from .bulk_import import MAX_IMPORT_ROWS
+from .models import Job, JobApplication
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(REDIS_URL='locmem://', CACHES=LOCMEM_CACHES)
+class JobFacetsTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.client_user = User.objects.create_user('client@example.com', 'pw-123456', user_type='CLIENT')
+        self.client.force_authenticate(self.client_user)
+        Job.objects.create(client=self.client_user, title='Fix kitchen plumbing', description='Leaking sink', location='Addis Ababa')
+        Job.objects.create(client=self.client_user, title='Paint living room', description='Two walls', location='Adama')
+
+    def test_facets_with_full_text_query(self):
+        response = self.client.get('/api/v1/jobs/facets/', {'q': 'plumbing'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['total'], 1)
+        self.assertEqual(response.json()['locations'], [{'location': 'Addis Ababa', 'count': 1}])
+
+
+@override_settings(REDIS_URL='locmem://', CACHES=LOCMEM_CACHES)
+class JobListQueryCountTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.client_user = User.objects.create_user('client@example.com', 'pw-123456', user_type='CLIENT')
+        self.client.force_authenticate(self.client_user)
+        skills = list(Tag.objects.filter(category=Tag.TagCategory.SKILL)[:3])
+        for i in range(15):
+            client = User.objects.create_user(f'client{i}@example.com', 'pw-123456', user_type='CLIENT')
+            job = Job.objects.create(client=client, title=f'Job {i}', description='Work', location='Addis Ababa')
+            job.required_skills.set(skills[:1 + i % 3])
+
+    def test_page_query_count_is_independent_of_page_size(self):
+        with CaptureQueriesContext(connection) as small_page:
+            response = self.client.get('/api/v1/jobs/', {'page_size': 5})
+        self.assertEqual(len(response.json()['results']), 5)
+
+        with self.assertNumQueries(len(small_page.captured_queries)):
+            response = self.client.get('/api/v1/jobs/', {'page_size': 15})
+        self.assertEqual(len(response.json()['results']), 15)
+
+
+@override_settings(REDIS_URL='locmem://', CACHES=LOCMEM_CACHES)
+class JobUpdateCounterTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.client_user = User.objects.create_user('client@example.com', 'pw-123456', user_type='CLIENT')
+        self.client.force_authenticate(self.client_user)
+        self.job = Job.objects.create(client=self.client_user, title='Fix sink', description='Leak', location='Adama')
+
+    def test_update_and_close_keep_application_counters(self):
+        Job.adjust_application_counts(self.job.pk, applications=2)
+
+        response = self.client.patch(f'/api/v1/jobs/{self.job.pk}/', {'title': 'Fix kitchen sink'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.client.post(f'/api/v1/jobs/{self.job.pk}/close/')
+
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.title, 'Fix kitchen sink')
+        self.assertEqual(self.job.status, Job.JobStatus.COMPLETED)
+        self.assertEqual(self.job.applications_count, 2)
+
+
+@override_settings(REDIS_URL='locmem://', CACHES=LOCMEM_CACHES)
+class JobListCursorPaginationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.client_user = User.objects.create_user('client@example.com', 'pw-123456', user_type='CLIENT')
+        self.client.force_authenticate(self.client_user)
+        for i in range(7):
+            Job.objects.create(client=self.client_user, title=f'Job {i}', description='Work', location='Adama')
+        # Every row shares created_at, so only the id tie-breaker orders them.
+        Job.objects.update(created_at=timezone.now())
+
+    def page(self, url, params=None):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        return [job['id'] for job in body['results']], body['next'], body['previous']
+
+    def test_forward_and_backward_paging_with_tied_timestamps(self):
+        expected = [str(pk) for pk in Job.objects.order_by('id').values_list('id', flat=True)]
+
+        first, next_url, previous_url = self.page('/api/v1/jobs/', {'pagination': 'cursor', 'page_size': 5})
+        self.assertIsNone(previous_url)
+        second, last_url, back_url = self.page(next_url)
+        self.assertEqual(first + second, expected)
+        self.assertIsNone(last_url)
+
+        back, _, previous_url = self.page(back_url)
+        self.assertEqual(back, first)
+        self.assertIsNone(previous_url)
+
+    def test_malformed_cursor_values_are_not_found(self):
+        for values in (['not-a-date', str(uuid.uuid4())], [timezone.now().isoformat(), 'not-a-uuid'], [None, None]):
+            token = base64.urlsafe_b64encode(json.dumps({'v': values}).encode()).decode('ascii')
+            response = self.client.get('/api/v1/jobs/', {'cursor': token})
+            self.assertEqual(response.status_code, 404)
+            self.assertEqual(response.json(), {'error': 'Invalid cursor.'})
+
+
+@override_settings(REDIS_URL='locmem://', CACHES=LOCMEM_CACHES)
+class JobApplicationInboxTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.client_user = User.objects.create_user('client@example.com', 'pw-123456', user_type='CLIENT')
+        self.client.force_authenticate(self.client_user)
+        self.providers = [
+            User.objects.create_user(f'provider{i}@example.com', 'pw-123456', user_type='PROVIDER')
+            for i in range(4)
+        ]
+
+    def job_with_applicants(self, count):
+        job = Job.objects.create(client=self.client_user, title=f'{count} applicants', description='Work', location='Adama')
+        for provider in self.providers[:count]:
+            JobApplication.objects.create(job=job, provider=provider)
+        return job
+
+    def inbox(self):
+        response = self.client.get('/api/v1/jobs/applications/inbox/', {'applicants_limit': 2})
+        self.assertEqual(response.status_code, 200)
+        return {group['id']: group for group in response.json()['results']}
+
+    def test_has_more_applicants_at_the_limit_boundary(self):
+        at_limit = self.job_with_applicants(2)
+        over_limit = self.job_with_applicants(3)
+        groups = self.inbox()
+        self.assertEqual(len(groups[str(at_limit.pk)]['applicants']), 2)
+        self.assertFalse(groups[str(at_limit.pk)]['has_more_applicants'])
+        self.assertEqual(len(groups[str(over_limit.pk)]['applicants']), 2)
+        self.assertTrue(groups[str(over_limit.pk)]['has_more_applicants'])
+
+    def test_query_count_is_independent_of_jobs_and_applicants(self):
+        self.job_with_applicants(1)
+        with CaptureQueriesContext(connection) as few:
+            self.inbox()
+
+        for count in (2, 3, 4, 4):
+            self.job_with_applicants(count)
+        with self.assertNumQueries(len(few.captured_queries)):
+            groups = self.inbox()
+        self.assertEqual(len(groups), 5)
+
+
+@override_settings(REDIS_URL='locmem://', CACHES=LOCMEM_CACHES)
+class JobImportTests(APITestCase):
+    url = '/api/v1/jobs/import/'
+
+    def setUp(self):
+        cache.clear()
+        self.client_user = User.objects.create_user('client@example.com', 'pw-123456', user_type='CLIENT')
+        self.client.force_authenticate(self.client_user)
+        self.skills = list(Tag.objects.filter(category=Tag.TagCategory.SKILL)[:2])
+
+    def post_ndjson(self, lines):
+        return self.client.post(self.url, data='\n'.join(lines), content_type='application/x-ndjson')
+
+    def row(self, **fields):
+        return json.dumps({'title': 'Fix sink', 'description': 'Leak', 'location': 'Adama', **fields})
+
+    def test_ndjson_reports_every_row(self):
+        unknown = str(uuid.uuid4())
+        response = self.post_ndjson([
+            self.row(skill_ids=[str(self.skills[0].pk)]),
+            '{"title": ',
+            json.dumps({'description': 'No title', 'location': 'Adama'}),
+            self.row(skill_ids=[unknown]),
+        ])
+        self.assertEqual(response.status_code, 201)
+        report = response.json()
+        self.assertEqual((report['total'], report['created'], report['failed']), (4, 1, 3))
+        results = report['results']
+        self.assertEqual([r['status'] for r in results], ['created', 'error', 'error', 'error'])
+        self.assertTrue(results[1]['errors']['non_field_errors'][0].startswith('Invalid JSON'))
+        self.assertIn('title', results[2]['errors'])
+        self.assertEqual(results[3]['errors'], {'skill_ids': [f'Invalid pk "{unknown}" - object does not exist.']})
+        job = Job.objects.get(pk=results[0]['id'])
+        self.assertEqual(list(job.required_skills.all()), [self.skills[0]])
+
+    def test_csv_upload(self):
+        skill_ids = ';'.join(str(skill.pk) for skill in self.skills)
+        upload = SimpleUploadedFile('jobs.csv', (
+            'title,description,location,skill_ids\n'
+            f'Fix sink,Leak,Adama,{skill_ids}\n'
+            'Paint wall,,Adama,\n'
+        ).encode(), content_type='text/csv')
+        response = self.client.post(self.url, {'file': upload}, format='multipart')
+        self.assertEqual(response.status_code, 201)
+        results = response.json()['results']
+        self.assertEqual([r['status'] for r in results], ['created', 'error'])
+        self.assertIn('description', results[1]['errors'])
+        self.assertEqual(Job.objects.get(pk=results[0]['id']).required_skills.count(), 2)
+
+    def test_csv_lines_in_an_ndjson_body_fail_per_row(self):
+        response = self.post_ndjson([self.row(), 'Paint wall,Two walls,Adama'])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([r['status'] for r in response.json()['results']], ['created', 'error'])
+
+    def test_rows_past_the_cap_are_not_read(self):
+        response = self.post_ndjson(['{}'] * (MAX_IMPORT_ROWS + 1))
+        self.assertEqual(response.status_code, 400)
+        report = response.json()
+        self.assertEqual((report['total'], report['failed']), (MAX_IMPORT_ROWS, MAX_IMPORT_ROWS))
+        self.assertTrue(report['truncated'])
+
+    def test_unsupported_content_type(self):
+        response = self.client.post(self.url, data=self.row(), content_type='text/plain')
+        self.assertEqual(response.status_code, 415)
@@ -1,9 +1,13 @@
 from django.urls import path
 from .views import (
     JobListCreateView,
+    JobImportView,
+    JobFacetsView,
+    JobRecommendationListView,
     JobDetailView,
     JobCloseView,
     MyJobApplicationListView,
+    JobApplicationInboxView,
     JobApplicationListCreateView,
     JobApplicationDetailView,
     JobInvitationListCreateView,
@@ -14,9 +18,13 @@ app_name = 'jobs'
 
 urlpatterns = [
     path('', JobListCreateView.as_view(), name='job_list_create'),
+    path('import/', JobImportView.as_view(), name='job_import'),
+    path('facets/', JobFacetsView.as_view(), name='job_facets'),
+    path('recommended/', JobRecommendationListView.as_view(), name='job_recommended'),
     path('<uuid:id>/', JobDetailView.as_view(), name='job_detail'),
     path('<uuid:id>/close/', JobCloseView.as_view(), name='job_close'),
     path('applications/', MyJobApplicationListView.as_view(), name='my_job_application_list'),
+    path('applications/inbox/', JobApplicationInboxView.as_view(), name='job_application_inbox'),
     path('<uuid:job_id>/applications/', JobApplicationListCreateView.as_view(), name='job_application_list_create'),
     path('applications/<uuid:id>/', JobApplicationDetailView.as_view(), name='job_application_detail'),
     path('invitations/', JobInvitationListCreateView.as_view(), name='job_invitation_list_create'),
@@ -1,19 +1,35 @@
 from rest_framework import generics, permissions, status, filters
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 from django.contrib.auth import get_user_model
-from django.core.cache import cache
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Count, Max, Prefetch, Q
 from django.http import Http404
 from django.utils import timezone
-from skillspot.cache_utils import job_list_cache_key, JOB_LIST_TIMEOUT
-from notifications.tasks import send_in_app_notification
+from skillspot.cache_utils import (
+    job_list_cache_key,
+    job_facets_cache_key,
+    get_or_compute,
+    render_json_entry,
+    json_entry_response,
+    JOB_LIST_TIMEOUT,
+)
+from skillspot.fieldsets import SparseFieldsetViewMixin
+from skillspot.pagination import OptionalCursorPagination
+from notifications.tasks import send_in_app_notification, send_bulk_in_app_notification
 from .models import Job, JobApplication, JobInvitation
+from .bulk_import import detect_format, import_jobs
+from .facets import compute_job_facets
+from .geo import JobNearFilter, parse_near
+from .recommendations import recommend_jobs
+from .search import JobFullTextSearchFilter
 from .serializers import (
     JobSerializer,
     JobCreateSerializer,
     JobApplicationSerializer,
     JobApplicationCreateSerializer,
+    ApplicationInboxJobSerializer,
     JobInvitationSerializer,
     JobInvitationCreateSerializer,
 )
@@ -21,20 +37,28 @@ from .serializers import (
 User = get_user_model()
 
 
-class JobListCreateView(generics.ListCreateAPIView):
-    serializer_class = JobSerializer
-    permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+class JobBrowseMixin:
+    """Browse filters shared by the job list and its facet counts."""
+    # `search=` keeps the legacy icontains behaviour; `q=` is ranked full-text search;
+    # `near=lat,lng&radius_km=` restricts to a radius (ordering=distance sorts by it).
+    filter_backends = [
+        filters.SearchFilter,
+        filters.OrderingFilter,
+        JobFullTextSearchFilter,
+        JobNearFilter,
+    ]
     search_fields = ['title', 'description', 'location']
     ordering_fields = ['created_at', 'budget_min', 'budget_max']
     ordering = ['-created_at']
 
-    def get_queryset(self):
-        my_jobs = self.request.query_params.get('my_jobs', None)
-        is_my_jobs = (
-            my_jobs == 'true'
+    def is_my_jobs(self):
+        return (
+            self.request.query_params.get('my_jobs') == 'true'
             and self.request.user.user_type in ['CLIENT', 'BOTH']
         )
+
+    def get_browse_queryset(self):
+        is_my_jobs = self.is_my_jobs()
         if is_my_jobs:
             queryset = Job.objects.all()
         else:
@@ -65,7 +89,18 @@ class JobListCreateView(generics.ListCreateAPIView):
         if is_my_jobs:
             queryset = queryset.filter(client=self.request.user)
 
-        return queryset.distinct()
+        return queryset
+
+
+class JobListCreateView(SparseFieldsetViewMixin, JobBrowseMixin, generics.ListCreateAPIView):
+    serializer_class = JobSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = OptionalCursorPagination
+
+    def get_queryset(self):
+        # Joins and prefetches for the serializer's related fields are added per
+        # requested fieldset (see JobSerializer.Meta and skillspot.fieldsets).
+        return self.get_browse_queryset().distinct()
 
     def get_serializer_class(self):
         if self.request.method == 'POST':
@@ -73,21 +108,17 @@ class JobListCreateView(generics.ListCreateAPIView):
         return JobSerializer
 
     def list(self, request, *args, **kwargs):
-        if request.method != 'GET':
+        if request.method != 'GET' or self.is_my_jobs():
             return super().list(request, *args, **kwargs)
-        is_my_jobs = (
-            request.query_params.get('my_jobs') == 'true'
-            and request.user.user_type in ['CLIENT', 'BOTH']
+        # Cache the rendered (possibly gzipped) body + ETag, not response.data,
+        # so hits skip unpickling and DRF rendering; If-None-Match gets a 304.
+        list_page = super().list
+        entry = get_or_compute(
+            job_list_cache_key(request),
+            lambda: render_json_entry(list_page(request, *args, **kwargs).data),
+            timeout=JOB_LIST_TIMEOUT,
         )
-        if is_my_jobs:
-            return super().list(request, *args, **kwargs)
-        key = job_list_cache_key(request)
-        data = cache.get(key)
-        if data is not None:
-            return Response(data)
-        response = super().list(request, *args, **kwargs)
-        cache.set(key, response.data, timeout=JOB_LIST_TIMEOUT)
-        return response
+        return json_entry_response(request, entry)
 
     def perform_create(self, serializer):
         serializer.save(client=self.request.user)
@@ -101,7 +132,105 @@ class JobListCreateView(generics.ListCreateAPIView):
         )
 
 
-class JobDetailView(generics.RetrieveUpdateDestroyAPIView):
+class JobImportView(generics.GenericAPIView):
+    """
+    Bulk-create jobs from an NDJSON or CSV body (Content-Type application/x-ndjson
+    or text/csv) or a multipart `file` upload. Rows are streamed and inserted in
+    batches; the response reports the outcome of every row.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    # Only multipart goes through a DRF parser. NDJSON and CSV bodies are read
+    # from request.stream line by line (never buffered whole); any other content
+    # type is rejected with 415 below.
+    parser_classes = [MultiPartParser]
+
+    def post(self, request):
+        if request.user.user_type not in ['CLIENT', 'BOTH']:
+            return Response(
+                {'error': 'Only clients can import jobs.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        if request.content_type.startswith('multipart/'):
+            upload = request.FILES.get('file')
+            if upload is None:
+                return Response({'error': 'Upload the rows as `file`.'}, status=status.HTTP_400_BAD_REQUEST)
+            stream, fmt = upload, detect_format(upload.content_type, upload.name.lower())
+        else:
+            stream, fmt = request.stream, detect_format(request.content_type)
+        if fmt is None:
+            return Response(
+                {'error': 'Send application/x-ndjson or text/csv.'},
+                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+            )
+        if stream is None:
+            return Response({'error': 'No rows to import.'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            report = import_jobs(stream, fmt, request.user)
+        except UnicodeDecodeError:
+            return Response({'error': 'Rows must be UTF-8 encoded.'}, status=status.HTTP_400_BAD_REQUEST)
+        response_status = status.HTTP_201_CREATED if report['created'] else status.HTTP_400_BAD_REQUEST
+        return Response(report, status=response_status)
+
+
+class JobFacetsView(JobBrowseMixin, generics.GenericAPIView):
+    """
+    Facet counts (status, skills, remote, budget buckets, top locations) for the
+    jobs matching the same filters as the job list, from a fixed number of queries.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        def compute():
+            queryset = self.filter_queryset(self.get_browse_queryset())
+            return compute_job_facets(queryset)
+
+        if self.is_my_jobs():
+            return Response(compute())
+        data = get_or_compute(job_facets_cache_key(request), compute, timeout=JOB_LIST_TIMEOUT)
+        return Response(data)
+
+
+class JobRecommendationListView(generics.GenericAPIView):
+    """
+    Open jobs ranked for the current provider by skill overlap, budget fit and
+    distance. Optional ?near=lat,lng enables distance scoring within service_radius.
+    """
+    serializer_class = JobSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    default_limit = 20
+    max_limit = 50
+
+    def get(self, request):
+        if request.user.user_type not in ['PROVIDER', 'BOTH']:
+            return Response(
+                {'error': 'Only service providers can get job recommendations.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        from profiles.models import ServiceProviderProfile
+        provider_profile = ServiceProviderProfile.objects.filter(
+            profile__user=request.user
+        ).first()
+        if provider_profile is None:
+            return Response({'results': []})
+
+        near = request.query_params.get('near')
+        origin = parse_near(near) if near else None
+        try:
+            limit = int(request.query_params.get('limit', self.default_limit))
+        except (TypeError, ValueError):
+            limit = self.default_limit
+        limit = max(1, min(limit, self.max_limit))
+
+        results = []
+        for score, distance, job in recommend_jobs(request.user, provider_profile, origin, limit):
+            job.distance_km = distance
+            data = self.get_serializer(job).data
+            data['match_score'] = score
+            results.append(data)
+        return Response({'results': results})
+
+
+class JobDetailView(SparseFieldsetViewMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = JobSerializer
     permission_classes = [permissions.IsAuthenticated]
     lookup_field = 'id'
@@ -149,10 +278,15 @@ class JobCloseView(generics.GenericAPIView):
                 )
             job.status = Job.JobStatus.COMPLETED
             job.closed_at = timezone.now()
-            job.save()
-            for app in job.applications.filter(status=JobApplication.ApplicationStatus.ACCEPTED):
-                send_in_app_notification.delay(
-                    str(app.provider_id),
+            job.save(update_fields=['status', 'closed_at', 'updated_at'])
+            provider_ids = [
+                str(provider_id) for provider_id in job.applications.filter(
+                    status=JobApplication.ApplicationStatus.ACCEPTED
+                ).values_list('provider_id', flat=True)
+            ]
+            if provider_ids:
+                send_bulk_in_app_notification.delay(
+                    provider_ids,
                     'Job completed',
                     f'Job "{job.title}" has been marked as completed.',
                     link=f'/jobs/{job.id}/',
@@ -177,8 +311,56 @@ class MyJobApplicationListView(generics.ListAPIView):
     def get_queryset(self):
         user = self.request.user
         if user.user_type in ['CLIENT', 'BOTH']:
-            return JobApplication.objects.filter(job__client=user).order_by('-applied_at')
-        return JobApplication.objects.filter(provider=user).order_by('-applied_at')
+            queryset = JobApplication.objects.filter(job__client=user)
+        else:
+            queryset = JobApplication.objects.filter(provider=user)
+        return queryset.select_related('job__client', 'provider__profile').order_by('-applied_at')
+
+
+class JobApplicationInboxView(generics.ListAPIView):
+    """
+    Client inbox: applications grouped by job, newest activity first.
+    Each group carries total/pending/accepted counts from one aggregate query and
+    the first `applicants_limit` applicants (default 5, max 20) from one prefetch;
+    page through the rest with /jobs/<job_id>/applications/.
+    """
+    serializer_class = ApplicationInboxJobSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    default_applicants_limit = 5
+    max_applicants_limit = 20
+
+    def get_applicants_limit(self):
+        try:
+            limit = int(self.request.query_params.get('applicants_limit', self.default_applicants_limit))
+        except (TypeError, ValueError):
+            limit = self.default_applicants_limit
+        return max(1, min(limit, self.max_applicants_limit))
+
+    def get_queryset(self):
+        user = self.request.user
+        if user.user_type not in ['CLIENT', 'BOTH']:
+            raise PermissionDenied('Only clients have an applications inbox.')
+        statuses = JobApplication.ApplicationStatus
+        applicants = (
+            JobApplication.objects.select_related('job__client', 'provider__profile')
+            .order_by('-applied_at')[:self.get_applicants_limit()]
+        )
+        queryset = (
+            Job.objects.filter(client=user)
+            .annotate(
+                total_count=Count('applications'),
+                pending_count=Count('applications', filter=Q(applications__status=statuses.PENDING)),
+                accepted_count=Count('applications', filter=Q(applications__status=statuses.ACCEPTED)),
+                latest_applied_at=Max('applications__applied_at'),
+            )
+            .filter(total_count__gt=0)
+            .prefetch_related(Prefetch('applications', queryset=applicants, to_attr='inbox_applicants'))
+            .order_by('-latest_applied_at')
+        )
+        status_filter = self.request.query_params.get('status')
+        if status_filter:
+            queryset = queryset.filter(status=status_filter)
+        return queryset
 
 
 class JobApplicationListCreateView(generics.ListCreateAPIView):
@@ -225,10 +407,12 @@ class JobApplicationListCreateView(generics.ListCreateAPIView):
                 {'error': 'Job not found.'},
                 status=status.HTTP_404_NOT_FOUND
             )
-        serializer.save(
-            job=job,
-            provider=self.request.user
-        )
+        with transaction.atomic():
+            serializer.save(
+                job=job,
+                provider=self.request.user
+            )
+            Job.adjust_application_counts(job.id, applications=1)
         # Notify job owner (client) about the new application
         send_in_app_notification.delay(
             str(job.client_id),
@@ -261,13 +445,18 @@ class JobApplicationDetailView(generics.RetrieveUpdateDestroyAPIView):
             
             new_status = request.data.get('status')
             if new_status in ['ACCEPTED', 'REJECTED']:
-                application.status = new_status
-                application.reviewed_at = timezone.now()
-                application.save()
+                with transaction.atomic():
+                    old_status = self.lock_status(application)
+                    if old_status is None:
+                        raise NotFound()
+                    application.status = new_status
+                    application.reviewed_at = timezone.now()
+                    application.save()
+                    self.adjust_accepted_count(application, old_status)
                 
                 if new_status == 'ACCEPTED':
                     application.job.status = Job.JobStatus.IN_PROGRESS
-                    application.job.save()
+                    application.job.save(update_fields=['status', 'updated_at'])
                     # Notify provider their application was accepted
                     send_in_app_notification.delay(
                         str(application.provider_id),
@@ -280,8 +469,13 @@ class JobApplicationDetailView(generics.RetrieveUpdateDestroyAPIView):
         
         if application.provider == request.user:
             if request.data.get('status') == 'WITHDRAWN':
-                application.status = 'WITHDRAWN'
-                application.save()
+                with transaction.atomic():
+                    old_status = self.lock_status(application)
+                    if old_status is None:
+                        raise NotFound()
+                    application.status = 'WITHDRAWN'
+                    application.save()
+                    self.adjust_accepted_count(application, old_status)
                 return Response(JobApplicationSerializer(application).data)
         
         return Response(
@@ -289,6 +483,40 @@ class JobApplicationDetailView(generics.RetrieveUpdateDestroyAPIView):
             status=status.HTTP_403_FORBIDDEN
         )
 
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            old_status = self.lock_status(instance)
+            if old_status is None:
+                return  # Already deleted by a concurrent request, which adjusted the counts.
+            instance.delete()
+            Job.adjust_application_counts(
+                instance.job_id,
+                applications=-1,
+                accepted=-1 if old_status == JobApplication.ApplicationStatus.ACCEPTED else 0,
+            )
+
+    @staticmethod
+    def lock_status(application):
+        """
+        Lock the application row and return its current status (None if gone).
+        Call inside transaction.atomic(): concurrent status changes then apply
+        their counter deltas one after another from the committed status.
+        """
+        return (
+            JobApplication.objects.select_for_update()
+            .filter(pk=application.pk)
+            .values_list('status', flat=True)
+            .first()
+        )
+
+    @staticmethod
+    def adjust_accepted_count(application, old_status):
+        accepted = JobApplication.ApplicationStatus.ACCEPTED
+        if old_status != accepted and application.status == accepted:
+            Job.adjust_application_counts(application.job_id, accepted=1)
+        elif old_status == accepted and application.status != accepted:
+            Job.adjust_application_counts(application.job_id, accepted=-1)
+
 
 class JobInvitationListCreateView(generics.ListCreateAPIView):
     serializer_class = JobInvitationSerializer
@@ -366,7 +594,7 @@ class JobInvitationDetailView(generics.RetrieveUpdateDestroyAPIView):
             
             if new_status == 'ACCEPTED' and invitation.job:
                 invitation.job.status = Job.JobStatus.IN_PROGRESS
-                invitation.job.save()
+                invitation.job.save(update_fields=['status', 'updated_at'])
             
             return Response(JobInvitationSerializer(invitation).data)
         
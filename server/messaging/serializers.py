@@ -1,8 +1,11 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db.models import Count, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from .models import Conversation, Message, MessageAttachment
 from jobs.models import Job
+from skillspot.fieldsets import SparseFieldsetSerializerMixin
 
 User = get_user_model()
 
@@ -73,7 +76,22 @@ class MessageCreateSerializer(serializers.ModelSerializer):
         return message
 
 
-class ConversationSerializer(serializers.ModelSerializer):
+def unread_count_annotations(request):
+    """Per-conversation count of messages the requesting user hasn't read, as a subquery."""
+    if request is None:
+        return {}
+    unread = (
+        Message.objects.filter(conversation=OuterRef('pk'), is_read=False)
+        .exclude(sender=request.user)
+        .order_by()
+        .values('conversation')
+        .annotate(count=Count('id'))
+        .values('count')
+    )
+    return {'unread_messages': Coalesce(Subquery(unread), 0)}
+
+
+class ConversationSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     participant1_email = serializers.EmailField(source='participant1.email', read_only=True)
     participant1_name = serializers.SerializerMethodField()
     participant2_email = serializers.EmailField(source='participant2.email', read_only=True)
@@ -95,6 +113,22 @@ class ConversationSerializer(serializers.ModelSerializer):
             'id', 'participant1', 'participant2', 'created_at', 'updated_at',
             'last_message_at'
         )
+        sparse_select_related = {
+            'job_title': ('job',),
+            'participant1_email': ('participant1',),
+            'participant1_name': ('participant1__profile',),
+            'participant2_email': ('participant2',),
+            'participant2_name': ('participant2__profile',),
+            'other_participant': ('participant1__profile', 'participant2__profile'),
+        }
+        sparse_prefetch_related = {
+            'last_message': (Prefetch(
+                'messages',
+                queryset=Message.objects.select_related('sender').order_by('-created_at')[:1],
+                to_attr='latest_messages',
+            ),),
+        }
+        sparse_annotations = {'unread_count': unread_count_annotations}
 
     def get_participant1_name(self, obj):
         if hasattr(obj.participant1, 'profile') and obj.participant1.profile:
@@ -107,7 +141,10 @@ class ConversationSerializer(serializers.ModelSerializer):
         return obj.participant2.email
 
     def get_last_message(self, obj):
-        last_message = obj.messages.last()
+        if hasattr(obj, 'latest_messages'):
+            last_message = obj.latest_messages[0] if obj.latest_messages else None
+        else:
+            last_message = obj.messages.last()
         if last_message:
             return {
                 'id': str(last_message.id),
@@ -118,6 +155,8 @@ class ConversationSerializer(serializers.ModelSerializer):
         return None
 
     def get_unread_count(self, obj):
+        if hasattr(obj, 'unread_messages'):
+            return obj.unread_messages
         request = self.context.get('request')
         if request and request.user:
             return obj.get_unread_count(request.user)
@@ -1,3 +1,37 @@
-from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+from accounts.models import User
+from .models import Conversation, Message
 
-# Create your tests here.
+
+class ConversationListSparseFieldsetTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('me@example.com', 'pw-123456', user_type='CLIENT')
+        self.client.force_authenticate(self.user)
+
+    def conversation(self, messages):
+        other = User.objects.create_user(f'other{Conversation.objects.count()}@example.com', 'pw-123456')
+        conversation = Conversation.objects.create(participant1=self.user, participant2=other)
+        for sender, content in messages:
+            Message.objects.create(conversation=conversation, sender=self.user if sender == 'me' else other, content=content)
+        return conversation
+
+    def list_conversations(self):
+        response = self.client.get('/api/v1/messaging/conversations/', {'fields': 'id,last_message,unread_count'})
+        self.assertEqual(response.status_code, 200)
+        return {row['id']: row for row in response.json()['results']}
+
+    def test_last_message_and_unread_count_use_a_fixed_number_of_queries(self):
+        self.conversation([('other', 'hi')])
+        with CaptureQueriesContext(connection) as one_row:
+            self.list_conversations()
+
+        busy = self.conversation([('other', 'one'), ('me', 'two'), ('other', 'three'), ('other', 'four')])
+        quiet = self.conversation([])
+        with self.assertNumQueries(len(one_row.captured_queries)):
+            rows = self.list_conversations()
+        self.assertEqual(rows[str(busy.pk)]['last_message']['content'], 'four')
+        self.assertEqual(rows[str(busy.pk)]['unread_count'], 3)
+        self.assertIsNone(rows[str(quiet.pk)]['last_message'])
+        self.assertEqual(rows[str(quiet.pk)]['unread_count'], 0)
@@ -4,6 +4,8 @@ from rest_framework.decorators import action
 from django.contrib.auth import get_user_model
 from django.db.models import Q
 from django.utils import timezone
+from skillspot.fieldsets import SparseFieldsetViewMixin
+from skillspot.pagination import OptionalChronologicalCursorPagination
 from .models import Conversation, Message, MessageAttachment
 from .serializers import (
     ConversationSerializer,
@@ -16,7 +18,7 @@ from .serializers import (
 User = get_user_model()
 
 
-class ConversationListCreateView(generics.ListCreateAPIView):
+class ConversationListCreateView(SparseFieldsetViewMixin, generics.ListCreateAPIView):
     serializer_class = ConversationSerializer
     permission_classes = [permissions.IsAuthenticated]
     filter_backends = [filters.OrderingFilter]
@@ -70,7 +72,7 @@ class ConversationListCreateView(generics.ListCreateAPIView):
         serializer.save(participant1=self.request.user)
 
 
-class ConversationDetailView(generics.RetrieveAPIView):
+class ConversationDetailView(SparseFieldsetViewMixin, generics.RetrieveAPIView):
     serializer_class = ConversationSerializer
     permission_classes = [permissions.IsAuthenticated]
     lookup_field = 'id'
@@ -90,6 +92,7 @@ class ConversationDetailView(generics.RetrieveAPIView):
 class MessageListCreateView(generics.ListCreateAPIView):
     serializer_class = MessageSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = OptionalChronologicalCursorPagination
 
     def get_queryset(self):
         conversation_id = self.kwargs.get('conversation_id')
@@ -32,8 +32,50 @@ def send_in_app_notification(
     return str(notification.id)
 
 
+def _bulk_create_notifications(items):
+    """items: iterable of dicts with recipient_id, title, message, link, actor_id."""
+    items = list(items)
+    if not items:
+        return []
+    user_ids = {str(i['recipient_id']) for i in items} | {str(i['actor_id']) for i in items if i.get('actor_id')}
+    existing = {str(pk) for pk in User.objects.filter(pk__in=user_ids).values_list('pk', flat=True)}
+    notifications = Notification.objects.bulk_create([
+        Notification(
+            recipient_id=item['recipient_id'],
+            title=item['title'],
+            message=item.get('message') or '',
+            link=item.get('link') or '',
+            actor_id=item['actor_id'] if str(item.get('actor_id')) in existing else None,
+        )
+        for item in items
+        if str(item['recipient_id']) in existing
+    ])
+    return [str(n.id) for n in notifications]
 
 
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def send_bulk_in_app_notification(
+    self,
+    recipient_ids,
+    title,
+    message='',
+    link='',
+    actor_id=None,
+):
+    """
+    Create the same in-app notification for many users with one insert:
+        send_bulk_in_app_notification.delay([id1, id2], 'Title', 'Message', link='/jobs/123/', actor_id=client_id)
+    """
+    return _bulk_create_notifications(
+        {'recipient_id': rid, 'title': title, 'message': message, 'link': link, 'actor_id': actor_id}
+        for rid in dict.fromkeys(str(r) for r in recipient_ids)
+    )
 
 
-
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=3)
+def send_in_app_notifications(self, notifications):
+    """
+    Create several different notifications with one insert. Each item is a dict with
+    recipient_id, title and optional message, link, actor_id.
+    """
+    return _bulk_create_notifications(notifications)
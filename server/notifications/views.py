@@ -2,6 +2,7 @@ from rest_framework import generics, permissions
 from rest_framework.response import Response
 from rest_framework import status
 from django.utils import timezone
+from skillspot.pagination import OptionalCursorPagination
 from .models import Notification
 from .serializers import NotificationSerializer, NotificationMarkReadSerializer
 
@@ -10,6 +11,7 @@ class NotificationListView(generics.ListAPIView):
     """List notifications for the current user (recipient)."""
     serializer_class = NotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = OptionalCursorPagination
 
     def get_queryset(self):
         return (
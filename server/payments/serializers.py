@@ -3,6 +3,7 @@ from django.contrib.auth import get_user_model
 from django.utils import timezone
 from .models import Payment, PaymentTransaction
 from contracts.models import Contract, ContractMilestone, TimeEntry
+from skillspot.fieldsets import SparseFieldsetSerializerMixin
 
 User = get_user_model()
 
@@ -17,7 +18,7 @@ class PaymentTransactionSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'payment', 'created_at')
 
 
-class PaymentSerializer(serializers.ModelSerializer):
+class PaymentSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     payer_email = serializers.EmailField(source='payer.email', read_only=True)
     payer_name = serializers.SerializerMethodField()
     recipient_email = serializers.EmailField(source='recipient.email', read_only=True)
@@ -43,6 +44,16 @@ class PaymentSerializer(serializers.ModelSerializer):
             'stripe_charge_id', 'stripe_refund_id', 'created_at', 'updated_at',
             'completed_at', 'failed_at'
         )
+        sparse_select_related = {
+            'contract_title': ('contract',),
+            'milestone_title': ('milestone',),
+            'time_entry_id': ('time_entry',),
+            'payer_email': ('payer',),
+            'payer_name': ('payer__profile',),
+            'recipient_email': ('recipient',),
+            'recipient_name': ('recipient__profile',),
+        }
+        sparse_prefetch_related = {'transactions': ('transactions',)}
 
     def get_payer_name(self, obj):
         if hasattr(obj.payer, 'profile') and obj.payer.profile:
@@ -9,7 +9,8 @@ from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from django.http import JsonResponse
 from django.utils import timezone
-from notifications.tasks import send_in_app_notification
+from notifications.tasks import send_in_app_notification, send_in_app_notifications
+from skillspot.fieldsets import SparseFieldsetViewMixin
 from .models import Payment, PaymentTransaction
 from contracts.models import Contract, ContractMilestone, TimeEntry
 from .serializers import (
@@ -24,7 +25,7 @@ from .serializers import (
 # Make sure to set STRIPE_SECRET_KEY and STRIPE_PUBLISHABLE_KEY in settings
 
 
-class PaymentListCreateView(generics.ListCreateAPIView):
+class PaymentListCreateView(SparseFieldsetViewMixin, generics.ListCreateAPIView):
     serializer_class = PaymentSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -83,7 +84,7 @@ class PaymentListCreateView(generics.ListCreateAPIView):
         serializer.save()
 
 
-class PaymentDetailView(generics.RetrieveAPIView):
+class PaymentDetailView(SparseFieldsetViewMixin, generics.RetrieveAPIView):
     serializer_class = PaymentSerializer
     permission_classes = [permissions.IsAuthenticated]
     lookup_field = 'id'
@@ -568,7 +569,7 @@ class ConfirmStripePaymentView(generics.GenericAPIView):
                 if hasattr(payment.recipient, 'profile') and hasattr(payment.recipient.profile, 'provider_profile'):
                     provider_profile = payment.recipient.profile.provider_profile
                     provider_profile.total_earnings += payment.provider_amount or payment.amount
-                    provider_profile.save()
+                    provider_profile.save(update_fields=['total_earnings', 'updated_at'])
 
                 # Create transaction record
                 PaymentTransaction.objects.create(
@@ -696,6 +697,7 @@ def stripe_webhook(request):
             print('[Stripe webhook] checkout.session.completed payment_ids=%r payment_intent=%s' % (payment_ids_list, payment_intent_id))
             logger.info('[Stripe webhook] checkout.session.completed payment_ids=%s payment_intent=%s', payment_ids_list, payment_intent_id)
             completed_any = False
+            notifications = []
             for pid in payment_ids_list:
                 try:
                     payment = Payment.objects.filter(id=pid).first()
@@ -726,15 +728,18 @@ def stripe_webhook(request):
                 if payment.time_entry:
                     payment.time_entry.status = TimeEntry.TimeEntryStatus.PAID
                     payment.time_entry.save(update_fields=['status', 'updated_at'])
-                send_in_app_notification.delay(
-                    str(payment.recipient_id),
-                    'Payment received',
-                    f'You received a payment of {payment.amount} {payment.currency or "ETB"} for "{payment.contract.title}".',
-                    link=f'/contracts/{payment.contract_id}/',
-                    actor_id=str(payment.payer_id),
-                )
+                notifications.append({
+                    'recipient_id': str(payment.recipient_id),
+                    'title': 'Payment received',
+                    'message': f'You received a payment of {payment.amount} {payment.currency or "ETB"} for "{payment.contract.title}".',
+                    'link': f'/contracts/{payment.contract_id}/',
+                    'actor_id': str(payment.payer_id),
+                })
                 completed_any = True
                 logger.info('[Stripe webhook] checkout.session.completed updated Payment id=%s to COMPLETED', payment.id)
+            if notifications:
+                # One broker message for the whole (possibly multi-payment) checkout
+                send_in_app_notifications.delay(notifications)
             if not completed_any and not payment_ids_list:
                 print('[Stripe webhook] checkout.session.completed WARNING: could not find Payment client_reference_id=%s' % payment_id)
                 logger.warning('[Stripe webhook] checkout.session.completed could not find Payment client_reference_id=%s', payment_id)
@@ -829,7 +834,7 @@ def stripe_webhook(request):
     return JsonResponse({'status': 'success'})
 
 
-class PaymentHistoryView(generics.ListAPIView):
+class PaymentHistoryView(SparseFieldsetViewMixin, generics.ListAPIView):
     """
     Get payment history for a user
     """
@@ -881,7 +886,7 @@ class StripeConnectOnboardView(generics.GenericAPIView):
 
             # Save account ID to provider profile
             provider_profile.stripe_account_id = result['account_id']
-            provider_profile.save()
+            provider_profile.save(update_fields=['stripe_account_id', 'updated_at'])
 
             return Response({
                 'account_id': result['account_id'],
@@ -937,7 +942,9 @@ class StripeConnectStatusView(generics.GenericAPIView):
                 account_status['charges_enabled'] and account_status['payouts_enabled']
             )
             provider_profile.stripe_onboarding_completed = account_status['details_submitted']
-            provider_profile.save()
+            provider_profile.save(update_fields=[
+                'stripe_account_enabled', 'stripe_onboarding_completed', 'updated_at',
+            ])
 
             return Response({
                 'has_account': True,
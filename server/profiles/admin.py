@@ -1,4 +1,5 @@
 from django.contrib import admin
+from skillspot.partial_save import PartialSaveModelAdmin
 from .models import Profile, ServiceProviderProfile, Tag, Experience
 
 
@@ -11,7 +12,7 @@ class ProfileAdmin(admin.ModelAdmin):
 
 
 @admin.register(ServiceProviderProfile)
-class ServiceProviderProfileAdmin(admin.ModelAdmin):
+class ServiceProviderProfileAdmin(PartialSaveModelAdmin):
     list_display = [
         'profile', 'hourly_rate', 'availability_status',
         'years_of_experience', 'service_radius', 'average_rating',
@@ -20,7 +21,11 @@ class ServiceProviderProfileAdmin(admin.ModelAdmin):
     list_filter = ['availability_status', 'portfolio_visibility', 'created_at']
     search_fields = ['profile__user__email', 'profile__location']
     filter_horizontal = ['skills', 'certifications', 'languages']
-    readonly_fields = ['id', 'total_jobs_completed', 'average_rating', 'total_earnings', 'created_at', 'updated_at']
+    readonly_fields = [
+        'id', 'total_jobs_completed', 'average_rating', 'bayesian_rating', 'rating_count',
+        'rating_sum', 'rating_1_count', 'rating_2_count', 'rating_3_count', 'rating_4_count',
+        'rating_5_count', 'total_earnings', 'created_at', 'updated_at'
+    ]
 
 
 @admin.register(Tag)
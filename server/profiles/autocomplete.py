@@ -0,0 +1,103 @@
+"""
+Tag autocomplete from a per-process prefix index.
+
+Each worker keeps every tag in memory as a sorted list of (key, tag) pairs,
+where the keys are the lowercased full name and each later word of it, so
+"plu" finds both "Plumbing" and "Emergency Plumbing". Lookups are a bisect
+per category. The index is rebuilt lazily when the shared tag catalog
+version (skillspot.cache_utils.tags_catalog_version) moves, so a tag write in
+any process reaches every worker on its next request. When no prefix
+matches, difflib close matches are returned instead, searched only among keys
+sharing the query's first letter and only for queries of FUZZY_MIN_LENGTH+.
+"""
+import difflib
+import threading
+from bisect import bisect_left
+from skillspot.cache_utils import tags_catalog_version
+from .models import Tag
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 25
+FUZZY_CUTOFF = 0.6
+FUZZY_MIN_LENGTH = 3
+ALL = None
+
+_lock = threading.Lock()
+# (version, keys, entries); never mutated, only replaced as a whole so readers
+# always see a consistent snapshot.
+_index = (None, {}, {})
+
+
+def _build(tags):
+    """Return (keys, entries) per category (plus ALL), both sorted by key."""
+    pairs = {ALL: []}
+    for tag in tags:
+        words = tag['name'].lower().split()
+        for i in range(len(words)):
+            key = ' '.join(words[i:])
+            # rank 0 = full-name match, 1 = later word; keeps full-name hits first on ties
+            entry = (key, 0 if i == 0 else 1, tag['name'].lower(), tag)
+            pairs[ALL].append(entry)
+            pairs.setdefault(tag['category'], []).append(entry)
+    entries = {}
+    for category, items in pairs.items():
+        items.sort(key=lambda item: item[:3])
+        entries[category] = items
+    keys = {category: [item[0] for item in items] for category, items in entries.items()}
+    return keys, entries
+
+
+def _current_index():
+    global _index
+    version = tags_catalog_version()
+    index = _index
+    if index[0] != version:
+        with _lock:
+            index = _index
+            if index[0] != version:
+                tags = Tag.objects.values('id', 'name', 'category', 'description')
+                keys, entries = _build([{**t, 'id': str(t['id'])} for t in tags])
+                index = _index = (version, keys, entries)
+    return index[1], index[2]
+
+
+def _unique(items, limit):
+    seen, results = set(), []
+    for item in items:
+        tag = item[3]
+        if tag['id'] not in seen:
+            seen.add(tag['id'])
+            results.append(tag)
+            if len(results) == limit:
+                break
+    return results
+
+
+def autocomplete_tags(query, category=None, limit=DEFAULT_LIMIT):
+    """Return up to limit tag dicts (id, name, category, description) matching query."""
+    all_keys, all_entries = _current_index()
+    category = category.upper() if category else ALL
+    keys, entries = all_keys.get(category, []), all_entries.get(category, [])
+    query = ' '.join((query or '').lower().split())
+    if not query:
+        return _unique((item for item in entries if item[1] == 0), limit)
+
+    start = bisect_left(keys, query)
+    matches = []
+    for i in range(start, len(keys)):
+        if not keys[i].startswith(query):
+            break
+        matches.append(entries[i])
+    if matches:
+        matches.sort(key=lambda item: (item[1], item[2]))
+        return _unique(matches, limit)
+
+    if len(query) < FUZZY_MIN_LENGTH:
+        return []
+    # Only keys sharing the first letter: a contiguous slice of the sorted keys.
+    lo = bisect_left(keys, query[0])
+    hi = bisect_left(keys, chr(ord(query[0]) + 1), lo)
+    close = set(difflib.get_close_matches(query, set(keys[lo:hi]), n=limit * 2, cutoff=FUZZY_CUTOFF))
+    fuzzy = [item for item in entries[lo:hi] if item[0] in close]
+    fuzzy.sort(key=lambda item: (-difflib.SequenceMatcher(None, query, item[0]).ratio(), item[1], item[2]))
+    return _unique(fuzzy, limit)
@@ -0,0 +1,66 @@
+"""
+Avatar derivatives: square thumbnails in JPEG and WebP at fixed sizes.
+
+Files are named after a hash of their own bytes (avatars/derived/<sha256>.<ext>),
+so a given name never changes content and can be served with a far-future
+cache lifetime. Profile.avatar_variants records what was generated:
+
+    {'source': 'avatars/me.png', 'sizes': {'small': {'jpeg': name, 'webp': name}, ...}}
+
+Variants are only exposed while 'source' matches the current avatar.
+"""
+import hashlib
+from io import BytesIO
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps
+
+AVATAR_SIZES = {'small': 64, 'medium': 160, 'large': 400}
+DERIVED_DIR = 'avatars/derived'
+JPEG_QUALITY = 85
+WEBP_QUALITY = 80
+
+
+def _store(data, extension):
+    name = f"{DERIVED_DIR}/{hashlib.sha256(data).hexdigest()}.{extension}"
+    if not default_storage.exists(name):
+        name = default_storage.save(name, ContentFile(data))
+    return name
+
+
+def _encode(image, fmt, **options):
+    buffer = BytesIO()
+    image.save(buffer, fmt, **options)
+    return buffer.getvalue()
+
+
+def build_avatar_variants(source):
+    """Generate every size/format from an open image file; returns the 'sizes' mapping."""
+    with Image.open(source) as original:
+        original = ImageOps.exif_transpose(original)
+        has_alpha = original.mode in ('RGBA', 'LA') or 'transparency' in original.info
+        base = original.convert('RGBA' if has_alpha else 'RGB')
+    sizes = {}
+    for label, size in AVATAR_SIZES.items():
+        thumb = ImageOps.fit(base, (size, size), Image.Resampling.LANCZOS)
+        if has_alpha:
+            flattened = Image.new('RGB', thumb.size, (255, 255, 255))
+            flattened.paste(thumb, mask=thumb.getchannel('A'))
+        else:
+            flattened = thumb
+        sizes[label] = {
+            'jpeg': _store(_encode(flattened, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True), 'jpg'),
+            'webp': _store(_encode(thumb, 'WEBP', quality=WEBP_QUALITY, method=6), 'webp'),
+        }
+    return sizes
+
+
+def avatar_variant_urls(profile):
+    """{'small': {'jpeg': url, 'webp': url}, ...} for the current avatar, or {} while pending."""
+    variants = profile.avatar_variants or {}
+    if not profile.avatar or variants.get('source') != profile.avatar.name:
+        return {}
+    return {
+        label: {fmt: default_storage.url(name) for fmt, name in formats.items()}
+        for label, formats in variants.get('sizes', {}).items()
+    }
@@ -0,0 +1,74 @@
+"""
+Request-scoped access to the current user's Profile and ServiceProviderProfile.
+
+get_user_context(request) loads the profile and provider profile in one
+joined query on first use (the user itself comes from authentication) and
+memoizes the result on the request, so every view, serializer or helper
+handling the same request shares it. Reads never create rows; write paths
+call ensure_profile() / ensure_provider_profile(). (The one exception is
+ServiceProviderProfileView, which backfills a provider-type user's row.)
+"""
+from django.core.exceptions import ObjectDoesNotExist
+from .models import Profile, ServiceProviderProfile
+
+_UNSET = object()
+
+
+class UserContext:
+    def __init__(self, user):
+        self.user = user
+        self._profile = _UNSET
+        self._provider_profile = _UNSET
+
+    def _load(self):
+        profile = Profile.objects.select_related('provider_profile').filter(user=self.user).first()
+        provider_profile = None
+        if profile is not None:
+            profile.user = self.user
+            try:
+                provider_profile = profile.provider_profile
+            except ObjectDoesNotExist:
+                pass
+        self._profile, self._provider_profile = profile, provider_profile
+
+    @property
+    def profile(self):
+        if self._profile is _UNSET:
+            self._load()
+        return self._profile
+
+    @property
+    def provider_profile(self):
+        if self._provider_profile is _UNSET:
+            self._load()
+        return self._provider_profile
+
+    def ensure_profile(self):
+        """Return the profile, creating it if missing (write paths only)."""
+        if self.profile is None:
+            self._profile, _ = Profile.objects.get_or_create(
+                user=self.user,
+                defaults={
+                    'first_name': self.user.first_name or '',
+                    'last_name': self.user.last_name or '',
+                },
+            )
+        return self._profile
+
+    def ensure_provider_profile(self):
+        """Return the provider profile, creating it (and the profile) if missing."""
+        if self.provider_profile is None:
+            self._provider_profile, _ = ServiceProviderProfile.objects.get_or_create(
+                profile=self.ensure_profile()
+            )
+        return self._provider_profile
+
+
+def get_user_context(request):
+    """The UserContext for request.user, created once per request."""
+    http_request = getattr(request, '_request', request)
+    context = getattr(http_request, '_user_context', None)
+    if context is None or context.user.pk != request.user.pk:
+        context = UserContext(request.user)
+        http_request._user_context = context
+    return context
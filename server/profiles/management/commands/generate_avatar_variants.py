@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from profiles.models import Profile
+from profiles.tasks import generate_avatar_variants
+
+
+class Command(BaseCommand):
+    help = 'Queue avatar thumbnail/WebP generation for profiles whose variants are missing or stale.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        rows = (
+            Profile.objects.exclude(avatar='').exclude(avatar__isnull=True)
+            .order_by('pk').values_list('pk', 'avatar', 'avatar_variants')
+        )
+        queued = 0
+        for profile_id, avatar_name, variants in rows.iterator(chunk_size=options['chunk_size']):
+            if (variants or {}).get('source') != avatar_name:
+                generate_avatar_variants.delay(str(profile_id), avatar_name)
+                queued += 1
+        self.stdout.write(self.style.SUCCESS(f'Queued {queued} avatar variant jobs.'))
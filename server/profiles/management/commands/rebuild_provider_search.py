@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from profiles.models import ProviderSearchDocument, ServiceProviderProfile
+from profiles.search import sync_provider_search_document
+
+
+class Command(BaseCommand):
+    help = 'Rebuild ProviderSearchDocument rows from provider profiles.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        ids = ServiceProviderProfile.objects.order_by('pk').values_list('pk', flat=True)
+        total = 0
+        for provider_profile_id in ids.iterator(chunk_size=options['chunk_size']):
+            sync_provider_search_document(provider_profile_id)
+            total += 1
+        self.stdout.write(self.style.SUCCESS(
+            f'Synced {total} provider search documents ({ProviderSearchDocument.objects.count()} total).'
+        ))
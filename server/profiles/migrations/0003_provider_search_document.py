@@ -0,0 +1,76 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# Postgres only: GIN indexes so skills/certifications/languages containment
+# filters (jsonb @>) are served by an index. SQLite falls back to a scan.
+JSONB_GIN_INDEXES = [
+    ('profiles_psd_skills_gin', 'skills'),
+    ('profiles_psd_certifications_gin', 'certifications'),
+    ('profiles_psd_languages_gin', 'languages'),
+]
+
+
+def create_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, column in JSONB_GIN_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX {name} ON profiles_providersearchdocument USING gin ({column} jsonb_path_ops)'
+        )
+
+
+def drop_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _ in JSONB_GIN_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0002_seed_skill_tags'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='latitude',
+            field=models.DecimalField(blank=True, decimal_places=6, help_text='Latitude used for provider search by distance', max_digits=9, null=True),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='longitude',
+            field=models.DecimalField(blank=True, decimal_places=6, help_text='Longitude used for provider search by distance', max_digits=9, null=True),
+        ),
+        migrations.CreateModel(
+            name='ProviderSearchDocument',
+            fields=[
+                ('provider_profile', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='profiles.serviceproviderprofile')),
+                ('user_id', models.UUIDField(db_index=True)),
+                ('full_name', models.CharField(max_length=201)),
+                ('avatar', models.CharField(blank=True, max_length=255)),
+                ('location', models.CharField(blank=True, max_length=200)),
+                ('latitude', models.DecimalField(blank=True, decimal_places=6, max_digits=9, null=True)),
+                ('longitude', models.DecimalField(blank=True, decimal_places=6, max_digits=9, null=True)),
+                ('skills', models.JSONField(blank=True, default=list)),
+                ('certifications', models.JSONField(blank=True, default=list)),
+                ('languages', models.JSONField(blank=True, default=list)),
+                ('hourly_rate', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('availability_status', models.CharField(choices=[('AVAILABLE', 'Available'), ('BUSY', 'Busy'), ('UNAVAILABLE', 'Unavailable')], max_length=20)),
+                ('years_of_experience', models.PositiveIntegerField(blank=True, null=True)),
+                ('average_rating', models.DecimalField(decimal_places=2, default=0.0, max_digits=3)),
+                ('total_jobs_completed', models.PositiveIntegerField(default=0)),
+                ('is_searchable', models.BooleanField(default=True, help_text='Provider account, active and portfolio visible')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['-average_rating', '-total_jobs_completed'],
+                'indexes': [models.Index(fields=['is_searchable', '-average_rating', '-total_jobs_completed'], name='profiles_pr_is_sear_0fb670_idx'), models.Index(fields=['is_searchable', 'availability_status', '-average_rating'], name='profiles_pr_is_sear_d63b63_idx'), models.Index(fields=['is_searchable', 'hourly_rate'], name='profiles_pr_is_sear_44e9f2_idx'), models.Index(fields=['is_searchable', '-years_of_experience'], name='profiles_pr_is_sear_3fb4dd_idx'), models.Index(fields=['latitude', 'longitude'], name='profiles_pr_latitud_d8bd25_idx')],
+            },
+        ),
+        migrations.RunPython(create_gin_indexes, drop_gin_indexes),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations
+
+PROVIDER_USER_TYPES = ('PROVIDER', 'BOTH')
+
+
+def backfill_profiles(apps, schema_editor):
+    """Create the Profile / ServiceProviderProfile rows profile reads used to create on demand."""
+    User = apps.get_model('accounts', 'User')
+    Profile = apps.get_model('profiles', 'Profile')
+    ServiceProviderProfile = apps.get_model('profiles', 'ServiceProviderProfile')
+
+    missing_users = User.objects.filter(profile__isnull=True).values_list('id', 'first_name', 'last_name')
+    Profile.objects.bulk_create(
+        [Profile(user_id=uid, first_name=first or '', last_name=last or '') for uid, first, last in missing_users],
+        batch_size=500,
+    )
+    profile_ids = Profile.objects.filter(
+        user__user_type__in=PROVIDER_USER_TYPES, provider_profile__isnull=True
+    ).values_list('id', flat=True)
+    ServiceProviderProfile.objects.bulk_create(
+        [ServiceProviderProfile(profile_id=pid) for pid in profile_ids],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('profiles', '0003_provider_search_document'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_profiles, migrations.RunPython.noop),
+    ]
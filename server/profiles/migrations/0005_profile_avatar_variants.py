@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0004_backfill_profiles'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='avatar_variants',
+            field=models.JSONField(blank=True, default=dict, help_text='Generated avatar thumbnails (see profiles.avatars)'),
+        ),
+    ]
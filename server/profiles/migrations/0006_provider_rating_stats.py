@@ -0,0 +1,127 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:26
+
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+# Frozen copies of ServiceProviderProfile.RATING_PRIOR_MEAN / RATING_PRIOR_WEIGHT.
+PRIOR_MEAN = 3.5
+PRIOR_WEIGHT = 5
+
+
+def backfill_rating_stats(apps, schema_editor):
+    Rating = apps.get_model('ratings', 'Rating')
+    ServiceProviderProfile = apps.get_model('profiles', 'ServiceProviderProfile')
+    ProviderSearchDocument = apps.get_model('profiles', 'ProviderSearchDocument')
+
+    stats = (
+        Rating.objects.filter(rating_type='CLIENT_TO_PROVIDER')
+        .order_by()
+        .values('rated_user_id')
+        .annotate(
+            total=Count('id'),
+            score_sum=Sum('score'),
+            **{f'stars_{star}': Count('id', filter=Q(score=star)) for star in range(1, 6)},
+        )
+    )
+    for row in stats.iterator():
+        count, total = row['total'], row['score_sum'] or 0
+        average = Decimal(total / count if count else 0).quantize(Decimal('0.01'))
+        bayesian = Decimal(
+            (total + PRIOR_MEAN * PRIOR_WEIGHT) / (count + PRIOR_WEIGHT)
+        ).quantize(Decimal('0.001'))
+        ServiceProviderProfile.objects.filter(profile__user_id=row['rated_user_id']).update(
+            rating_count=count,
+            rating_sum=total,
+            average_rating=average,
+            bayesian_rating=bayesian,
+            **{f'rating_{star}_count': row[f'stars_{star}'] for star in range(1, 6)},
+        )
+        ProviderSearchDocument.objects.filter(user_id=row['rated_user_id']).update(
+            average_rating=average, bayesian_rating=bayesian,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0005_profile_avatar_variants'),
+        ('ratings', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='providersearchdocument',
+            options={'ordering': ['-bayesian_rating', '-total_jobs_completed']},
+        ),
+        migrations.AlterModelOptions(
+            name='serviceproviderprofile',
+            options={'ordering': ['-bayesian_rating', '-total_jobs_completed']},
+        ),
+        migrations.RemoveIndex(
+            model_name='providersearchdocument',
+            name='profiles_pr_is_sear_0fb670_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='providersearchdocument',
+            name='profiles_pr_is_sear_d63b63_idx',
+        ),
+        migrations.AddField(
+            model_name='providersearchdocument',
+            name='bayesian_rating',
+            field=models.DecimalField(decimal_places=3, default=3.5, max_digits=4),
+        ),
+        migrations.AddField(
+            model_name='serviceproviderprofile',
+            name='bayesian_rating',
+            field=models.DecimalField(decimal_places=3, default=3.5, help_text='Average rating shrunk towards the prior mean; used for ranking', max_digits=4),
+        ),
+        migrations.AddField(
+            model_name='serviceproviderprofile',
+            name='rating_1_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='serviceproviderprofile',
+            name='rating_2_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='serviceproviderprofile',
+            name='rating_3_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='serviceproviderprofile',
+            name='rating_4_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='serviceproviderprofile',
+            name='rating_5_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='serviceproviderprofile',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='serviceproviderprofile',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='providersearchdocument',
+            index=models.Index(fields=['is_searchable', '-bayesian_rating', '-total_jobs_completed'], name='profiles_pr_is_sear_c02058_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='providersearchdocument',
+            index=models.Index(fields=['is_searchable', 'availability_status', '-bayesian_rating'], name='profiles_pr_is_sear_3b12fd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='serviceproviderprofile',
+            index=models.Index(fields=['-bayesian_rating', '-total_jobs_completed'], name='profiles_se_bayesia_22c904_idx'),
+        ),
+        migrations.RunPython(backfill_rating_stats, migrations.RunPython.noop),
+    ]
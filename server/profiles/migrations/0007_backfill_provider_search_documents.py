@@ -0,0 +1,65 @@
+from django.db import migrations
+
+PROVIDER_USER_TYPES = ('PROVIDER', 'BOTH')
+BATCH_SIZE = 500
+
+
+def _tag_list(tags):
+    return [{'id': str(tag.id), 'name': tag.name} for tag in tags]
+
+
+def backfill_search_documents(apps, schema_editor):
+    """Create search documents for providers that predate them (or were bulk-created in 0004)."""
+    ServiceProviderProfile = apps.get_model('profiles', 'ServiceProviderProfile')
+    ProviderSearchDocument = apps.get_model('profiles', 'ProviderSearchDocument')
+
+    providers = (
+        ServiceProviderProfile.objects.filter(search_document__isnull=True)
+        .select_related('profile__user')
+        .prefetch_related('skills', 'certifications', 'languages')
+        .order_by('pk')
+    )
+    documents = []
+    for provider in providers.iterator(chunk_size=BATCH_SIZE):
+        profile = provider.profile
+        user = profile.user
+        full_name = f"{profile.first_name} {profile.last_name}".strip() or user.email
+        documents.append(ProviderSearchDocument(
+            provider_profile_id=provider.pk,
+            user_id=user.id,
+            full_name=full_name,
+            avatar=profile.avatar.name if profile.avatar else '',
+            location=profile.location,
+            latitude=profile.latitude,
+            longitude=profile.longitude,
+            skills=_tag_list(provider.skills.all()),
+            certifications=_tag_list(provider.certifications.all()),
+            languages=_tag_list(provider.languages.all()),
+            hourly_rate=provider.hourly_rate,
+            availability_status=provider.availability_status,
+            years_of_experience=provider.years_of_experience,
+            average_rating=provider.average_rating,
+            bayesian_rating=provider.bayesian_rating,
+            total_jobs_completed=provider.total_jobs_completed,
+            is_searchable=(
+                user.is_active
+                and user.user_type in PROVIDER_USER_TYPES
+                and provider.portfolio_visibility
+            ),
+        ))
+        if len(documents) >= BATCH_SIZE:
+            ProviderSearchDocument.objects.bulk_create(documents)
+            documents = []
+    if documents:
+        ProviderSearchDocument.objects.bulk_create(documents)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0006_provider_rating_stats'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_search_documents, migrations.RunPython.noop),
+    ]
@@ -27,9 +27,28 @@ class Profile(models.Model):
         blank=True,
         null=True
     )
+    avatar_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text=_('Generated avatar thumbnails (see profiles.avatars)')
+    )
     bio = models.TextField(blank=True)
     location = models.CharField(max_length=200, blank=True)
     address = models.TextField(blank=True)
+    latitude = models.DecimalField(
+        max_digits=9,
+        decimal_places=6,
+        null=True,
+        blank=True,
+        help_text=_('Latitude used for provider search by distance')
+    )
+    longitude = models.DecimalField(
+        max_digits=9,
+        decimal_places=6,
+        null=True,
+        blank=True,
+        help_text=_('Longitude used for provider search by distance')
+    )
     timezone = models.CharField(max_length=50, default='UTC')
     is_verified = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -140,6 +159,20 @@ class ServiceProviderProfile(models.Model):
         default=0.00,
         validators=[MinValueValidator(0), MaxValueValidator(5)]
     )
+    # Running totals over CLIENT_TO_PROVIDER ratings, maintained by adjust_rating_stats().
+    rating_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    rating_1_count = models.PositiveIntegerField(default=0)
+    rating_2_count = models.PositiveIntegerField(default=0)
+    rating_3_count = models.PositiveIntegerField(default=0)
+    rating_4_count = models.PositiveIntegerField(default=0)
+    rating_5_count = models.PositiveIntegerField(default=0)
+    bayesian_rating = models.DecimalField(
+        max_digits=4,
+        decimal_places=3,
+        default=3.5,
+        help_text=_('Average rating shrunk towards the prior mean; used for ranking')
+    )
     total_earnings = models.DecimalField(
         max_digits=12,
         decimal_places=2,
@@ -162,8 +195,20 @@ class ServiceProviderProfile(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Bayesian prior: a provider is treated as having RATING_PRIOR_WEIGHT extra
+    # ratings of RATING_PRIOR_MEAN, so a few 5-star reviews don't outrank many 4.8s.
+    RATING_PRIOR_MEAN = 3.5
+    RATING_PRIOR_WEIGHT = 5
+    RATING_STAR_FIELDS = tuple(f'rating_{star}_count' for star in range(1, 6))
+    RATING_FIELDS = (
+        ('rating_count', 'rating_sum') + RATING_STAR_FIELDS + ('average_rating', 'bayesian_rating')
+    )
+
     class Meta:
-        ordering = ['-average_rating', '-total_jobs_completed']
+        ordering = ['-bayesian_rating', '-total_jobs_completed']
+        indexes = [
+            models.Index(fields=['-bayesian_rating', '-total_jobs_completed']),
+        ]
 
     def __str__(self):
         return f"{self.profile.user.email}'s Provider Profile"
@@ -172,6 +217,67 @@ class ServiceProviderProfile(models.Model):
     def user(self):
         return self.profile.user
 
+    @property
+    def rating_histogram(self):
+        return {str(star): getattr(self, f'rating_{star}_count') for star in range(1, 6)}
+
+    @classmethod
+    def rating_score_expressions(cls, rating_sum, rating_count):
+        """(average_rating, bayesian_rating) as SQL expressions of a sum and a count."""
+        from django.db.models import FloatField, Value
+        from django.db.models.functions import Cast, Coalesce, NullIf
+        total = Cast(rating_sum, FloatField())
+        average = Coalesce(total / NullIf(rating_count, 0), Value(0.0))
+        bayesian = (
+            (total + Value(cls.RATING_PRIOR_MEAN * cls.RATING_PRIOR_WEIGHT))
+            / (rating_count + cls.RATING_PRIOR_WEIGHT)
+        )
+        return average, bayesian
+
+    @classmethod
+    def compute_rating_scores(cls, rating_sum, rating_count):
+        """Python counterpart of rating_score_expressions() for recounts."""
+        from decimal import Decimal
+        average = rating_sum / rating_count if rating_count else 0
+        bayesian = (
+            (rating_sum + cls.RATING_PRIOR_MEAN * cls.RATING_PRIOR_WEIGHT)
+            / (rating_count + cls.RATING_PRIOR_WEIGHT)
+        )
+        return Decimal(average).quantize(Decimal('0.01')), Decimal(bayesian).quantize(Decimal('0.001'))
+
+    @classmethod
+    def adjust_rating_stats(cls, user_id, added=None, removed=None):
+        """
+        Atomically apply one rating change to the provider's stats: added/removed
+        are the new/old scores (an edit passes both). The averages are recomputed
+        from the updated totals in the same UPDATE, and copied to the provider's
+        search document so ranking there stays current.
+        """
+        from django.db.models import F, OuterRef, Subquery
+        from django.db.models.functions import Greatest
+        if added == removed:
+            return
+        count_delta = (1 if added is not None else 0) - (1 if removed is not None else 0)
+        rating_count = Greatest(F('rating_count') + count_delta, 0)
+        rating_sum = Greatest(F('rating_sum') + (added or 0) - (removed or 0), 0)
+        average, bayesian = cls.rating_score_expressions(rating_sum, rating_count)
+        updates = {
+            'rating_count': rating_count,
+            'rating_sum': rating_sum,
+            'average_rating': average,
+            'bayesian_rating': bayesian,
+        }
+        for score, delta in ((added, 1), (removed, -1)):
+            if score is not None:
+                field = f'rating_{score}_count'
+                updates[field] = Greatest(F(field) + delta, 0)
+        if cls.objects.filter(profile__user_id=user_id).update(**updates):
+            provider = cls.objects.filter(pk=OuterRef('provider_profile_id'))
+            ProviderSearchDocument.objects.filter(user_id=user_id).update(
+                average_rating=Subquery(provider.values('average_rating')[:1]),
+                bayesian_rating=Subquery(provider.values('bayesian_rating')[:1]),
+            )
+
 
 class Experience(models.Model):
     id = models.UUIDField(
@@ -208,3 +314,53 @@ class Experience(models.Model):
             raise ValidationError('End date must be after start date.')
         if self.is_current and self.end_date:
             raise ValidationError('Current position cannot have an end date.')
+
+
+class ProviderSearchDocument(models.Model):
+    """
+    Denormalized, join-free copy of a provider's searchable data.
+    Kept in sync by profiles.signals; rebuild with `manage.py rebuild_provider_search`.
+    Tag lists are stored as [{"id": ..., "name": ...}] JSON arrays.
+    """
+    provider_profile = models.OneToOneField(
+        ServiceProviderProfile,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='search_document'
+    )
+    user_id = models.UUIDField(db_index=True)
+    full_name = models.CharField(max_length=201)
+    avatar = models.CharField(max_length=255, blank=True)
+    location = models.CharField(max_length=200, blank=True)
+    latitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+    longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+    skills = models.JSONField(default=list, blank=True)
+    certifications = models.JSONField(default=list, blank=True)
+    languages = models.JSONField(default=list, blank=True)
+    hourly_rate = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+    availability_status = models.CharField(
+        max_length=20,
+        choices=ServiceProviderProfile.AvailabilityStatus.choices
+    )
+    years_of_experience = models.PositiveIntegerField(null=True, blank=True)
+    average_rating = models.DecimalField(max_digits=3, decimal_places=2, default=0.00)
+    bayesian_rating = models.DecimalField(max_digits=4, decimal_places=3, default=3.5)
+    total_jobs_completed = models.PositiveIntegerField(default=0)
+    is_searchable = models.BooleanField(
+        default=True,
+        help_text=_('Provider account, active and portfolio visible')
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-bayesian_rating', '-total_jobs_completed']
+        indexes = [
+            models.Index(fields=['is_searchable', '-bayesian_rating', '-total_jobs_completed']),
+            models.Index(fields=['is_searchable', 'availability_status', '-bayesian_rating']),
+            models.Index(fields=['is_searchable', 'hourly_rate']),
+            models.Index(fields=['is_searchable', '-years_of_experience']),
+            models.Index(fields=['latitude', 'longitude']),
+        ]
+
+    def __str__(self):
+        return f"Search document for {self.full_name}"
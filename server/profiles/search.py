@@ -0,0 +1,145 @@
+"""
+Provider discovery over ProviderSearchDocument.
+
+Documents are rebuilt from the normalized profile tables on every relevant
+write (see profiles.signals), so searches filter and sort a single table.
+"""
+import uuid
+from django.db import connection
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from .models import ProviderSearchDocument, ServiceProviderProfile
+
+PROVIDER_USER_TYPES = ('PROVIDER', 'BOTH')
+
+ORDERING_FIELDS = {
+    'rating': ('bayesian_rating', 'total_jobs_completed'),
+    'rate': ('hourly_rate',),
+    'experience': ('years_of_experience',),
+    'jobs': ('total_jobs_completed',),
+}
+DEFAULT_ORDERING = ('-bayesian_rating', '-total_jobs_completed')
+
+
+def _tag_list(tags):
+    return [{'id': str(tag.id), 'name': tag.name} for tag in tags]
+
+
+def sync_provider_search_document(provider_profile_id):
+    """Create, refresh or (if the provider is gone) ignore the search document for one provider."""
+    provider_profile = (
+        ServiceProviderProfile.objects.filter(pk=provider_profile_id)
+        .select_related('profile__user')
+        .prefetch_related('skills', 'certifications', 'languages')
+        .first()
+    )
+    if provider_profile is None:
+        return None
+    profile = provider_profile.profile
+    user = profile.user
+    document, _ = ProviderSearchDocument.objects.update_or_create(
+        provider_profile=provider_profile,
+        defaults={
+            'user_id': user.id,
+            'full_name': profile.full_name,
+            'avatar': profile.avatar.name if profile.avatar else '',
+            'location': profile.location,
+            'latitude': profile.latitude,
+            'longitude': profile.longitude,
+            'skills': _tag_list(provider_profile.skills.all()),
+            'certifications': _tag_list(provider_profile.certifications.all()),
+            'languages': _tag_list(provider_profile.languages.all()),
+            'hourly_rate': provider_profile.hourly_rate,
+            'availability_status': provider_profile.availability_status,
+            'years_of_experience': provider_profile.years_of_experience,
+            'average_rating': provider_profile.average_rating,
+            'bayesian_rating': provider_profile.bayesian_rating,
+            'total_jobs_completed': provider_profile.total_jobs_completed,
+            'is_searchable': (
+                user.is_active
+                and user.user_type in PROVIDER_USER_TYPES
+                and provider_profile.portfolio_visibility
+            ),
+        },
+    )
+    return document
+
+
+def _parse_uuid_list(value, param):
+    ids = []
+    for raw in value.split(','):
+        raw = raw.strip()
+        if not raw:
+            continue
+        try:
+            ids.append(str(uuid.UUID(raw)))
+        except ValueError:
+            raise ValidationError({param: f'"{raw}" is not a valid id.'})
+    return ids
+
+
+def _parse_number(value, param):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValidationError({param: f'{param} must be a number.'})
+
+
+def _filter_tags(queryset, field, tag_ids):
+    """Require every tag id in the JSON tag list. Uses the jsonb GIN index on Postgres."""
+    for tag_id in tag_ids:
+        if connection.vendor == 'postgresql':
+            queryset = queryset.filter(**{f'{field}__contains': [{'id': tag_id}]})
+        else:
+            queryset = queryset.filter(**{f'{field}__icontains': tag_id})
+    return queryset
+
+
+def search_providers(params):
+    """
+    Filter and order searchable provider documents from query params:
+    q, skill, certification, language (comma-separated ids, all required),
+    availability, min_rating, min_rate, max_rate, near/radius_km and ordering
+    (rating, rate, experience, jobs, distance; prefix '-' for descending).
+    """
+    from jobs.geo import filter_near, parse_near, parse_radius_km
+
+    queryset = ProviderSearchDocument.objects.filter(is_searchable=True)
+
+    q = params.get('q', '').strip()
+    if q:
+        queryset = queryset.filter(Q(full_name__icontains=q) | Q(location__icontains=q))
+
+    for param, field in (('skill', 'skills'), ('certification', 'certifications'), ('language', 'languages')):
+        value = params.get(param)
+        if value:
+            queryset = _filter_tags(queryset, field, _parse_uuid_list(value, param))
+
+    availability = params.get('availability')
+    if availability:
+        queryset = queryset.filter(availability_status=availability.upper())
+
+    min_rating = params.get('min_rating')
+    if min_rating:
+        queryset = queryset.filter(average_rating__gte=_parse_number(min_rating, 'min_rating'))
+    min_rate = params.get('min_rate')
+    if min_rate:
+        queryset = queryset.filter(hourly_rate__gte=_parse_number(min_rate, 'min_rate'))
+    max_rate = params.get('max_rate')
+    if max_rate:
+        queryset = queryset.filter(hourly_rate__lte=_parse_number(max_rate, 'max_rate'))
+
+    near = params.get('near')
+    if near:
+        lat, lng = parse_near(near)
+        queryset = filter_near(queryset, lat, lng, parse_radius_km(params.get('radius_km')))
+
+    ordering = params.get('ordering', '')
+    descending = ordering.startswith('-')
+    name = ordering.lstrip('-')
+    if name == 'distance' and near:
+        return queryset.order_by('-distance_km' if descending else 'distance_km', *DEFAULT_ORDERING)
+    if name in ORDERING_FIELDS:
+        prefix = '-' if descending else ''
+        return queryset.order_by(*[f'{prefix}{f}' for f in ORDERING_FIELDS[name]], 'pk')
+    return queryset.order_by(*DEFAULT_ORDERING, 'pk')
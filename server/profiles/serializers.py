@@ -1,6 +1,9 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
-from .models import Profile, ServiceProviderProfile, Tag, Experience
+from skillspot.partial_save import PartialUpdateSerializerMixin
+from skillspot.relations import BatchedPrimaryKeyRelatedField
+from .avatars import avatar_variant_urls
+from .models import Profile, ServiceProviderProfile, Tag, Experience, ProviderSearchDocument
 
 User = get_user_model()
 
@@ -17,13 +20,15 @@ class ProfileSerializer(serializers.ModelSerializer):
     email = serializers.EmailField(source='user.email', read_only=True)
     user_type = serializers.CharField(source='user.user_type', read_only=True)
     full_name = serializers.ReadOnlyField()
+    avatar_variants = serializers.SerializerMethodField()
 
     class Meta:
         model = Profile
         fields = (
             'id', 'email', 'user_type', 'first_name', 'last_name',
-            'full_name', 'phone_number', 'avatar', 'bio', 'location',
-            'address', 'timezone', 'is_verified', 'created_at', 'updated_at'
+            'full_name', 'phone_number', 'avatar', 'avatar_variants', 'bio', 'location',
+            'address', 'latitude', 'longitude', 'timezone', 'is_verified',
+            'created_at', 'updated_at'
         )
         read_only_fields = ('id', 'created_at', 'updated_at')
 
@@ -38,6 +43,14 @@ class ProfileSerializer(serializers.ModelSerializer):
             data['avatar'] = request.build_absolute_uri(instance.avatar.url)
         return data
 
+    def get_avatar_variants(self, obj):
+        # Empty until generate_avatar_variants has run for the current avatar.
+        request = self.context.get('request')
+        return {
+            label: {fmt: request.build_absolute_uri(url) if request else url for fmt, url in formats.items()}
+            for label, formats in avatar_variant_urls(obj).items()
+        }
+
     def validate_avatar(self, value):
         if value:
             if value.size > 5 * 1024 * 1024:
@@ -91,21 +104,21 @@ class ServiceProviderProfileSerializer(serializers.ModelSerializer):
     languages = TagSerializer(many=True, read_only=True)
     experiences = ExperienceSerializer(many=True, read_only=True)
     
-    skill_ids = serializers.PrimaryKeyRelatedField(
+    skill_ids = BatchedPrimaryKeyRelatedField(
         many=True,
         queryset=Tag.objects.filter(category=Tag.TagCategory.SKILL),
         write_only=True,
         required=False,
         source='skills'
     )
-    certification_ids = serializers.PrimaryKeyRelatedField(
+    certification_ids = BatchedPrimaryKeyRelatedField(
         many=True,
         queryset=Tag.objects.filter(category=Tag.TagCategory.CERTIFICATION),
         write_only=True,
         required=False,
         source='certifications'
     )
-    language_ids = serializers.PrimaryKeyRelatedField(
+    language_ids = BatchedPrimaryKeyRelatedField(
         many=True,
         queryset=Tag.objects.filter(category=Tag.TagCategory.LANGUAGE),
         write_only=True,
@@ -120,29 +133,94 @@ class ServiceProviderProfileSerializer(serializers.ModelSerializer):
             'years_of_experience', 'service_radius', 'skills',
             'certifications', 'languages', 'skill_ids', 'certification_ids',
             'language_ids', 'portfolio_visibility', 'total_jobs_completed',
-            'average_rating', 'total_earnings', 'experiences',
-            'created_at', 'updated_at'
+            'average_rating', 'rating_count', 'rating_histogram',
+            'total_earnings', 'experiences', 'created_at', 'updated_at'
         )
         read_only_fields = (
-            'id', 'total_jobs_completed', 'average_rating',
+            'id', 'total_jobs_completed', 'average_rating', 'rating_count',
             'total_earnings', 'created_at', 'updated_at'
         )
 
 
-class ServiceProviderProfileUpdateSerializer(serializers.ModelSerializer):
-    skill_ids = serializers.PrimaryKeyRelatedField(
+class PublicProfileSerializer(serializers.ModelSerializer):
+    """Profile fields safe to show to anyone (no contact details)."""
+    user_id = serializers.UUIDField(read_only=True)
+    full_name = serializers.SerializerMethodField()
+    avatar = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Profile
+        fields = (
+            'user_id', 'first_name', 'last_name', 'full_name', 'avatar',
+            'bio', 'location', 'is_verified'
+        )
+        read_only_fields = fields
+
+    def get_full_name(self, obj):
+        first = obj.first_name or obj.user.first_name
+        last = obj.last_name or obj.user.last_name
+        return f"{first} {last}".strip()
+
+    def get_avatar(self, obj):
+        if not obj.avatar:
+            return None
+        request = self.context.get('request')
+        return request.build_absolute_uri(obj.avatar.url) if request else obj.avatar.url
+
+
+class PublicReviewSerializer(serializers.Serializer):
+    id = serializers.UUIDField(read_only=True)
+    rater_name = serializers.SerializerMethodField()
+    score = serializers.IntegerField(read_only=True)
+    comment = serializers.CharField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+    def get_rater_name(self, obj):
+        profile = getattr(obj.rater, 'profile', None)
+        if profile and (profile.first_name or profile.last_name):
+            return f"{profile.first_name} {profile.last_name}".strip()
+        return obj.rater.first_name or ''
+
+
+class PublicProviderProfileSerializer(serializers.ModelSerializer):
+    """
+    Read-only provider page. Expects the queryset from
+    PublicProviderProfileView (prefetched tags/experiences and recent_reviews
+    on the user); rating_count and rating_histogram are stored columns.
+    """
+    profile = PublicProfileSerializer(read_only=True)
+    skills = TagSerializer(many=True, read_only=True)
+    certifications = TagSerializer(many=True, read_only=True)
+    languages = TagSerializer(many=True, read_only=True)
+    experiences = ExperienceSerializer(many=True, read_only=True)
+    recent_reviews = PublicReviewSerializer(source='profile.user.recent_reviews', many=True, read_only=True)
+
+    class Meta:
+        model = ServiceProviderProfile
+        fields = (
+            'id', 'profile', 'hourly_rate', 'availability_status',
+            'years_of_experience', 'service_radius', 'skills',
+            'certifications', 'languages', 'experiences',
+            'total_jobs_completed', 'average_rating', 'rating_count',
+            'rating_histogram', 'recent_reviews', 'updated_at'
+        )
+        read_only_fields = fields
+
+
+class ServiceProviderProfileUpdateSerializer(PartialUpdateSerializerMixin, serializers.ModelSerializer):
+    skill_ids = BatchedPrimaryKeyRelatedField(
         many=True,
         queryset=Tag.objects.filter(category=Tag.TagCategory.SKILL),
         required=False,
         source='skills'
     )
-    certification_ids = serializers.PrimaryKeyRelatedField(
+    certification_ids = BatchedPrimaryKeyRelatedField(
         many=True,
         queryset=Tag.objects.filter(category=Tag.TagCategory.CERTIFICATION),
         required=False,
         source='certifications'
     )
-    language_ids = serializers.PrimaryKeyRelatedField(
+    language_ids = BatchedPrimaryKeyRelatedField(
         many=True,
         queryset=Tag.objects.filter(category=Tag.TagCategory.LANGUAGE),
         required=False,
@@ -156,3 +234,31 @@ class ServiceProviderProfileUpdateSerializer(serializers.ModelSerializer):
             'service_radius', 'skill_ids', 'certification_ids',
             'language_ids', 'portfolio_visibility'
         )
+
+
+class ProviderSearchDocumentSerializer(serializers.ModelSerializer):
+    provider_profile_id = serializers.UUIDField(source='pk', read_only=True)
+    avatar = serializers.SerializerMethodField()
+    distance_km = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ProviderSearchDocument
+        fields = (
+            'provider_profile_id', 'user_id', 'full_name', 'avatar', 'location',
+            'latitude', 'longitude', 'distance_km', 'skills', 'certifications',
+            'languages', 'hourly_rate', 'availability_status', 'years_of_experience',
+            'average_rating', 'total_jobs_completed'
+        )
+        read_only_fields = fields
+
+    def get_avatar(self, obj):
+        if not obj.avatar:
+            return None
+        from django.core.files.storage import default_storage
+        url = default_storage.url(obj.avatar)
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
+    def get_distance_km(self, obj):
+        distance = getattr(obj, 'distance_km', None)
+        return round(distance, 2) if distance is not None else None
@@ -1,7 +1,12 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import post_save, pre_delete, post_delete, m2m_changed
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
-from .models import Profile
+from skillspot.cache_utils import invalidate_provider_profile, invalidate_rating_stats, invalidate_tags_list
+from .context import UserContext
+from .models import Profile, ServiceProviderProfile, Tag, Experience
+from .search import PROVIDER_USER_TYPES, sync_provider_search_document
 
 User = get_user_model()
 
@@ -14,13 +19,138 @@ def create_user_profile(sender, instance, created, **kwargs):
             first_name=instance.first_name or '',
             last_name=instance.last_name or '',
         )
+        # Providers get their provider profile at signup so reads never have to create it.
+        if instance.user_type in PROVIDER_USER_TYPES:
+            ServiceProviderProfile.objects.create(profile=profile)
 
 
 @receiver(post_save, sender=User)
-def sync_user_to_profile(sender, instance, **kwargs):
+def create_provider_profile_on_user_type_change(sender, instance, created, update_fields=None, **kwargs):
+    # Signup is covered above; this handles a CLIENT who later becomes PROVIDER/BOTH.
+    if created or instance.user_type not in PROVIDER_USER_TYPES:
+        return
+    if update_fields is not None and 'user_type' not in update_fields:
+        return
+    UserContext(instance).ensure_provider_profile()
+
+
+@receiver(post_save, sender=User)
+def sync_user_to_profile(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not {'first_name', 'last_name'} & set(update_fields):
+        return
     if hasattr(instance, 'profile'):
         profile = instance.profile
         if instance.first_name != profile.first_name or instance.last_name != profile.last_name:
             profile.first_name = instance.first_name or ''
             profile.last_name = instance.last_name or ''
             profile.save(update_fields=['first_name', 'last_name', 'updated_at'])
+
+
+def _refresh_provider(provider_profile_id):
+    document = sync_provider_search_document(provider_profile_id)
+    if document is not None:
+        invalidate_provider_profile(document.user_id)
+
+
+def _schedule_provider_refresh(provider_profile_id):
+    """After commit: rebuild the provider's search document and drop its cached public profile."""
+    transaction.on_commit(lambda: _refresh_provider(provider_profile_id))
+
+
+@receiver(post_save, sender=ServiceProviderProfile)
+def sync_search_document_on_provider_save(sender, instance, **kwargs):
+    _schedule_provider_refresh(instance.pk)
+
+
+@receiver(post_save, sender=Profile)
+def invalidate_rating_stats_on_profile_save(sender, instance, update_fields=None, **kwargs):
+    # Rating summaries carry the user's display name.
+    if update_fields is not None and not {'first_name', 'last_name'} & set(update_fields):
+        return
+    user_id = instance.user_id
+    transaction.on_commit(lambda: invalidate_rating_stats(user_id))
+
+
+@receiver(post_save, sender=Profile)
+def sync_search_document_on_profile_save(sender, instance, **kwargs):
+    provider_profile_id = (
+        ServiceProviderProfile.objects.filter(profile=instance).values_list('pk', flat=True).first()
+    )
+    if provider_profile_id:
+        _schedule_provider_refresh(provider_profile_id)
+
+
+@receiver(post_save, sender=User)
+def sync_search_document_on_user_save(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        return
+    if update_fields is not None and not {'user_type', 'is_active'} & set(update_fields):
+        return
+    provider_profile_id = (
+        ServiceProviderProfile.objects.filter(profile__user=instance).values_list('pk', flat=True).first()
+    )
+    if provider_profile_id:
+        _schedule_provider_refresh(provider_profile_id)
+
+
+@receiver(m2m_changed, sender=ServiceProviderProfile.skills.through)
+@receiver(m2m_changed, sender=ServiceProviderProfile.certifications.through)
+@receiver(m2m_changed, sender=ServiceProviderProfile.languages.through)
+def sync_search_document_on_tags_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        _schedule_provider_refresh(instance.pk)
+    elif pk_set:
+        for provider_profile_id in pk_set:
+            _schedule_provider_refresh(provider_profile_id)
+
+
+@receiver(post_save, sender=Tag)
+def sync_search_documents_on_tag_rename(sender, instance, created, **kwargs):
+    if created:
+        return
+    provider_profile_ids = set(
+        ServiceProviderProfile.objects.filter(
+            Q(skills=instance) | Q(certifications=instance) | Q(languages=instance)
+        ).values_list('pk', flat=True)
+    )
+    for provider_profile_id in provider_profile_ids:
+        _schedule_provider_refresh(provider_profile_id)
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_tag_catalog(sender, **kwargs):
+    transaction.on_commit(invalidate_tags_list)
+
+
+@receiver(pre_delete, sender=ServiceProviderProfile)
+def invalidate_public_profile_on_provider_delete(sender, instance, **kwargs):
+    user_id = Profile.objects.filter(pk=instance.profile_id).values_list('user_id', flat=True).first()
+    if user_id:
+        transaction.on_commit(lambda: invalidate_provider_profile(user_id))
+
+
+@receiver(post_save, sender=Experience)
+@receiver(post_delete, sender=Experience)
+def invalidate_public_profile_on_experience_change(sender, instance, **kwargs):
+    user_id = (
+        ServiceProviderProfile.objects.filter(pk=instance.provider_id)
+        .values_list('profile__user_id', flat=True).first()
+    )
+    if user_id:
+        transaction.on_commit(lambda: invalidate_provider_profile(user_id))
+
+
+@receiver(post_save, sender=Profile)
+def schedule_avatar_variants(sender, instance, **kwargs):
+    avatar_name = instance.avatar.name if instance.avatar else ''
+    if avatar_name == (instance.avatar_variants or {}).get('source', ''):
+        return
+    if not avatar_name:
+        Profile.objects.filter(pk=instance.pk).update(avatar_variants={})
+        return
+    from .tasks import generate_avatar_variants
+    profile_id = str(instance.pk)
+    transaction.on_commit(lambda: generate_avatar_variants.delay(profile_id, avatar_name))
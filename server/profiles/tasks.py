@@ -0,0 +1,25 @@
+from celery import shared_task
+from PIL import UnidentifiedImageError
+from .avatars import build_avatar_variants
+from .models import Profile
+
+
+@shared_task(bind=True, autoretry_for=(OSError,), retry_backoff=True, max_retries=3)
+def generate_avatar_variants(self, profile_id, avatar_name):
+    """
+    Build thumbnails/WebP for avatar_name and record them on the profile.
+    Skipped if the avatar was replaced or removed before the task ran.
+    """
+    profile = Profile.objects.filter(pk=profile_id).only('id', 'avatar').first()
+    if profile is None or profile.avatar.name != avatar_name:
+        return None
+    try:
+        with profile.avatar.open('rb') as source:
+            sizes = build_avatar_variants(source)
+    except UnidentifiedImageError:
+        return None
+    # update() instead of save(): only this column changes, and profile signals need not run.
+    Profile.objects.filter(pk=profile_id, avatar=avatar_name).update(
+        avatar_variants={'source': avatar_name, 'sizes': sizes}
+    )
+    return sizes
@@ -2,7 +2,10 @@ from django.urls import path
 from .views import (
     ProfileDetailView,
     ServiceProviderProfileView,
+    ProviderSearchView,
+    PublicProviderProfileView,
     TagListCreateView,
+    TagAutocompleteView,
     ExperienceListCreateView,
     ExperienceDetailView,
 )
@@ -15,9 +18,12 @@ urlpatterns = [
     
     # Service Provider Profile
     path('provider/', ServiceProviderProfileView.as_view(), name='provider_profile'),
+    path('providers/search/', ProviderSearchView.as_view(), name='provider_search'),
+    path('providers/<uuid:user_id>/', PublicProviderProfileView.as_view(), name='public_provider_profile'),
     
     # Tags (Skills, Certifications, Languages)
     path('tags/', TagListCreateView.as_view(), name='tag_list_create'),
+    path('tags/autocomplete/', TagAutocompleteView.as_view(), name='tag_autocomplete'),
     
     # Experiences
     path('experiences/', ExperienceListCreateView.as_view(), name='experience_list_create'),
@@ -1,17 +1,32 @@
 from rest_framework import generics, permissions, status
+from rest_framework.exceptions import NotFound
 from rest_framework.parsers import JSONParser, MultiPartParser, FormParser
 from rest_framework.response import Response
 from django.contrib.auth import get_user_model
-from django.core.cache import cache
-from skillspot.cache_utils import tags_list_cache_key, invalidate_tags_list, TAGS_LIST_TIMEOUT
-from .models import Profile, ServiceProviderProfile, Tag, Experience
+from django.db.models import Prefetch
+from skillspot.cache_utils import (
+    tags_list_cache_key,
+    get_or_compute,
+    render_json_entry,
+    json_entry_response,
+    provider_profile_cache_key,
+    TAGS_LIST_TIMEOUT,
+    PROVIDER_PROFILE_TIMEOUT,
+)
+from ratings.models import Rating
+from .models import ServiceProviderProfile, Tag, Experience
 from .serializers import (
     ProfileSerializer,
     ServiceProviderProfileSerializer,
     ServiceProviderProfileUpdateSerializer,
     TagSerializer,
     ExperienceSerializer,
+    ProviderSearchDocumentSerializer,
+    PublicProviderProfileSerializer,
 )
+from .context import get_user_context
+from .autocomplete import autocomplete_tags, DEFAULT_LIMIT, MAX_LIMIT
+from .search import PROVIDER_USER_TYPES, search_providers
 
 User = get_user_model()
 
@@ -23,8 +38,12 @@ class ProfileDetailView(generics.RetrieveUpdateAPIView):
     http_method_names = ['get', 'patch']
 
     def get_object(self):
-        profile, created = Profile.objects.get_or_create(user=self.request.user)
-        return profile
+        context = get_user_context(self.request)
+        if self.request.method == 'GET':
+            if context.profile is None:
+                raise NotFound('Profile not found.')
+            return context.profile
+        return context.ensure_profile()
 
 
 class ServiceProviderProfileView(generics.RetrieveUpdateAPIView):
@@ -33,11 +52,13 @@ class ServiceProviderProfileView(generics.RetrieveUpdateAPIView):
     http_method_names = ['get', 'patch']
 
     def get_object(self):
-        profile, _ = Profile.objects.get_or_create(user=self.request.user)
-        provider_profile, created = ServiceProviderProfile.objects.get_or_create(
-            profile=profile
-        )
-        return provider_profile
+        context = get_user_context(self.request)
+        if self.request.method == 'GET' and context.provider_profile is None:
+            # Providers always have the row (see profiles.signals); one may still be
+            # missing for accounts that switched to PROVIDER/BOTH before that existed.
+            if self.request.user.user_type not in PROVIDER_USER_TYPES:
+                raise NotFound('Provider profile not found.')
+        return context.ensure_provider_profile()
 
     def get_serializer_class(self):
         if self.request.method == 'PATCH':
@@ -62,17 +83,39 @@ class TagListCreateView(generics.ListCreateAPIView):
         if request.method != 'GET':
             return super().list(request, *args, **kwargs)
         category = request.query_params.get('category')
-        key = tags_list_cache_key(category.upper() if category else None)
-        data = cache.get(key)
-        if data is not None:
-            return Response(data)
-        response = super().list(request, *args, **kwargs)
-        cache.set(key, response.data, timeout=TAGS_LIST_TIMEOUT)
-        return response
+        list_page = super().list
+        data = get_or_compute(
+            tags_list_cache_key(category.upper() if category else None),
+            lambda: list_page(request, *args, **kwargs).data,
+            timeout=TAGS_LIST_TIMEOUT,
+        )
+        return Response(data)
 
     def perform_create(self, serializer):
+        # Tag signals call invalidate_tags_list(), covering admin edits too.
         serializer.save()
-        invalidate_tags_list()
+
+
+class TagAutocompleteView(generics.GenericAPIView):
+    """
+    `?q=&category=&limit=` prefix search over tag names (any word), falling back
+    to fuzzy matches. Served from an in-process index; see profiles.autocomplete.
+    """
+    serializer_class = TagSerializer
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request):
+        try:
+            limit = int(request.query_params.get('limit', DEFAULT_LIMIT))
+        except (TypeError, ValueError):
+            limit = DEFAULT_LIMIT
+        limit = max(1, min(limit, MAX_LIMIT))
+        results = autocomplete_tags(
+            request.query_params.get('q', ''),
+            request.query_params.get('category'),
+            limit,
+        )
+        return Response({'results': results})
 
 
 class ExperienceListCreateView(generics.ListCreateAPIView):
@@ -80,18 +123,13 @@ class ExperienceListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        profile, _ = Profile.objects.get_or_create(user=self.request.user)
-        provider_profile, _ = ServiceProviderProfile.objects.get_or_create(
-            profile=profile
-        )
+        provider_profile = get_user_context(self.request).provider_profile
+        if provider_profile is None:
+            return Experience.objects.none()
         return Experience.objects.filter(provider=provider_profile)
 
     def perform_create(self, serializer):
-        profile, _ = Profile.objects.get_or_create(user=self.request.user)
-        provider_profile, _ = ServiceProviderProfile.objects.get_or_create(
-            profile=profile
-        )
-        serializer.save(provider=provider_profile)
+        serializer.save(provider=get_user_context(self.request).ensure_provider_profile())
 
 
 class ExperienceDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -101,8 +139,62 @@ class ExperienceDetailView(generics.RetrieveUpdateDestroyAPIView):
     http_method_names = ['get', 'patch', 'delete']
 
     def get_queryset(self):
-        profile, _ = Profile.objects.get_or_create(user=self.request.user)
-        provider_profile, _ = ServiceProviderProfile.objects.get_or_create(
-            profile=profile
-        )
+        provider_profile = get_user_context(self.request).provider_profile
+        if provider_profile is None:
+            return Experience.objects.none()
         return Experience.objects.filter(provider=provider_profile)
+
+
+class ProviderSearchView(generics.ListAPIView):
+    """
+    Search providers by name/location, skills, certifications, languages,
+    availability, rating, hourly rate and distance (see profiles.search).
+    """
+    serializer_class = ProviderSearchDocumentSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return search_providers(self.request.query_params)
+
+
+class PublicProviderProfileView(generics.GenericAPIView):
+    """
+    Public, read-only provider page by user id. Loaded in a fixed six queries
+    (provider+profile+user, skills, certifications, languages,
+    experiences, recent reviews) and cached as rendered JSON per provider;
+    profiles.signals and ratings.signals drop the entry on any change it shows.
+    """
+    serializer_class = PublicProviderProfileSerializer
+    permission_classes = [permissions.AllowAny]
+    recent_reviews_limit = 5
+
+    def get_queryset(self):
+        received = Rating.RatingType.CLIENT_TO_PROVIDER
+        reviews = (
+            Rating.objects.filter(rating_type=received)
+            .select_related('rater__profile')
+            .order_by('-created_at')[:self.recent_reviews_limit]
+        )
+        return (
+            ServiceProviderProfile.objects.filter(
+                portfolio_visibility=True,
+                profile__user__is_active=True,
+                profile__user__user_type__in=PROVIDER_USER_TYPES,
+            )
+            .select_related('profile__user')
+            .prefetch_related(
+                'skills', 'certifications', 'languages', 'experiences',
+                Prefetch('profile__user__ratings_received', queryset=reviews, to_attr='recent_reviews'),
+            )
+        )
+
+    def get(self, request, user_id):
+        def render():
+            provider_profile = self.get_queryset().filter(profile__user_id=user_id).first()
+            if provider_profile is None:
+                # Raised rather than returned so misses are never cached.
+                raise NotFound('Provider not found.')
+            return render_json_entry(self.get_serializer(provider_profile).data)
+
+        entry = get_or_compute(provider_profile_cache_key(user_id), render, timeout=PROVIDER_PROFILE_TIMEOUT)
+        return json_entry_response(request, entry)
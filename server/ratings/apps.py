@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class RatingsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'ratings'
+
+    def ready(self):
+        import ratings.signals
+        from .leaderboard import populate_leaderboards_if_empty
+        post_migrate.connect(populate_leaderboards_if_empty, sender=self)
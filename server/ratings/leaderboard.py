@@ -0,0 +1,177 @@
+"""
+Top providers per skill.
+
+Each skill tag has a Redis sorted set of searchable provider user ids scored
+by reputation (ServiceProviderProfile.bayesian_rating, then jobs completed),
+plus a per-provider set of the tags it is listed under so skill removals can
+be undone without scanning. The sets are fed from ProviderSearchDocument and
+maintained by ratings.signals; reads only hydrate the requested page.
+Without Redis, the same ordering comes from ProviderSearchDocument directly.
+"""
+from profiles.models import ProviderSearchDocument
+from profiles.search import search_providers
+from skillspot.redis_client import get_redis, redis_key
+
+MAX_JOBS_TIEBREAK = 999_999
+
+
+def _board_key(tag_id):
+    return redis_key('provider_leaderboard', tag_id)
+
+
+def _listed_key(user_id):
+    return redis_key('provider_leaderboard_tags', user_id)
+
+
+def _score(document):
+    """bayesian_rating (3 decimals) first, total_jobs_completed as tie-breaker, in one float."""
+    rating = round(float(document.bayesian_rating) * 1000)
+    return rating * (MAX_JOBS_TIEBREAK + 1) + min(document.total_jobs_completed, MAX_JOBS_TIEBREAK)
+
+
+def _tag_ids(document):
+    return {tag['id'] for tag in document.skills} if document.is_searchable else set()
+
+
+# Move a provider to exactly the boards in ARGV[4..] in one atomic step, so two
+# concurrent updates can't interleave reading and rewriting the listed-tags set.
+# KEYS[1] listed-tags set; ARGV: user id, score, board key prefix, tag ids...
+_PLACE_PROVIDER_SCRIPT = """
+local keep = {}
+for i = 4, #ARGV do keep[ARGV[i]] = true end
+for _, tag_id in ipairs(redis.call('smembers', KEYS[1])) do
+    if not keep[tag_id] then redis.call('zrem', ARGV[3] .. tag_id, ARGV[1]) end
+end
+redis.call('del', KEYS[1])
+for i = 4, #ARGV do
+    redis.call('zadd', ARGV[3] .. ARGV[i], ARGV[2], ARGV[1])
+    redis.call('sadd', KEYS[1], ARGV[i])
+end
+return #ARGV - 3
+"""
+
+
+def _place_provider(client, user_id, score, tag_ids):
+    user_id = str(user_id)
+    client.eval(
+        _PLACE_PROVIDER_SCRIPT, 1, _listed_key(user_id),
+        user_id, score, _board_key(''), *sorted(tag_ids),
+    )
+
+
+def index_provider(document):
+    """Place the provider on the boards of its current skills (none if not searchable)."""
+    client = get_redis()
+    if client is None:
+        return
+    _place_provider(client, document.user_id, _score(document), _tag_ids(document))
+
+
+def unindex_provider(user_id):
+    client = get_redis()
+    if client is None:
+        return
+    _place_provider(client, user_id, 0, ())
+
+
+def refresh_provider(user_id):
+    """Re-score one provider from its search document (e.g. after a rating change)."""
+    if get_redis() is None:
+        return
+    document = (
+        ProviderSearchDocument.objects.filter(user_id=user_id)
+        .only('user_id', 'skills', 'is_searchable', 'bayesian_rating', 'total_jobs_completed')
+        .first()
+    )
+    if document is None:
+        unindex_provider(user_id)
+    else:
+        index_provider(document)
+
+
+def rebuild_leaderboards(chunk_size=1000):
+    """Repopulate every board from the database. Returns the number of providers indexed."""
+    client = get_redis()
+    if client is None:
+        return 0
+    for pattern in (_board_key('*'), _listed_key('*')):
+        for key in client.scan_iter(match=pattern, count=1000):
+            client.delete(key)
+    documents = (
+        ProviderSearchDocument.objects.filter(is_searchable=True)
+        .only('user_id', 'skills', 'is_searchable', 'bayesian_rating', 'total_jobs_completed')
+        .order_by('pk')
+        .iterator(chunk_size=chunk_size)
+    )
+    total = 0
+    pipe = client.pipeline()
+    for document in documents:
+        user_id, tag_ids = str(document.user_id), _tag_ids(document)
+        if not tag_ids:
+            continue
+        score = _score(document)
+        for tag_id in tag_ids:
+            pipe.zadd(_board_key(tag_id), {user_id: score})
+        pipe.sadd(_listed_key(user_id), *tag_ids)
+        total += 1
+        if total % chunk_size == 0:
+            pipe.execute()
+    pipe.execute()
+    return total
+
+
+def populate_leaderboards_if_empty(**kwargs):
+    """
+    post_migrate hook: build the boards when Redis has none yet (fresh Redis,
+    or search documents just backfilled by a migration). Skipped without Redis
+    or if Redis is unreachable; rebuild_provider_leaderboards can be run later.
+    """
+    from redis import RedisError
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        if next(client.scan_iter(match=_board_key('*'), count=1000), None) is None:
+            rebuild_leaderboards()
+    except RedisError:
+        pass
+
+
+class SkillLeaderboard:
+    """
+    One skill's board as a lazily sliced sequence of ProviderSearchDocuments,
+    so the standard paginator can page it (count() is ZCARD, a slice is one
+    ZREVRANGE plus one query for those documents).
+    """
+
+    def __init__(self, client, tag_id):
+        self.client = client
+        self.key = _board_key(tag_id)
+
+    def count(self):
+        return self.client.zcard(self.key)
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1][0]
+        start = index.start or 0
+        stop = index.stop if index.stop is not None else self.count()
+        if stop <= start:
+            return []
+        user_ids = self.client.zrevrange(self.key, start, stop - 1)
+        documents = {
+            str(document.user_id): document
+            for document in ProviderSearchDocument.objects.filter(user_id__in=user_ids, is_searchable=True)
+        }
+        return [documents[user_id] for user_id in user_ids if user_id in documents]
+
+
+def skill_leaderboard(tag_id):
+    """Providers listed under a skill, best first: a SkillLeaderboard, or a queryset without Redis."""
+    client = get_redis()
+    if client is not None:
+        return SkillLeaderboard(client, tag_id)
+    return search_providers({'skill': str(tag_id)})
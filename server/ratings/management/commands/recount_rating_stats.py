@@ -0,0 +1,73 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Q, Sum
+from skillspot.cache_utils import invalidate_provider_profile
+from profiles.models import ProviderSearchDocument, ServiceProviderProfile
+from ratings.models import Rating
+
+
+class Command(BaseCommand):
+    help = 'Recompute ServiceProviderProfile rating stats from Rating rows in chunks to repair drift.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        fields = ServiceProviderProfile.RATING_FIELDS
+        checked = repaired = 0
+        last_pk = None
+        while True:
+            providers = (
+                ServiceProviderProfile.objects.order_by('pk')
+                .select_related('profile')
+                .only('id', 'profile__user_id', *fields)
+            )
+            if last_pk is not None:
+                providers = providers.filter(pk__gt=last_pk)
+            providers = list(providers[:chunk_size])
+            if not providers:
+                break
+            last_pk = providers[-1].pk
+
+            stats = {
+                row['rated_user_id']: row
+                for row in Rating.objects.filter(
+                    rating_type=Rating.RatingType.CLIENT_TO_PROVIDER,
+                    rated_user_id__in=[p.profile.user_id for p in providers],
+                )
+                .order_by()
+                .values('rated_user_id')
+                .annotate(
+                    total=Count('id'),
+                    score_sum=Sum('score'),
+                    **{f'stars_{star}': Count('id', filter=Q(score=star)) for star in range(1, 6)},
+                )
+            }
+            drifted = []
+            for provider in providers:
+                row = stats.get(provider.profile.user_id, {})
+                count, total = row.get('total', 0), row.get('score_sum') or 0
+                average, bayesian = ServiceProviderProfile.compute_rating_scores(total, count)
+                expected = dict(
+                    rating_count=count,
+                    rating_sum=total,
+                    average_rating=average,
+                    bayesian_rating=bayesian,
+                    **{f'rating_{star}_count': row.get(f'stars_{star}', 0) for star in range(1, 6)},
+                )
+                if any(getattr(provider, name) != value for name, value in expected.items()):
+                    for name, value in expected.items():
+                        setattr(provider, name, value)
+                    drifted.append(provider)
+            if drifted:
+                ServiceProviderProfile.objects.bulk_update(drifted, fields)
+                for provider in drifted:
+                    ProviderSearchDocument.objects.filter(provider_profile=provider).update(
+                        average_rating=provider.average_rating,
+                        bayesian_rating=provider.bayesian_rating,
+                    )
+                    invalidate_provider_profile(provider.profile.user_id)
+            checked += len(providers)
+            repaired += len(drifted)
+
+        self.stdout.write(self.style.SUCCESS(f'Checked {checked} providers, repaired {repaired}.'))
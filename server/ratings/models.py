@@ -1,11 +1,12 @@
 import uuid
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils.translation import gettext_lazy as _
 from django.db.models import Avg, Count
 from jobs.models import Job
 from contracts.models import Contract
+from profiles.models import ServiceProviderProfile
 
 User = get_user_model()
 
@@ -143,15 +144,30 @@ class Rating(models.Model):
 
     def save(self, *args, **kwargs):
         self.full_clean()
-        super().save(*args, **kwargs)
-        
-        # Update provider profile average rating if rating is for a provider
-        if self.rating_type == self.RatingType.CLIENT_TO_PROVIDER:
-            if hasattr(self.rated_user, 'profile') and hasattr(self.rated_user.profile, 'provider_profile'):
-                provider_profile = self.rated_user.profile.provider_profile
-                rating_stats = Rating.calculate_average_rating(
-                    self.rated_user,
-                    rating_type=self.RatingType.CLIENT_TO_PROVIDER
+        with transaction.atomic():
+            previous = None
+            if not self._state.adding:
+                previous = (
+                    Rating.objects.select_for_update()
+                    .filter(pk=self.pk)
+                    .values('rated_user_id', 'rating_type', 'score')
+                    .first()
                 )
-                provider_profile.average_rating = rating_stats['average']
-                provider_profile.save(update_fields=['average_rating'])
+            super().save(*args, **kwargs)
+            self._update_provider_stats(previous)
+
+    def _update_provider_stats(self, previous):
+        """Apply this save to the rated provider's running rating stats."""
+        received = self.RatingType.CLIENT_TO_PROVIDER
+        if previous is not None and previous['rating_type'] != received:
+            previous = None
+        counts = self.rating_type == received
+        if previous is not None and counts and previous['rated_user_id'] == self.rated_user_id:
+            ServiceProviderProfile.adjust_rating_stats(
+                self.rated_user_id, added=self.score, removed=previous['score']
+            )
+            return
+        if previous is not None:
+            ServiceProviderProfile.adjust_rating_stats(previous['rated_user_id'], removed=previous['score'])
+        if counts:
+            ServiceProviderProfile.adjust_rating_stats(self.rated_user_id, added=self.score)
@@ -3,6 +3,7 @@ from django.contrib.auth import get_user_model
 from .models import Rating
 from jobs.models import Job, JobApplication
 from contracts.models import Contract
+from profiles.serializers import ProviderSearchDocumentSerializer
 
 User = get_user_model()
 
@@ -220,6 +221,19 @@ class UserRatingStatsSerializer(serializers.Serializer):
     user_name = serializers.CharField()
     average_rating_as_provider = serializers.DecimalField(max_digits=3, decimal_places=2)
     rating_count_as_provider = serializers.IntegerField()
+    rating_histogram_as_provider = serializers.DictField(child=serializers.IntegerField())
+    recent_rating_count_as_provider = serializers.IntegerField()
     average_rating_as_client = serializers.DecimalField(max_digits=3, decimal_places=2)
     rating_count_as_client = serializers.IntegerField()
+    rating_histogram_as_client = serializers.DictField(child=serializers.IntegerField())
+    recent_rating_count_as_client = serializers.IntegerField()
     total_ratings = serializers.IntegerField()
+
+
+class LeaderboardEntrySerializer(ProviderSearchDocumentSerializer):
+    """A provider search document with its position on a skill leaderboard."""
+    rank = serializers.IntegerField(read_only=True)
+
+    class Meta(ProviderSearchDocumentSerializer.Meta):
+        fields = ('rank',) + ProviderSearchDocumentSerializer.Meta.fields + ('bayesian_rating',)
+        read_only_fields = fields
@@ -0,0 +1,64 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from redis import RedisError
+from skillspot.cache_utils import invalidate_provider_profile, invalidate_rating_stats
+from profiles.models import ProviderSearchDocument, ServiceProviderProfile
+from .leaderboard import refresh_provider, unindex_provider
+from .models import Rating
+
+
+def _update_leaderboards_on_commit(update, user_id):
+    """
+    Run a leaderboard update after commit. A Redis error must not fail the write
+    that triggered it; rebuild_provider_leaderboards repairs any missed update.
+    """
+    def run():
+        try:
+            update(user_id)
+        except RedisError:
+            pass
+    transaction.on_commit(run)
+
+
+@receiver(post_delete, sender=Rating)
+def update_provider_stats_on_rating_delete(sender, instance, **kwargs):
+    # Creates and edits are applied in Rating.save(); deletes (including
+    # cascades and queryset deletes) come through here.
+    if instance.rating_type == Rating.RatingType.CLIENT_TO_PROVIDER:
+        ServiceProviderProfile.adjust_rating_stats(instance.rated_user_id, removed=instance.score)
+
+
+@receiver(post_save, sender=Rating)
+@receiver(post_delete, sender=Rating)
+def invalidate_public_profile_on_rating_change(sender, instance, **kwargs):
+    # Public provider profiles show rating counts and recent reviews.
+    if instance.rating_type == Rating.RatingType.CLIENT_TO_PROVIDER:
+        user_id = instance.rated_user_id
+        transaction.on_commit(lambda: invalidate_provider_profile(user_id))
+
+
+@receiver(post_save, sender=Rating)
+@receiver(post_delete, sender=Rating)
+def invalidate_rating_stats_on_rating_change(sender, instance, **kwargs):
+    user_id = instance.rated_user_id
+    transaction.on_commit(lambda: invalidate_rating_stats(user_id))
+
+
+@receiver(post_save, sender=Rating)
+@receiver(post_delete, sender=Rating)
+def rescore_leaderboards_on_rating_change(sender, instance, **kwargs):
+    # Rating stats reach the search document through a queryset update, which sends no signal.
+    if instance.rating_type == Rating.RatingType.CLIENT_TO_PROVIDER:
+        _update_leaderboards_on_commit(refresh_provider, instance.rated_user_id)
+
+
+@receiver(post_save, sender=ProviderSearchDocument)
+def update_leaderboards_on_document_save(sender, instance, **kwargs):
+    # Re-read at commit time so the last committed document wins, not the last callback.
+    _update_leaderboards_on_commit(refresh_provider, instance.user_id)
+
+
+@receiver(post_delete, sender=ProviderSearchDocument)
+def update_leaderboards_on_document_delete(sender, instance, **kwargs):
+    _update_leaderboards_on_commit(unindex_provider, instance.user_id)
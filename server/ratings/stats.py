@@ -0,0 +1,86 @@
+"""
+Rating summaries for profile cards and list screens.
+
+Each user's summary (average, count, 1-5 star histogram and last-90-days
+count, received as provider and as client) is computed for any number of
+users with one conditional-aggregation query and cached per user;
+ratings.signals drops the entry when a rating the user received changes.
+"""
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Avg, Count, Q
+from django.utils import timezone
+from skillspot.cache_utils import RATING_STATS_TIMEOUT, rating_stats_cache_key
+from .models import Rating
+
+User = get_user_model()
+
+RECENT_RATING_DAYS = 90
+MAX_BATCH_USERS = 100
+ROLES = (
+    ('provider', Rating.RatingType.CLIENT_TO_PROVIDER),
+    ('client', Rating.RatingType.PROVIDER_TO_CLIENT),
+)
+
+
+def _aggregates():
+    since = timezone.now() - timedelta(days=RECENT_RATING_DAYS)
+    annotations = {}
+    for role, rating_type in ROLES:
+        received = Q(ratings_received__rating_type=rating_type)
+        annotations[f'{role}_average'] = Avg('ratings_received__score', filter=received)
+        annotations[f'{role}_count'] = Count('ratings_received', filter=received)
+        annotations[f'{role}_recent'] = Count(
+            'ratings_received', filter=received & Q(ratings_received__created_at__gte=since)
+        )
+        for star in range(1, 6):
+            annotations[f'{role}_{star}'] = Count(
+                'ratings_received', filter=received & Q(ratings_received__score=star)
+            )
+    return annotations
+
+
+def _summary(user):
+    profile = getattr(user, 'profile', None)
+    data = {
+        'user_id': str(user.id),
+        'user_email': user.email,
+        'user_name': profile.full_name if profile else user.email,
+    }
+    for role, _ in ROLES:
+        data[f'average_rating_as_{role}'] = round(getattr(user, f'{role}_average') or 0, 2)
+        data[f'rating_count_as_{role}'] = getattr(user, f'{role}_count')
+        data[f'rating_histogram_as_{role}'] = {
+            str(star): getattr(user, f'{role}_{star}') for star in range(1, 6)
+        }
+        data[f'recent_rating_count_as_{role}'] = getattr(user, f'{role}_recent')
+    data['total_ratings'] = data['rating_count_as_provider'] + data['rating_count_as_client']
+    return data
+
+
+def compute_rating_stats(user_ids):
+    """{user_id: summary} for existing users among user_ids, in one query."""
+    users = (
+        User.objects.filter(id__in=user_ids)
+        .select_related('profile')
+        .annotate(**_aggregates())
+        .order_by()
+    )
+    return {user.id: _summary(user) for user in users}
+
+
+def get_rating_stats(user_ids):
+    """Cached summaries for user_ids; misses are computed together and cached. Unknown ids are omitted."""
+    keys = {user_id: rating_stats_cache_key(user_id) for user_id in user_ids}
+    cached = cache.get_many(list(keys.values()))
+    stats = {user_id: cached[key] for user_id, key in keys.items() if key in cached}
+    missing = [user_id for user_id in keys if user_id not in stats]
+    if missing:
+        computed = compute_rating_stats(missing)
+        cache.set_many(
+            {keys[user_id]: data for user_id, data in computed.items()},
+            timeout=RATING_STATS_TIMEOUT,
+        )
+        stats.update(computed)
+    return stats
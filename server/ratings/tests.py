@@ -1,3 +1,168 @@
-from django.test import TestCase
+import uuid
+from datetime import timedelta
+from unittest.mock import patch
+from django.core.cache import cache
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from accounts.models import User
+from jobs.models import Job, JobApplication
+from profiles.models import ServiceProviderProfile
+from .models import Rating
+from .stats import MAX_BATCH_USERS, RECENT_RATING_DAYS, get_rating_stats
 
-# Create your tests here.
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(REDIS_URL='locmem://', CACHES=LOCMEM_CACHES)
+@patch('ratings.views.send_in_app_notification')
+class RatingStatsDeltaTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.client_user = User.objects.create_user('client@example.com', 'pw-123456', user_type='CLIENT')
+        self.provider = User.objects.create_user('provider@example.com', 'pw-123456', user_type='PROVIDER')
+        self.client.force_authenticate(self.client_user)
+
+    def completed_job(self):
+        job = Job.objects.create(
+            client=self.client_user, title='Fix sink', description='Leak', location='Adama',
+            status=Job.JobStatus.COMPLETED,
+        )
+        JobApplication.objects.create(
+            job=job, provider=self.provider, status=JobApplication.ApplicationStatus.ACCEPTED
+        )
+        return job
+
+    def rate(self, score):
+        response = self.client.post('/api/v1/ratings/', {
+            'job_id': str(self.completed_job().pk),
+            'rating_type': Rating.RatingType.CLIENT_TO_PROVIDER,
+            'score': score,
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        return Rating.objects.get(rater=self.client_user, job_id=response.data['job_id'])
+
+    def stats(self):
+        return ServiceProviderProfile.objects.get(profile__user=self.provider)
+
+    def test_create_adds_the_score(self, notify):
+        self.rate(5)
+        self.rate(4)
+        stats = self.stats()
+        self.assertEqual((stats.rating_count, stats.rating_sum), (2, 9))
+        self.assertEqual(stats.rating_histogram, {'1': 0, '2': 0, '3': 0, '4': 1, '5': 1})
+        self.assertAlmostEqual(float(stats.average_rating), 4.5)
+        # (3.5 * 5 + 9) / (5 + 2)
+        self.assertAlmostEqual(float(stats.bayesian_rating), 3.786, places=3)
+
+    def test_update_moves_the_score_between_buckets(self, notify):
+        rating = self.rate(5)
+        response = self.client.patch(f'/api/v1/ratings/{rating.pk}/', {'score': 2}, format='json')
+        self.assertEqual(response.status_code, 200)
+        stats = self.stats()
+        self.assertEqual((stats.rating_count, stats.rating_sum), (1, 2))
+        self.assertEqual(stats.rating_histogram, {'1': 0, '2': 1, '3': 0, '4': 0, '5': 0})
+        self.assertAlmostEqual(float(stats.bayesian_rating), 3.25, places=3)
+
+    def test_delete_removes_the_score(self, notify):
+        kept = self.rate(3)
+        removed = self.rate(5)
+        response = self.client.delete(f'/api/v1/ratings/{removed.pk}/')
+        self.assertEqual(response.status_code, 204)
+        stats = self.stats()
+        self.assertEqual((stats.rating_count, stats.rating_sum), (1, kept.score))
+        self.assertEqual(stats.rating_5_count, 0)
+        self.assertAlmostEqual(float(stats.average_rating), 3.0)
+
+        self.client.delete(f'/api/v1/ratings/{kept.pk}/')
+        stats = self.stats()
+        self.assertEqual((stats.rating_count, stats.rating_sum), (0, 0))
+        self.assertAlmostEqual(float(stats.bayesian_rating), ServiceProviderProfile.RATING_PRIOR_MEAN)
+
+    def test_bayesian_rating_ranks_volume_over_a_single_review(self, notify):
+        self.rate(5)
+        other = User.objects.create_user('other@example.com', 'pw-123456', user_type='PROVIDER')
+        for _ in range(20):
+            ServiceProviderProfile.adjust_rating_stats(other.pk, added=5)
+        ServiceProviderProfile.adjust_rating_stats(other.pk, added=4)
+        ranked = list(
+            ServiceProviderProfile.objects.filter(profile__user__in=[self.provider, other])
+            .values_list('profile__user_id', flat=True)
+        )
+        self.assertEqual(ranked, [other.pk, self.provider.pk])
+
+
+@override_settings(REDIS_URL='locmem://', CACHES=LOCMEM_CACHES)
+class RatingStatsTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('both@example.com', 'pw-123456', user_type='BOTH')
+        self.rating_client = User.objects.create_user('client@example.com', 'pw-123456', user_type='CLIENT')
+        self.rating_provider = User.objects.create_user('provider@example.com', 'pw-123456', user_type='PROVIDER')
+        self.client.force_authenticate(self.user)
+
+    def rating(self, job_client, rater, rated_user, rating_type, score):
+        job = Job.objects.create(
+            client=job_client, title='Fix sink', description='Leak', location='Adama',
+            status=Job.JobStatus.COMPLETED,
+        )
+        return Rating.objects.create(job=job, rater=rater, rated_user=rated_user, rating_type=rating_type, score=score)
+
+    def rate_as_provider(self, score):
+        return self.rating(self.rating_client, self.rating_client, self.user, Rating.RatingType.CLIENT_TO_PROVIDER, score)
+
+    def rate_as_client(self, score):
+        return self.rating(self.user, self.rating_provider, self.user, Rating.RatingType.PROVIDER_TO_CLIENT, score)
+
+    def test_histograms_and_recent_counts_for_both_roles(self):
+        self.rate_as_provider(5)
+        old = self.rate_as_provider(4)
+        Rating.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=RECENT_RATING_DAYS + 1))
+        self.rate_as_client(3)
+
+        response = self.client.get(f'/api/v1/ratings/stats/{self.user.pk}/')
+        self.assertEqual(response.status_code, 200)
+        stats = response.json()
+        self.assertEqual(stats['rating_count_as_provider'], 2)
+        self.assertEqual(stats['average_rating_as_provider'], 4.5)
+        self.assertEqual(stats['rating_histogram_as_provider'], {'1': 0, '2': 0, '3': 0, '4': 1, '5': 1})
+        self.assertEqual(stats['recent_rating_count_as_provider'], 1)
+        self.assertEqual(stats['rating_count_as_client'], 1)
+        self.assertEqual(stats['rating_histogram_as_client'], {'1': 0, '2': 0, '3': 1, '4': 0, '5': 0})
+        self.assertEqual(stats['recent_rating_count_as_client'], 1)
+        self.assertEqual(stats['total_ratings'], 3)
+
+    def test_summaries_are_cached_per_user_until_a_rating_changes(self):
+        user_ids = [self.user.pk, self.rating_client.pk]
+        with self.assertNumQueries(1):
+            get_rating_stats(user_ids)
+        with self.assertNumQueries(1):
+            # Only the newly requested user is computed.
+            stats = get_rating_stats(user_ids + [self.rating_provider.pk])
+        self.assertEqual(set(stats), set(user_ids + [self.rating_provider.pk]))
+        with self.assertNumQueries(0):
+            get_rating_stats(user_ids)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.rate_as_provider(5)
+        self.assertEqual(get_rating_stats([self.user.pk])[self.user.pk]['rating_count_as_provider'], 1)
+
+    def test_batch_keeps_request_order_and_omits_unknown_ids(self):
+        self.rate_as_provider(5)
+        ids = [self.rating_client.pk, uuid.uuid4(), self.user.pk]
+        response = self.client.get('/api/v1/ratings/stats/batch/', {'user_ids': ','.join(map(str, ids))})
+        self.assertEqual(response.status_code, 200)
+        results = response.json()['results']
+        self.assertEqual([row['user_id'] for row in results], [str(self.rating_client.pk), str(self.user.pk)])
+        self.assertEqual(results[1]['rating_count_as_provider'], 1)
+
+    def test_batch_rejects_missing_invalid_and_too_many_ids(self):
+        too_many = ','.join(str(uuid.uuid4()) for _ in range(MAX_BATCH_USERS + 1))
+        for params in ({}, {'user_ids': ''}, {'user_ids': f'{self.user.pk},nope'}, {'user_ids': too_many}):
+            response = self.client.get('/api/v1/ratings/stats/batch/', params)
+            self.assertEqual(response.status_code, 400, params)
+            self.assertIn('error', response.json())
+
+        exactly = ','.join(str(uuid.uuid4()) for _ in range(MAX_BATCH_USERS))
+        response = self.client.get('/api/v1/ratings/stats/batch/', {'user_ids': exactly})
+        self.assertEqual(response.json(), {'results': []})
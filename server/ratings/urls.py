@@ -3,8 +3,10 @@ from .views import (
     RatingListCreateView,
     RatingDetailView,
     UserRatingStatsView,
+    BatchUserRatingStatsView,
     ProviderRatingsView,
     ClientRatingsView,
+    ProviderLeaderboardView,
 )
 
 app_name = 'ratings'
@@ -12,6 +14,8 @@ app_name = 'ratings'
 urlpatterns = [
     path('', RatingListCreateView.as_view(), name='rating_list_create'),
     path('<uuid:id>/', RatingDetailView.as_view(), name='rating_detail'),
+    path('leaderboard/', ProviderLeaderboardView.as_view(), name='provider_leaderboard'),
+    path('stats/batch/', BatchUserRatingStatsView.as_view(), name='batch_user_rating_stats'),
     path('stats/<uuid:user_id>/', UserRatingStatsView.as_view(), name='user_rating_stats'),
     path('stats/', UserRatingStatsView.as_view(), name='current_user_rating_stats'),
     path('providers/<uuid:provider_id>/', ProviderRatingsView.as_view(), name='provider_ratings'),
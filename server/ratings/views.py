@@ -1,14 +1,19 @@
+import uuid
 from rest_framework import generics, permissions, status, filters
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from django.contrib.auth import get_user_model
-from django.db.models import Q, Avg, Count
+from django.db.models import Q
 from notifications.tasks import send_in_app_notification
+from .leaderboard import skill_leaderboard
 from .models import Rating
+from .stats import MAX_BATCH_USERS, get_rating_stats
 from .serializers import (
     RatingSerializer,
     RatingCreateSerializer,
     RatingUpdateSerializer,
     UserRatingStatsSerializer,
+    LeaderboardEntrySerializer,
 )
 
 User = get_user_model()
@@ -108,7 +113,7 @@ class RatingDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 class UserRatingStatsView(generics.GenericAPIView):
     """
-    Get rating statistics for a user
+    Get rating statistics for a user (cached; see ratings.stats)
     """
     permission_classes = [permissions.IsAuthenticated]
 
@@ -116,54 +121,48 @@ class UserRatingStatsView(generics.GenericAPIView):
         # If user_id not provided, use current user
         if not user_id:
             user_id = request.user.id
-        else:
-            user_id = user_id
 
-        try:
-            user = User.objects.get(id=user_id)
-        except User.DoesNotExist:
+        data = get_rating_stats([user_id]).get(user_id)
+        if data is None:
             return Response(
                 {'error': 'User not found.'},
                 status=status.HTTP_404_NOT_FOUND
             )
+        return Response(data, status=status.HTTP_200_OK)
 
-        # Calculate ratings as provider
-        provider_ratings = Rating.objects.filter(
-            rated_user=user,
-            rating_type=Rating.RatingType.CLIENT_TO_PROVIDER
-        )
-        provider_stats = provider_ratings.aggregate(
-            average=Avg('score'),
-            count=Count('id')
-        )
 
-        # Calculate ratings as client
-        client_ratings = Rating.objects.filter(
-            rated_user=user,
-            rating_type=Rating.RatingType.PROVIDER_TO_CLIENT
-        )
-        client_stats = client_ratings.aggregate(
-            average=Avg('score'),
-            count=Count('id')
-        )
+class BatchUserRatingStatsView(generics.GenericAPIView):
+    """
+    Rating statistics for up to MAX_BATCH_USERS users: ?user_ids=<uuid>,<uuid>,...
+    Results follow the requested order; unknown ids are omitted.
+    """
+    permission_classes = [permissions.IsAuthenticated]
 
-        # Get user name
-        user_name = user.email
-        if hasattr(user, 'profile') and user.profile:
-            user_name = user.profile.full_name
-
-        data = {
-            'user_id': str(user.id),
-            'user_email': user.email,
-            'user_name': user_name,
-            'average_rating_as_provider': round(provider_stats['average'] or 0, 2),
-            'rating_count_as_provider': provider_stats['count'] or 0,
-            'average_rating_as_client': round(client_stats['average'] or 0, 2),
-            'rating_count_as_client': client_stats['count'] or 0,
-            'total_ratings': (provider_stats['count'] or 0) + (client_stats['count'] or 0),
-        }
+    def get(self, request):
+        raw = [value.strip() for value in request.query_params.get('user_ids', '').split(',') if value.strip()]
+        if not raw:
+            return Response(
+                {'error': 'user_ids is required.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            user_ids = list(dict.fromkeys(uuid.UUID(value) for value in raw))
+        except ValueError:
+            return Response(
+                {'error': 'user_ids must be comma-separated UUIDs.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(user_ids) > MAX_BATCH_USERS:
+            return Response(
+                {'error': f'At most {MAX_BATCH_USERS} user_ids per request.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-        return Response(data, status=status.HTTP_200_OK)
+        stats = get_rating_stats(user_ids)
+        return Response(
+            {'results': [stats[user_id] for user_id in user_ids if user_id in stats]},
+            status=status.HTTP_200_OK
+        )
 
 
 class ProviderRatingsView(generics.ListAPIView):
@@ -194,3 +193,29 @@ class ClientRatingsView(generics.ListAPIView):
             rated_user_id=client_id,
             rating_type=Rating.RatingType.PROVIDER_TO_CLIENT
         ).order_by('-created_at')
+
+
+class ProviderLeaderboardView(generics.ListAPIView):
+    """
+    Top providers for a skill tag (?skill=<uuid>), best reputation first,
+    paged with ?page / ?page_size. Served from Redis sorted sets (see ratings.leaderboard).
+    """
+    serializer_class = LeaderboardEntrySerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        skill = self.request.query_params.get('skill', '').strip()
+        if not skill:
+            raise ValidationError({'skill': 'This query parameter is required.'})
+        try:
+            tag_id = uuid.UUID(skill)
+        except ValueError:
+            raise ValidationError({'skill': f'"{skill}" is not a valid UUID.'})
+        return skill_leaderboard(tag_id)
+
+    def list(self, request, *args, **kwargs):
+        page = self.paginate_queryset(self.get_queryset())
+        first_rank = self.paginator.page.start_index()
+        for rank, document in enumerate(page, start=first_rank):
+            document.rank = rank
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
@@ -2,12 +2,32 @@
 Cache key builders and TTLs for SkillSpot.
 Use with django.core.cache.cache.
 """
+import gzip
 import hashlib
+import math
+import random
+import secrets
+import time
 from urllib.parse import urlencode
 
 # TTLs in seconds
 TAGS_LIST_TIMEOUT = 300   # 5 min – tags change rarely
-JOB_LIST_TIMEOUT = 90    # 1.5 min – browse list changes more often
+JOB_LIST_TIMEOUT = 900   # 15 min – keys are versioned, so writes invalidate immediately
+PROVIDER_PROFILE_TIMEOUT = 600  # 10 min – invalidated by profile/rating signals
+RATING_STATS_TIMEOUT = 600  # 10 min – invalidated by rating/profile signals; bounds drift of the 90-day count
+
+JOB_LIST_VERSION_KEY = "job_list:version"
+TAGS_CATALOG_VERSION_KEY = "tags:catalog_version"
+
+# get_or_compute tuning
+STALE_GRACE = 120         # seconds a stale value may still be served while one worker refreshes
+RECOMPUTE_LOCK_TIMEOUT = 10
+LOCK_WAIT_TIMEOUT = 2.0   # how long a cold-miss request waits for another worker's result
+LOCK_POLL_INTERVAL = 0.05
+EARLY_EXPIRY_BETA = 1.0   # >1 refreshes earlier, <1 later
+
+# Pre-rendered JSON bodies larger than this are stored gzip-compressed
+GZIP_MIN_BYTES = 1024
 
 
 def _sorted_query_dict(request):
@@ -18,11 +38,35 @@ def _sorted_query_dict(request):
     return urlencode(sorted(params.items()))
 
 
+def job_list_version():
+    """Current job list generation. Every job-list key embeds it."""
+    from django.core.cache import cache
+    # Seed with a timestamp so an evicted counter never rolls back to a used value.
+    cache.add(JOB_LIST_VERSION_KEY, int(time.time()), timeout=None)
+    return cache.get(JOB_LIST_VERSION_KEY) or 0
+
+
+def bump_job_list_version():
+    """Invalidate every cached job list at once (call when jobs change)."""
+    from django.core.cache import cache
+    try:
+        cache.incr(JOB_LIST_VERSION_KEY)
+    except ValueError:
+        cache.set(JOB_LIST_VERSION_KEY, int(time.time()), timeout=None)
+
+
 def job_list_cache_key(request):
     """Cache key for paginated job list (browse, not my_jobs)."""
     q = _sorted_query_dict(request)
     h = hashlib.md5(q.encode(), usedforsecurity=False).hexdigest()
-    return f"job_list:{h}"
+    return f"job_list:v{job_list_version()}:{h}"
+
+
+def job_facets_cache_key(request):
+    """Cache key for job browse facet counts; shares the job list version."""
+    q = _sorted_query_dict(request)
+    h = hashlib.md5(q.encode(), usedforsecurity=False).hexdigest()
+    return f"job_facets:v{job_list_version()}:{h}"
 
 
 def tags_list_cache_key(category=None):
@@ -30,11 +74,168 @@ def tags_list_cache_key(category=None):
     return f"tags_list:{category or 'all'}"
 
 
+def tags_catalog_version():
+    """Current tag catalog generation; per-process tag indexes rebuild when it changes."""
+    from django.core.cache import cache
+    cache.add(TAGS_CATALOG_VERSION_KEY, int(time.time()), timeout=None)
+    return cache.get(TAGS_CATALOG_VERSION_KEY) or 0
+
+
 def invalidate_tags_list():
-    """Clear all tags list cache variants (call when tags are created/updated/deleted)."""
+    """Clear all tags list cache variants and bump the catalog version (call when tags change)."""
     from django.core.cache import cache
     for cat in (None, "SKILL", "CERTIFICATION", "LANGUAGE"):
         cache.delete(tags_list_cache_key(cat))
+    try:
+        cache.incr(TAGS_CATALOG_VERSION_KEY)
+    except ValueError:
+        cache.set(TAGS_CATALOG_VERSION_KEY, int(time.time()), timeout=None)
+
+
+def provider_profile_cache_key(user_id):
+    """Cache key for a rendered public provider profile. Tag edits move every key via the catalog version."""
+    return f"provider_profile:v{tags_catalog_version()}:{user_id}"
+
+
+def invalidate_provider_profile(user_id):
+    """Drop the cached public profile of one provider (call when anything it shows changes)."""
+    from django.core.cache import cache
+    cache.delete(provider_profile_cache_key(user_id))
+
+
+def rating_stats_cache_key(user_id):
+    """Cache key for one user's rating summary (see ratings.stats)."""
+    return f"rating_stats:{user_id}"
+
+
+def invalidate_rating_stats(user_id):
+    """Drop the cached rating summary of one user (call on rating or name changes)."""
+    from django.core.cache import cache
+    cache.delete(rating_stats_cache_key(user_id))
+
+
+def _should_refresh(entry, beta=EARLY_EXPIRY_BETA):
+    """
+    Probabilistic early expiry ("XFetch"): refresh a little before expires_at,
+    earlier for values that are slow to compute, so hot keys rarely expire for everyone at once.
+    """
+    gap = entry['delta'] * beta * -math.log(1.0 - random.random())
+    return time.time() + gap >= entry['expires_at']
+
+
+def _compute_and_store(key, compute, timeout):
+    from django.core.cache import cache
+    started = time.time()
+    value = compute()
+    delta = time.time() - started
+    entry = {'value': value, 'expires_at': time.time() + timeout, 'delta': delta}
+    cache.set(key, entry, timeout=timeout + STALE_GRACE)
+    return value
+
+
+# Delete KEYS[1] only if it still holds ARGV[1] (atomic compare-and-delete).
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def _release_lock(lock_key, token):
+    """
+    Release a get_or_compute lock only if it is still ours. If computing took
+    longer than RECOMPUTE_LOCK_TIMEOUT the lock may already belong to another
+    worker, and deleting it would let a third one in.
+    """
+    from django.core.cache import caches
+    from django.core.cache.backends.redis import RedisCache
+    cache = caches['default']
+    if isinstance(cache, RedisCache):
+        # Run the script on the cache's own server; RedisCache stores ints unpickled.
+        key = cache.make_and_validate_key(lock_key)
+        cache._cache.get_client(key, write=True).eval(_RELEASE_LOCK_SCRIPT, 1, key, str(token))
+    elif cache.get(lock_key) == token:
+        cache.delete(lock_key)
+
+
+def get_or_compute(key, compute, timeout):
+    """
+    Return the cached value for key, computing it with compute() when needed.
+
+    - Single flight: only the worker holding a short lock (cache.add) recomputes.
+    - Stale-while-revalidate: others keep serving the previous value for up to
+      STALE_GRACE seconds past timeout instead of hitting the database.
+    - Probabilistic early expiry spreads refreshes out ahead of the deadline.
+    On a cold miss, callers without the lock wait up to LOCK_WAIT_TIMEOUT for the
+    lock holder's result, then fall back to computing it themselves.
+    """
+    from django.core.cache import cache
+    lock_key = f"{key}:lock"
+    entry = cache.get(key)
+
+    if entry is not None and not _should_refresh(entry):
+        return entry['value']
+
+    token = secrets.randbits(62)
+    if cache.add(lock_key, token, timeout=RECOMPUTE_LOCK_TIMEOUT):
+        try:
+            return _compute_and_store(key, compute, timeout)
+        finally:
+            _release_lock(lock_key, token)
+
+    if entry is not None:
+        return entry['value']
+
+    deadline = time.time() + LOCK_WAIT_TIMEOUT
+    while time.time() < deadline:
+        time.sleep(LOCK_POLL_INTERVAL)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry['value']
+        if cache.get(lock_key) is None:
+            break
+    return _compute_and_store(key, compute, timeout)
+
 
+def render_json_entry(data):
+    """
+    Render data to JSON once for caching: {'body', 'etag', 'gzipped'}.
+    The strong ETag is computed over the uncompressed body.
+    """
+    from rest_framework.renderers import JSONRenderer
+    body = JSONRenderer().render(data)
+    etag = '"%s"' % hashlib.sha256(body).hexdigest()[:32]
+    gzipped = len(body) >= GZIP_MIN_BYTES
+    if gzipped:
+        body = gzip.compress(body, mtime=0)
+    return {'body': body, 'etag': etag, 'gzipped': gzipped}
 
 
+def json_entry_response(request, entry):
+    """
+    Serve a render_json_entry() result as raw bytes: 304 when If-None-Match
+    matches, the gzip body as-is when the client accepts it, else decompressed.
+    """
+    from django.http import HttpResponse, HttpResponseNotModified
+    from django.utils.http import parse_etags
+    etag = entry['etag']
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        candidates = parse_etags(if_none_match)
+        if '*' in candidates or etag in candidates:
+            response = HttpResponseNotModified()
+            response['ETag'] = etag
+            response['Vary'] = 'Accept-Encoding'
+            return response
+    body = entry['body']
+    response = HttpResponse(content_type='application/json')
+    if entry['gzipped']:
+        if 'gzip' in request.META.get('HTTP_ACCEPT_ENCODING', ''):
+            response['Content-Encoding'] = 'gzip'
+        else:
+            body = gzip.decompress(body)
+    response.content = body
+    response['ETag'] = etag
+    response['Vary'] = 'Accept-Encoding'
+    return response
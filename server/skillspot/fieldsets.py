@@ -0,0 +1,106 @@
+"""
+Sparse fieldsets: `?fields=a,b` keeps only the named fields, `?omit=c,d` drops them.
+
+SparseFieldsetSerializerMixin trims the serializer output on GET requests.
+SparseFieldsetViewMixin applies the same selection to the queryset: columns
+no kept field reads are deferred, and select_related/prefetch_related paths
+are added only for kept fields. Serializers declare what each field needs in
+Meta:
+
+    sparse_select_related = {'client_name': ('client__profile',)}
+    sparse_prefetch_related = {'required_skills': ('required_skills',)}
+    sparse_field_dependencies = {'completion_percentage': ('total_amount',)}
+    sparse_annotations = {'unread_count': unread_count_annotations}
+
+sparse_prefetch_related entries may be Prefetch objects. sparse_annotations
+values are callables taking the request and returning {alias: expression}.
+
+Unknown field names are ignored. The primary key and relation columns are
+never deferred.
+"""
+from rest_framework import serializers
+
+FIELDS_PARAM = 'fields'
+OMIT_PARAM = 'omit'
+
+
+def _parse_names(value):
+    return {name.strip() for name in (value or '').split(',') if name.strip()}
+
+
+def requested_fieldset(request):
+    """Return (fields, omit) from the query string; fields is None when not given."""
+    if request is None or request.method != 'GET':
+        return None, set()
+    params = request.query_params
+    fields = _parse_names(params.get(FIELDS_PARAM)) if FIELDS_PARAM in params else None
+    return fields, _parse_names(params.get(OMIT_PARAM))
+
+
+class SparseFieldsetSerializerMixin:
+    """Trim top-level output to the requested fieldset. Nested use is left untouched."""
+
+    def get_fields(self):
+        fields = super().get_fields()
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        if parent is not None:
+            return fields
+        keep, omit = requested_fieldset(self.context.get('request'))
+        for name in list(fields):
+            if (keep is not None and name not in keep) or name in omit:
+                fields.pop(name)
+        return fields
+
+
+def sparse_queryset(queryset, serializer):
+    """Defer unused columns and add only the joins/prefetches the kept fields need."""
+    meta = serializer.Meta
+    model = queryset.model
+    select_map = getattr(meta, 'sparse_select_related', {})
+    prefetch_map = getattr(meta, 'sparse_prefetch_related', {})
+    dependencies = getattr(meta, 'sparse_field_dependencies', {})
+    annotation_map = getattr(meta, 'sparse_annotations', {})
+    request = serializer.context.get('request')
+
+    used_columns = {model._meta.pk.name}
+    select_related, prefetch_related, annotations = [], [], {}
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if field.source != '*':
+            used_columns.add(field.source_attrs[0])
+        used_columns.update(dependencies.get(name, ()))
+        select_related.extend(p for p in select_map.get(name, ()) if p not in select_related)
+        prefetch_related.extend(p for p in prefetch_map.get(name, ()) if p not in prefetch_related)
+        if name in annotation_map:
+            annotations.update(annotation_map[name](request))
+
+    deferred = [
+        f.name for f in model._meta.concrete_fields
+        if not f.is_relation and f.name not in used_columns
+    ]
+    if deferred:
+        queryset = queryset.defer(*deferred)
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    if annotations:
+        queryset = queryset.annotate(**annotations)
+    return queryset
+
+
+class SparseFieldsetViewMixin:
+    """
+    For generic views whose read serializer uses SparseFieldsetSerializerMixin.
+    Shapes the filtered GET queryset to the requested fieldset; writes are unaffected.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.request.method != 'GET':
+            return queryset
+        serializer = self.get_serializer_class()(context=self.get_serializer_context())
+        return sparse_queryset(queryset, serializer)
@@ -0,0 +1,63 @@
+import threading
+import time
+import uuid
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from skillspot.cache_utils import get_or_compute
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare plain cache get/set with skillspot.cache_utils.get_or_compute under a '
+        'concurrent cold miss: N threads request the same key while computing it takes '
+        '--compute-ms (a stand-in for a slow list query). Reports how many computes ran.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=30)
+        parser.add_argument('--rounds', type=int, default=3)
+        parser.add_argument('--compute-ms', type=int, default=200)
+
+    def handle(self, *args, **options):
+        for label, fetch in (('plain get/set', self._plain), ('get_or_compute', get_or_compute)):
+            computes, elapsed = self._run(fetch, options)
+            self.stdout.write(
+                f'{label}: {computes} computes for {options["rounds"]} x {options["concurrency"]} '
+                f'cold requests, {elapsed * 1000:.0f} ms'
+            )
+
+    @staticmethod
+    def _plain(key, compute, timeout):
+        value = cache.get(key)
+        if value is None:
+            value = compute()
+            cache.set(key, value, timeout)
+        return value
+
+    def _run(self, fetch, options):
+        delay = options['compute_ms'] / 1000
+        computes = []
+        lock = threading.Lock()
+
+        def compute():
+            with lock:
+                computes.append(1)
+            time.sleep(delay)
+            return 'page'
+
+        started = time.perf_counter()
+        for _ in range(options['rounds']):
+            key = f'benchmark:get_or_compute:{uuid.uuid4().hex}'
+            barrier = threading.Barrier(options['concurrency'])
+
+            def request():
+                barrier.wait()
+                fetch(key, compute, 60)
+
+            threads = [threading.Thread(target=request) for _ in range(options['concurrency'])]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            cache.delete(key)
+        return len(computes), time.perf_counter() - started
@@ -1,27 +1,201 @@
 """
 Custom pagination that allows the client to request page_size via query param.
 Allowed values: 5, 10, 15, 20. Default: 10.
+
+OptionalCursorPagination additionally lets a client opt in to keyset (cursor)
+pagination per request with ?pagination=cursor (first page) or ?cursor=<token>.
+Keyset pages skip COUNT(*) and OFFSET, so deep pages cost the same as the first.
+Requests whose queryset is ordered some other way (relevance, distance, an
+explicit ?ordering=) keep page-number pagination, since a keyset cursor can
+only follow its own ordering.
 """
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+from collections import OrderedDict
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 PAGE_SIZE_CHOICES = (5, 10, 15, 20)
 DEFAULT_PAGE_SIZE = 10
 
 
+def _page_size_from_request(request, param, default):
+    try:
+        size = int(request.query_params.get(param, default))
+    except (TypeError, ValueError):
+        size = default
+    if size in PAGE_SIZE_CHOICES:
+        return size
+    return default
+
+
 class OptionalPageSizePagination(PageNumberPagination):
     page_size = DEFAULT_PAGE_SIZE
     page_size_query_param = 'page_size'
     max_page_size = max(PAGE_SIZE_CHOICES)
 
     def get_page_size(self, request):
+        return _page_size_from_request(request, self.page_size_query_param, self.page_size)
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Keyset pagination over `ordering` (default newest first, id as tie-breaker).
+    The cursor is an opaque token holding the ordering values of the boundary row.
+    Any `ordering` the view applied is replaced by this class's ordering.
+    """
+    ordering = ('-created_at', 'id')
+    page_size = DEFAULT_PAGE_SIZE
+    page_size_query_param = 'page_size'
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = _page_size_from_request(request, self.page_size_query_param, self.page_size)
+
+        values, reverse = self.decode_cursor(request, queryset.model)
+        ordering = self._reversed_ordering() if reverse else list(self.ordering)
+        queryset = queryset.order_by(*ordering)
+        if values is not None:
+            queryset = queryset.filter(self._after(ordering, values))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, values is not None
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self._link(self.page[0], reverse=True)
+
+    def decode_cursor(self, request, model):
+        """Return (values, reverse) from the cursor, values converted to the ordering fields' types."""
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+            values = payload['v']
+            reverse = bool(payload.get('r'))
+        except (TypeError, ValueError, KeyError, UnicodeEncodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
         try:
-            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
-        except (TypeError, ValueError):
-            size = self.page_size
-        if size in PAGE_SIZE_CHOICES:
-            return size
-        return self.page_size
+            values = [
+                model._meta.get_field(field.lstrip('-')).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except (ValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if any(value is None for value in values):
+            raise NotFound(self.invalid_cursor_message)
+        return values, reverse
+
+    def encode_cursor(self, values, reverse):
+        payload = {'v': values}
+        if reverse:
+            payload['r'] = 1
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode('ascii')
+
+    def _link(self, item, reverse):
+        values = []
+        for field in self.ordering:
+            value = getattr(item, field.lstrip('-'))
+            values.append(value.isoformat() if hasattr(value, 'isoformat') else str(value))
+        url = remove_query_param(self.base_url, 'pagination')
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(values, reverse))
+
+    def _reversed_ordering(self):
+        return [f[1:] if f.startswith('-') else f'-{f}' for f in self.ordering]
+
+    @staticmethod
+    def _after(ordering, values):
+        """Q for rows strictly after `values` in `ordering`: (a > x) OR (a = x AND b > y) ..."""
+        condition = Q()
+        equal = Q()
+        for field, value in zip(ordering, values):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+
+class OptionalCursorPagination(OptionalPageSizePagination):
+    """
+    Page-number pagination by default (unchanged for existing clients);
+    keyset pagination when the request has ?pagination=cursor or ?cursor=.
+    """
+    cursor_pagination_class = KeysetCursorPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = None
+        if self.wants_cursor(request) and self.supports_ordering(queryset):
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def wants_cursor(self, request):
+        return (
+            request.query_params.get('pagination') == 'cursor'
+            or bool(request.query_params.get(self.cursor_pagination_class.cursor_query_param))
+        )
+
+    def supports_ordering(self, queryset):
+        """True if the queryset's ordering is a prefix of the keyset ordering."""
+        query = queryset.query
+        ordering = list(query.order_by) or (list(query.get_meta().ordering) if query.default_ordering else [])
+        keyset = list(self.cursor_pagination_class.ordering)
+        return all(isinstance(field, str) for field in ordering) and ordering == keyset[:len(ordering)]
+
 
+class ChronologicalCursorPagination(KeysetCursorPagination):
+    """Keyset pagination oldest first, for chat-style lists."""
+    ordering = ('created_at', 'id')
 
 
+class OptionalChronologicalCursorPagination(OptionalCursorPagination):
+    cursor_pagination_class = ChronologicalCursorPagination
@@ -0,0 +1,57 @@
+"""
+Save only the columns a request actually changed.
+
+Some models keep columns that move only through F()-based UPDATEs (Job's
+application counters, ServiceProviderProfile's rating stats). A plain save() of
+an instance loaded earlier would write those columns back with stale values, so
+update paths that save a loaded instance pass explicit update_fields. The
+helpers here do that for ModelSerializer.update() and the admin change form.
+"""
+from django.contrib import admin
+from django.core.exceptions import FieldDoesNotExist
+
+
+def update_fields_for(instance, names):
+    """Concrete, non-m2m fields among names, plus the model's auto_now fields."""
+    fields = []
+    for name in names:
+        try:
+            field = instance._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+        if field.concrete and not field.many_to_many and not field.primary_key:
+            fields.append(field.name)
+    fields.extend(
+        f.name for f in instance._meta.concrete_fields
+        if getattr(f, 'auto_now', False) and f.name not in fields
+    )
+    return fields
+
+
+class PartialUpdateSerializerMixin:
+    """ModelSerializer mixin: update() writes only the submitted columns."""
+
+    def update(self, instance, validated_data):
+        many_to_many = {}
+        for attr, value in validated_data.items():
+            try:
+                field = instance._meta.get_field(attr)
+            except FieldDoesNotExist:
+                field = None
+            if field is not None and field.many_to_many:
+                many_to_many[attr] = value
+            else:
+                setattr(instance, attr, value)
+        instance.save(update_fields=update_fields_for(instance, validated_data))
+        for attr, value in many_to_many.items():
+            getattr(instance, attr).set(value)
+        return instance
+
+
+class PartialSaveModelAdmin(admin.ModelAdmin):
+    """ModelAdmin whose change form writes only the fields that changed."""
+
+    def save_model(self, request, obj, form, change):
+        if not change:
+            return super().save_model(request, obj, form, change)
+        obj.save(update_fields=update_fields_for(obj, form.changed_data))
@@ -0,0 +1,27 @@
+"""
+Raw Redis access for data structures the Django cache API does not expose
+(sets, sorted sets, hashes). Keys are namespaced with CACHE_KEY_PREFIX.
+get_redis() returns None when REDIS_URL is not a redis:// URL, so callers
+must provide a database fallback.
+"""
+from django.conf import settings
+
+_client = None
+_client_url = None
+
+
+def get_redis():
+    global _client, _client_url
+    url = getattr(settings, 'REDIS_URL', '')
+    # Keyed on the URL so settings overrides (tests) are honoured.
+    if url != _client_url:
+        _client_url = url
+        _client = None
+        if url.startswith(('redis://', 'rediss://')):
+            import redis
+            _client = redis.Redis.from_url(url, decode_responses=True)
+    return _client
+
+
+def redis_key(*parts):
+    return ':'.join([settings.CACHE_KEY_PREFIX, *[str(p) for p in parts]])
@@ -0,0 +1,54 @@
+"""
+Related fields that resolve many primary keys with a single query.
+"""
+from rest_framework import serializers
+from rest_framework.relations import MANY_RELATION_KWARGS
+
+
+class BatchedManyRelatedField(serializers.ManyRelatedField):
+    """ManyRelatedField that hands the whole list to the child for one lookup."""
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+        return self.child_relation.to_internal_value_many(data)
+
+
+class BatchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Drop-in for PrimaryKeyRelatedField(many=True): all submitted ids are fetched
+    with one filter(pk__in=...) on the field's queryset instead of one get() each.
+    Error messages (and the first offending id reported) match the original field;
+    a malformed UUID raises the same Django ValidationError a get(pk=...) would.
+    """
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {'child_relation': cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return BatchedManyRelatedField(**list_kwargs)
+
+    def to_internal_value_many(self, data):
+        queryset = self.get_queryset()
+        pk_field = queryset.model._meta.pk
+        pks = []
+        for item in data:
+            if isinstance(item, bool):
+                self.fail('incorrect_type', data_type=type(item).__name__)
+            if self.pk_field is not None:
+                item = self.pk_field.to_internal_value(item)
+            try:
+                pks.append((item, pk_field.to_python(item)))
+            except (TypeError, ValueError):
+                self.fail('incorrect_type', data_type=type(item).__name__)
+        found = queryset.in_bulk([pk for _, pk in pks]) if pks else {}
+        objects = []
+        for item, pk in pks:
+            if pk not in found:
+                self.fail('does_not_exist', pk_value=item)
+            objects.append(found[pk])
+        return objects
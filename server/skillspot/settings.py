@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 
 import os
 from pathlib import Path
+from celery.schedules import crontab
 from decouple import config, Csv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -74,6 +75,7 @@ INSTALLED_APPS = [
     'payments',
     'ratings',
     'notifications',
+    'skillspot',  # project-wide management commands
 ]
 
 AUTH_USER_MODEL = 'accounts.User'
@@ -211,7 +213,7 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),     # Longer-lived refresh token
     'ROTATE_REFRESH_TOKENS': True,                   # New refresh token on refresh
     'BLACKLIST_AFTER_ROTATION': True,                # Blacklist old refresh tokens
-    'UPDATE_LAST_LOGIN': True,                        # Update last_login field
+    'UPDATE_LAST_LOGIN': False,                       # last_login is buffered by accounts.last_login
     
     'ALGORITHM': 'HS256',                            # Symmetric encryption
     'SIGNING_KEY': SECRET_KEY,                       # Use Django secret key
@@ -299,12 +301,12 @@ CORS_ALLOW_HEADERS = [
 
 CORS_PREFLIGHT_MAX_AGE = 86400
 
-# Redis cache: set REDIS_URL (e.g. redis://localhost:6379/0) to use Redis; otherwise in-memory cache is used.
+# Redis cache: set REDIS_URL (e.g. redis://localhost:6379/0 or rediss://...) to use Redis; otherwise in-memory cache is used.
 REDIS_URL = config('REDIS_URL', default='redis://localhost:6379/0')
 CACHE_KEY_PREFIX = config('CACHE_KEY_PREFIX', default='skillspot')
 CACHE_DEFAULT_TIMEOUT = config('CACHE_DEFAULT_TIMEOUT', default=300, cast=int)  # seconds
 
-if REDIS_URL.startswith('redis://'):
+if REDIS_URL.startswith(('redis://', 'rediss://')):
     CACHES = {
         'default': {
             'BACKEND': 'django.core.cache.backends.redis.RedisCache',
@@ -329,6 +331,16 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    'close-expired-jobs': {
+        'task': 'jobs.tasks.close_expired_jobs',
+        'schedule': crontab(minute=5),  # hourly
+    },
+    'flush-last-logins': {
+        'task': 'accounts.tasks.flush_last_logins',
+        'schedule': crontab(),  # every minute
+    },
+}
 
 # Django Channels (WebSocket)
 ASGI_APPLICATION = 'skillspot.asgi.application'